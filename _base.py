@@ -10,18 +10,34 @@ __license__ = "Apache 2.0 License"
 __copyright__ = "Copyright (c) 2024 Tanner Corcoran"
 
 
+import io
+import os
+import re
+import csv
 import sys
 import enum
+import array
+import bisect
+import hashlib
 import pathlib
+import warnings
 import datetime
+import functools
 import dataclasses
+import collections.abc
 from typing import (
     Any,
     BinaryIO,
     TypeVar,
     Union,
 )
-from collections.abc import Callable
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
 if sys.version_info >= (3, 11):
     from typing import Self
 else:
@@ -30,6 +46,26 @@ else:
 
 _T = TypeVar("_T")
 _E = TypeVar("_E", bound=enum.Enum)
+_U32 = "I" if array.array("I").itemsize == 4 else "L"
+
+# data file header (see `_data_header`)
+_DATA_MAGIC = b"MICS"
+_DATA_VERSION = 2
+# a perfect hash table over the codes follows the entries (no longer
+# written, and skipped when reading)
+_FLAG_MPH = 0x01
+_FLAG_ALIASES = 0x02
+
+# delta files (see `_build.build_delta`)
+_DELTA_MAGIC = b"MICD"
+_DELTA_VERSION = 2
+_DELTA_PUT = 1
+_DELTA_EXPIRE = 2
+_DELTA_ENV = "ISO10383_DELTAS"
+
+# history files (see `_build.build_history`)
+_HISTORY_MAGIC = b"MICH"
+_HISTORY_VERSION = 1
 
 
 class MCC(enum.Enum):
@@ -616,5 +652,680 @@ class MICEntry:
     comments: Union[str, None] = None
 
 
-class MIC(enum.Enum):
-    value: MICEntry
+def _is_expired(entry: MICEntry, as_of: datetime.date) -> bool:
+    """Check whether `entry` is no longer in use as of `as_of`: its status
+    is `Status.expired`, or its expiry date has been reached.
+
+    """
+    return entry.status is Status.expired or (
+        entry.expiry_date is not None and entry.expiry_date <= as_of
+    )
+
+
+def encode_mic(code: Union[str, bytes]) -> int:
+    """Pack a 4-character MIC code into an unsigned 32-bit integer. The
+    code is upper-cased and packed big-endian, so packed codes sort in the
+    same order as the codes themselves.
+
+    """
+    if isinstance(code, str):
+        code = code.encode("ascii")
+    if len(code) != 4:
+        raise ValueError(f"MIC codes must be 4 characters long: {code!r}")
+    return int.from_bytes(code.upper(), "big")
+
+
+def decode_mic(packed: int) -> str:
+    """Unpack an integer produced by `encode_mic` into a MIC code."""
+    return packed.to_bytes(4, "big").decode("ascii")
+
+
+def encode_mics(codes: Iterable[Union[str, bytes]]) -> array.array:
+    """Pack many MIC codes at once into an array of unsigned 32-bit
+    integers.
+
+    """
+    encoded: list[bytes] = [
+        c.encode("ascii") if isinstance(c, str) else c for c in codes
+    ]
+    for code in encoded:
+        if len(code) != 4:
+            raise ValueError(
+                f"MIC codes must be 4 characters long: {code!r}"
+            )
+
+    packed = array.array(_U32)
+    packed.frombytes(b"".join(encoded).upper())
+    if sys.byteorder == "little":
+        packed.byteswap()
+    return packed
+
+
+def decode_mics(packed: Iterable[int]) -> list[str]:
+    """Unpack many integers produced by `encode_mic`/`encode_mics` into MIC
+    codes.
+
+    """
+    packed = array.array(_U32, packed)
+    if sys.byteorder == "little":
+        packed.byteswap()
+    data = packed.tobytes().decode("ascii")
+    return [data[i:i + 4] for i in range(0, len(data), 4)]
+
+
+def _digest(data: bytes) -> bytes:
+    """Content digest of a data file (written to its header)."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _data_header(data: bytes) -> tuple[int, int, bytes, int]:
+    """Parse the header of a data file, returning its format version,
+    feature flags, content digest and the offset of the entries.
+
+    The header is the magic, a 1-byte format version, 1 byte of feature
+    flags and the 16-byte digest of everything after the header. Files
+    written before the header was introduced are reported as version 0,
+    and their digest is computed. Versions 0 and 1 use fixed-size lengths
+    and a flag byte per optional field, version 2 uses varint lengths and
+    a null bitmap per record.
+
+    """
+    if data[:4] != _DATA_MAGIC:
+        return (0, 0, _digest(data), 0)
+    version, flags = data[4], data[5]
+    if version > _DATA_VERSION:
+        raise ValueError(f"Unsupported data format version: {version}")
+    return (version, flags, data[6:22], 22)
+
+
+# comment phrases naming a former name of a MIC
+_ALIAS_RES = (
+    # FORMERLY (KNOWN AS) X, PREVIOUSLY (NAMED) X, FORMER X
+    re.compile(
+        r"\b(?:FORMERLY|FORMER|PREVIOUSLY|PREVISOULY)(?: \(\d{4}\))?"
+        r"(?: KNOWN AS| NAMED)? ([^.,;()\"]+(?:\([^)]*\))?)"
+    ),
+    # X IS RENAMED ..., X HAVE BEEN RENAMED ...
+    re.compile(
+        r"(?:^|\. )([^.,;()\"]+(?:\([^)]*\))?) "
+        r"(?:IS|WAS|HAS BEEN|HAVE BEEN) RENAMED\b"
+    ),
+    # RENAMED FROM "X"
+    re.compile(r"\bRENAMED FROM \"([^\"]+)\""),
+)
+_ALIAS_ACRONYM_RE = re.compile(r"^(.*?)\s*\(([^)]*)\)$")
+
+
+def _alias_key(name: str) -> str:
+    """Normalize a (former) name for alias lookups: upper-cased, with runs
+    of punctuation and whitespace collapsed to single spaces, and without a
+    leading "THE".
+
+    """
+    key = re.sub(r"[^A-Z0-9]+", " ", name.upper()).strip()
+    return key[4:] if key.startswith("THE ") else key
+
+
+def _aliases(entry: MICEntry) -> list[str]:
+    """Extract the (normalized) former names of `entry` from its comments,
+    e.g. "FORMERLY KNOWN AS THE CANADIAN NATIONAL STOCK EXCHANGE (CNSX)"
+    gives "CANADIAN NATIONAL STOCK EXCHANGE" and "CNSX".
+
+    """
+    if not entry.comments:
+        return []
+    names = [
+        match.group(1).strip()
+        for pattern in _ALIAS_RES
+        for match in pattern.finditer(entry.comments)
+    ]
+    if not names:
+        return []
+
+    own = {
+        _alias_key(name)
+        for name in (entry.mic, entry.market_name, entry.acronym)
+        if name
+    }
+    aliases: list[str] = []
+    for name in names:
+        parts = _ALIAS_ACRONYM_RE.match(name)
+        for part in parts.groups() if parts else (name,):
+            key = _alias_key(part)
+            if key and not key.isdigit() and key not in own:
+                if key not in aliases:
+                    aliases.append(key)
+    return aliases
+
+
+class _Deserializer:
+    """Reads data, delta and history files (shared by the build and the
+    runtime).
+
+    """
+    @staticmethod
+    def _o(
+        buf: BinaryIO, deserializer: Callable[..., _T], *args: Any
+    ) -> Union[_T, None]:
+        b = buf.read(1)
+        if b[0]:
+            return deserializer(buf, *args)
+        return None
+
+    @staticmethod
+    def _s(buf: BinaryIO, size: int) -> str:
+        length = int.from_bytes(buf.read(size), "big")
+        encoded = buf.read(length)
+        return encoded.decode("utf-8")
+
+    @staticmethod
+    def _d(buf: BinaryIO) -> datetime.date:
+        # year       : 15
+        # month      : 4
+        # day        : 5
+        data = int.from_bytes(buf.read(3), "big")
+        return datetime.date(
+            year=(data >> 9),
+            month=((data >> 5) & 0xf),
+            day=(data & 0x1f)
+        )
+
+    @staticmethod
+    def _e(buf: BinaryIO, size: int, enum_class: type[_E]) -> _E:
+        e = enum_class._value2member_map_[
+            int.from_bytes(buf.read(size), "big")
+        ]
+        if not isinstance(e, enum_class):
+            raise ValueError(
+                "'_value2member_map_' contains incorrect enum value"
+            )
+        return e
+
+    @staticmethod
+    def _v(buf: BinaryIO) -> int:
+        # unsigned LEB128
+        value = shift = 0
+        while True:
+            b = buf.read(1)[0]
+            value |= (b & 0x7f) << shift
+            if b < 0x80:
+                return value
+            shift += 7
+
+    @classmethod
+    def _sv(cls, buf: BinaryIO) -> str:
+        return buf.read(cls._v(buf)).decode("utf-8")
+
+    @staticmethod
+    def _format_mic(mic: str) -> str:
+        mic = mic.lower()
+        if (
+            mic[0].isdigit()
+            or mic in {"else", "from", "pass", "with"}
+        ):
+            return f"_{mic}"
+        return mic
+
+    @classmethod
+    def deserialize(
+        cls, buf: BinaryIO, existing: dict[str, MICEntry]
+    ) -> tuple[str, MICEntry]:
+        def _m(value: Union[str, None]) -> Union[MICEntry, None]:
+            if value:
+                return existing[value]
+            return None
+
+        entry = MICEntry(
+            mic                     = cls._s(buf, 1),
+            market_name             = cls._s(buf, 1),
+            market_category_code    = cls._e(buf, 1, MCC),
+            creation_date           = cls._d(buf),
+            status                  = cls._e(buf, 1, Status),
+            city                    = cls._o(buf, cls._e, 2, City),
+            operating_mic           = _m(cls._o(buf, cls._s, 1)),
+            institution_description = cls._o(buf, cls._s, 1),
+            legel_entity_name       = cls._o(buf, cls._s, 1),
+            legal_entity_identifier = cls._o(buf, cls._s, 1),
+            acronym                 = cls._o(buf, cls._s, 1),
+            iso_country_code        = cls._o(buf, cls._e, 1, ISOCC),
+            website                 = cls._o(buf, cls._s, 1),
+            last_update_date        = cls._o(buf, cls._d),
+            last_validation_date    = cls._o(buf, cls._d),
+            expiry_date             = cls._o(buf, cls._d),
+            comments                = cls._o(buf, cls._s, 2)
+        )
+
+        return (entry.mic, entry)
+
+    @classmethod
+    def deserialize_v2(
+        cls, buf: BinaryIO, existing: dict[str, MICEntry]
+    ) -> tuple[str, MICEntry]:
+        def _m(value: Union[str, None]) -> Union[MICEntry, None]:
+            if value:
+                return existing[value]
+            return None
+
+        mic = cls._sv(buf)
+        market_name = cls._sv(buf)
+        market_category_code = cls._e(buf, 1, MCC)
+        creation_date = cls._d(buf)
+        status = cls._e(buf, 1, Status)
+
+        # null bitmap, with bit n set if the nth optional field is present
+        present = int.from_bytes(buf.read(2), "big")
+
+        def _p(
+            bit: int, deserializer: Callable[..., _T], *args: Any
+        ) -> Union[_T, None]:
+            if present & (1 << bit):
+                return deserializer(buf, *args)
+            return None
+
+        entry = MICEntry(
+            mic                     = mic,
+            market_name             = market_name,
+            market_category_code    = market_category_code,
+            creation_date           = creation_date,
+            status                  = status,
+            city                    = _p(0, cls._e, 2, City),
+            operating_mic           = _m(_p(1, cls._sv)),
+            institution_description = _p(2, cls._sv),
+            legel_entity_name       = _p(3, cls._sv),
+            legal_entity_identifier = _p(4, cls._sv),
+            acronym                 = _p(5, cls._sv),
+            iso_country_code        = _p(6, cls._e, 1, ISOCC),
+            website                 = _p(7, cls._sv),
+            last_update_date        = _p(8, cls._d),
+            last_validation_date    = _p(9, cls._d),
+            expiry_date             = _p(10, cls._d),
+            comments                = _p(11, cls._sv)
+        )
+
+        return (entry.mic, entry)
+
+    @classmethod
+    def aliases(
+        cls, buf: BinaryIO, codes: Sequence[str]
+    ) -> dict[str, tuple[str, ...]]:
+        # alias table, with entry positions resolved to MIC codes
+        aliases: dict[str, tuple[str, ...]] = dict()
+        for _ in range(cls._v(buf)):
+            alias = cls._sv(buf)
+            aliases[alias] = tuple(
+                codes[cls._v(buf)] for _ in range(cls._v(buf))
+            )
+        return aliases
+
+    @classmethod
+    def apply_ops(
+        cls,
+        buf: BinaryIO,
+        version: int,
+        mics: dict[str, MICEntry],
+        records: Union[dict[str, bytes], None] = None,
+        repoint: bool = True,
+    ) -> list[str]:
+        """Apply the (count-prefixed) operations of a delta to `mics` in
+        place, returning the MICs they added or replaced. Version 1 deltas
+        hold version 1 records, version 2 deltas hold version 2 records.
+        If given, `records` is kept up to date with the serialized records
+        of added and replaced entries, and expired entries are removed from
+        it (their records are not stored).
+
+        Segments of replaced operating MICs are pointed at the new entries
+        (and returned as replaced too), unless `repoint` is false, in which
+        case that is up to the caller.
+
+        """
+        if version == 1:
+            num_ops = int.from_bytes(buf.read(4), "big")
+            deserialize, read_mic = cls.deserialize, lambda: cls._s(buf, 1)
+        else:
+            num_ops = cls._v(buf)
+            deserialize, read_mic = cls.deserialize_v2, lambda: cls._sv(buf)
+
+        changed: list[str] = []
+        replaced = False
+        for _ in range(num_ops):
+            op = buf.read(1)[0]
+            if op == _DELTA_PUT:
+                start = buf.tell()
+                k, v = deserialize(buf, mics)
+                replaced |= k in mics
+                mics[k] = v
+                changed.append(k)
+                if records is not None:
+                    end = buf.tell()
+                    buf.seek(start)
+                    records[k] = buf.read(end - start)
+            elif op == _DELTA_EXPIRE:
+                k = read_mic()
+                mics[k] = dataclasses.replace(
+                    mics[k], status=Status.expired, expiry_date=cls._d(buf)
+                )
+                replaced = True
+                changed.append(k)
+                if records is not None:
+                    records.pop(k, None)
+            else:
+                raise ValueError(f"unknown delta operation {op}")
+
+        # point segments at replaced operating MICs (operating MICs always
+        # come before their segments, so one pass is enough)
+        if replaced and repoint:
+            for k, v in mics.items():
+                if v.operating_mic is not None:
+                    op_mic = mics[v.operating_mic.mic]
+                    if op_mic is not v.operating_mic:
+                        mics[k] = dataclasses.replace(v, operating_mic=op_mic)
+                        changed.append(k)
+
+        return changed
+
+    @classmethod
+    def apply_delta(
+        cls, buf: BinaryIO, base_digest: bytes, mics: dict[str, MICEntry]
+    ) -> Union[dict[str, MICEntry], None]:
+        """Apply a delta file on top of `mics`, returning the patched
+        entries, or `None` if the delta was made against a different base.
+
+        """
+        if buf.read(4) != _DELTA_MAGIC:
+            raise ValueError("not a delta file")
+        version = buf.read(1)[0]
+        if version not in {1, 2}:
+            raise ValueError(f"unsupported delta file version {version}")
+        if buf.read(16) != base_digest:
+            return None
+
+        mics = dict(mics)
+        cls.apply_ops(buf, version, mics)
+        return mics
+
+    # sizes of the fixed-size optional fields of version 2 records, by bit
+    # of the null bitmap (0 for strings)
+    _V2_SIZES = (2, 0, 0, 0, 0, 0, 1, 0, 3, 3, 3, 0)
+
+    @staticmethod
+    def _varint(data: bytes, pos: int) -> tuple[int, int]:
+        # like `_v`, reading from `data` at `pos` (returns the new position)
+        value = shift = 0
+        while True:
+            b = data[pos]
+            pos += 1
+            value |= (b & 0x7f) << shift
+            if b < 0x80:
+                return value, pos
+            shift += 7
+
+    @classmethod
+    def records(cls, encoded: bytes) -> dict[str, bytes]:
+        """Split a version 2 data file into its serialized records, keyed by
+        MIC, without decoding anything but the MICs.
+
+        """
+        version, _, _, offset = _data_header(encoded)
+        if version != 2:
+            raise ValueError(f"expected a version 2 data file, got {version}")
+
+        varint, sizes = cls._varint, cls._V2_SIZES
+        records: dict[str, bytes] = dict()
+        num_entries, pos = varint(encoded, offset)
+        for _ in range(num_entries):
+            start = pos
+            size, pos = varint(encoded, pos)
+            mic = encoded[pos:pos + size].decode("utf-8")
+            size, pos = varint(encoded, pos + size)
+            # market name, then market category code, creation date, status
+            pos += size + 5
+            present = (encoded[pos] << 8) | encoded[pos + 1]
+            pos += 2
+            for bit, size in enumerate(sizes):
+                if present & (1 << bit):
+                    if not size:
+                        size, pos = varint(encoded, pos)
+                    pos += size
+            records[mic] = encoded[start:pos]
+        return records
+
+    @classmethod
+    def read(
+        cls,
+        encoded: bytes,
+        records: Union[dict[str, bytes], None] = None,
+    ) -> tuple[
+        dict[str, MICEntry],
+        bytes,
+        Union[dict[str, tuple[str, ...]], None],
+    ]:
+        """Read a data file, returning its entries (keyed by MIC), its
+        content digest and its alias table (if it has one). The serialized record of every entry is stored in `records`
+        if given.
+
+        """
+        mics: dict[str, MICEntry] = dict()
+        version, flags, digest, offset = _data_header(encoded)
+        with io.BytesIO(encoded) as infile:
+            infile.seek(offset)
+            if version >= 2:
+                num_entries = cls._v(infile)
+                deserialize = cls.deserialize_v2
+            else:
+                num_entries = int.from_bytes(infile.read(2), "big")
+                deserialize = cls.deserialize
+            for _ in range(num_entries):
+                start = infile.tell()
+                k, v = deserialize(infile, mics)
+                mics[k] = v
+                if records is not None:
+                    records[k] = encoded[start:infile.tell()]
+            if not version or flags & _FLAG_MPH:
+                infile.seek(4 * num_entries, io.SEEK_CUR)
+            aliases = None
+            if flags & _FLAG_ALIASES:
+                aliases = cls.aliases(infile, list(mics))
+
+        return (mics, digest, aliases)
+
+
+class Parser:
+    """Parses the MIC sheet
+    (https://www.iso20022.org/market-identifier-codes) into `MICEntry`
+    instances.
+
+    """
+    hyphen_re = re.compile(
+        r"[\u002D\u058A\u05BE\u1400\u1806\u2010-\u2015\u2E17\u2E1A\u2E3A"
+        r"\u2E3B\u2E40\u301C\u3030\u30A0\uFE31\uFE32\uFE58\uFE63\uFF0D]"
+    )
+    ws_re = re.compile(r"\s+")
+
+    @staticmethod
+    def _parse_date(datestr: str) -> datetime.date:
+        return datetime.date(
+            year=int(datestr[:4]),
+            month=int(datestr[4:6]),
+            day=int(datestr[6:])
+        )
+
+    @classmethod
+    def _normalize(cls, value: str) -> str:
+        return re.sub(cls.hyphen_re, "-", re.sub(cls.ws_re, " ", value))
+
+    @staticmethod
+    def _parse_icc(icc: str) -> ISOCC:
+        if icc in {"in", "is"}:
+            icc += "_"
+        return ISOCC[icc]
+
+    @classmethod
+    def _entry(
+        cls, row: Sequence[str], mics: dict[str, MICEntry]
+    ) -> MICEntry:
+        (
+            mic,
+            op_mic,
+            _,
+            mname_and_inst_desc,
+            le_name,
+            le_id,
+            mcc,
+            anym,
+            icc,
+            city,
+            website,
+            status,
+            c_date,
+            lu_date,
+            lv_date,
+            e_date,
+            comments,
+        ) = row
+
+        mname, inst_desc, *_ = (
+            *re.split(r" - ", mname_and_inst_desc, maxsplit=1),
+            None,
+        )
+
+        return MICEntry(
+            mic=mic,
+            market_name=cls._normalize(mname),
+            market_category_code=MCC[mcc.lower()],
+            creation_date=cls._parse_date(c_date),
+            status=Status[status.lower()],
+            city=(
+                # looked up by name (see `City.__new__`)
+                City(cls._normalize(city).title())  # type: ignore[arg-type]
+                if city and city != "N/A" else None
+            ),
+            operating_mic=(
+                mics[op_mic.lower()] if mic != op_mic else None
+            ),
+            institution_description=inst_desc,
+            legel_entity_name=(le_name or None),
+            legal_entity_identifier=(le_id or None),
+            acronym=(anym or None),
+            iso_country_code=(
+                cls._parse_icc(icc.lower()) if icc else None
+            ),
+            website=(website.lower() or None),
+            last_update_date=(
+                cls._parse_date(lu_date) if lu_date else None
+            ),
+            last_validation_date=(
+                cls._parse_date(lv_date) if lv_date else None
+            ),
+            expiry_date=(
+                cls._parse_date(e_date) if e_date else None
+            ),
+            comments=(comments or None)
+        )
+
+    @staticmethod
+    def _order(lines: Sequence[Sequence[str]]) -> list[int]:
+        """Order row indexes so that every operating MIC comes before its
+        segments.
+
+        The order is the one produced by repeatedly sweeping the rows and
+        taking each row whose operating MIC has already been taken: a row
+        is taken in the same sweep as its operating MIC if it comes after
+        it, and in the next sweep otherwise. Sweeps are computed per row
+        (following each chain once), so this is linear in the row count.
+
+        """
+        index: dict[str, int] = dict()
+        for i, line in enumerate(lines):
+            index.setdefault(line[0].lower(), i)
+
+        sweeps: list[int] = [0] * len(lines)
+        for i in range(len(lines)):
+            # walk up to the first row with a known sweep
+            chain: list[int] = []
+            seen: set[int] = set()
+            j = i
+            while not sweeps[j]:
+                mic, op_mic = lines[j][0], lines[j][1]
+                if mic == op_mic:
+                    sweeps[j] = 1
+                    break
+                if j in seen:
+                    raise ValueError(f"Circular operating MIC: {mic!r}")
+                chain.append(j)
+                seen.add(j)
+                if op_mic.lower() not in index:
+                    raise ValueError(
+                        f"Unknown operating MIC {op_mic!r} of {mic!r}"
+                    )
+                j = index[op_mic.lower()]
+
+            # and back down, assigning sweeps
+            for k in reversed(chain):
+                op = index[lines[k][1].lower()]
+                sweeps[k] = sweeps[op] + (op > k)
+
+        buckets: list[list[int]] = [[] for _ in range(max(sweeps, default=0))]
+        for i, sweep in enumerate(sweeps):
+            buckets[sweep - 1].append(i)
+        return [i for bucket in buckets for i in bucket]
+
+    @classmethod
+    def iter_parse(
+        cls, csv_src: Union[str, os.PathLike]
+    ) -> Iterator[MICEntry]:
+        """Parse the rows of `csv_src` as they are read, yielding each entry
+        as soon as its operating MIC has been yielded. Only segment rows
+        whose operating MIC has not been seen yet are buffered, and they
+        are yielded right after it.
+
+        """
+        mics: dict[str, MICEntry] = dict()
+        pending: dict[str, list[list[str]]] = dict()
+
+        with open(csv_src, "r", newline="") as infile:
+            reader = csv.reader(infile)
+            next(reader) # skip header
+
+            for row in reader:
+                if row[0] != row[1] and row[1].lower() not in mics:
+                    pending.setdefault(row[1].lower(), []).append(row)
+                    continue
+
+                ready = [row]
+                while ready:
+                    row = ready.pop()
+                    entry = mics[row[0].lower()] = cls._entry(row, mics)
+                    yield entry
+                    ready.extend(reversed(pending.pop(row[0].lower(), ())))
+
+        if pending:
+            raise ValueError(
+                f"Unknown operating MIC(s): {', '.join(sorted(pending))}"
+            )
+
+    @classmethod
+    def parse(
+        cls, csv_src: Union[str, os.PathLike], stream: bool = False
+    ) -> tuple[MICEntry, ...]:
+        """Parse `csv_src`. By default the whole file is read up front and
+        entries keep the file order as closely as possible; with `stream`,
+        rows are processed as they are read (see `iter_parse`), so only
+        unresolved segment rows are held in memory.
+
+        """
+        if stream:
+            return tuple(
+                {e.mic.lower(): e for e in cls.iter_parse(csv_src)}.values()
+            )
+
+        mics: dict[str, MICEntry] = dict()
+
+        with open(csv_src, "r") as infile:
+            reader = csv.reader(infile.readlines())
+            next(reader) # skip header
+            lines: list[list[str]] = list(reader)
+
+        for i in cls._order(lines):
+            mics[lines[i][0].lower()] = cls._entry(lines[i], mics)
+
+        return tuple(mics.values())
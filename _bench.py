@@ -0,0 +1,222 @@
+"""Copyright 2024 Tanner Corcoran
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+
+You may obtain a copy of the License at
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+
+"""
+
+__author__ = "Tanner Corcoran"
+__license__ = "Apache 2.0 License"
+__copyright__ = "Copyright (c) 2024 Tanner Corcoran"
+
+
+import gc
+import csv
+import time
+import random
+import string
+import pathlib
+import argparse
+import tempfile
+import tracemalloc
+from typing import *
+
+from _base import (
+    MCC,
+    ISOCC,
+    City,
+    Status,
+)
+from _build import (
+    Parser,
+    Serializer,
+    build,
+)
+
+
+_T = TypeVar("_T")
+
+
+HEADER = (
+    "MIC",
+    "OPERATING MIC",
+    "OPRT/SGMT",
+    "MARKET NAME-INSTITUTION DESCRIPTION",
+    "LEGAL ENTITY NAME",
+    "LEI",
+    "MARKET CATEGORY CODE",
+    "ACRONYM",
+    "ISO COUNTRY CODE (ISO 3166)",
+    "CITY",
+    "WEBSITE",
+    "STATUS",
+    "CREATION DATE",
+    "LAST UPDATE DATE",
+    "LAST VALIDATION DATE",
+    "EXPIRY DATE",
+    "COMMENTS",
+)
+
+
+def synthetic_csv(
+    path: pathlib.Path,
+    rows: int,
+    segments: float = 0.75,
+    depth: int = 1,
+    string_size: int = 16,
+    seed: int = 0,
+) -> None:
+    """Write a synthetic ISO 10383 CSV with `rows` rows, a `segments`
+    fraction of which are segment MICs. Segments are spread over `depth`
+    levels, each pointing at a MIC of the level above (depth 1 is what the
+    official file contains). Free-text fields are padded to about
+    `string_size` characters. Rows are shuffled, so many segments come
+    before their operating MIC.
+
+    """
+    rng = random.Random(seed)
+    alphabet = string.ascii_uppercase + string.digits
+    codes = rng.sample(range(len(alphabet) ** 4), rows)
+    mics = [
+        "".join(alphabet[(code // len(alphabet) ** p) % len(alphabet)]
+                for p in range(4))
+        for code in codes
+    ]
+
+    # split the MICs into an operating level and `depth` segment levels
+    num_operating = max(1, int(rows * (1 - segments)))
+    levels = [mics[:num_operating]]
+    num_segments = rows - num_operating
+    for level in range(depth):
+        start = num_operating + num_segments * level // depth
+        end = num_operating + num_segments * (level + 1) // depth
+        levels.append(mics[start:end])
+
+    def text(prefix: str) -> str:
+        return prefix.ljust(string_size, "X")
+
+    cities = [c.value.name.upper() for c in City.__members__.values()]
+    countries = [c.name.rstrip("_").upper() for c in ISOCC]
+    lines = []
+    i = 0
+    for level, level_mics in enumerate(levels):
+        for mic in level_mics:
+            op_mic = mic if not level else rng.choice(levels[level - 1])
+            lines.append((
+                mic,
+                op_mic,
+                "OPRT" if mic == op_mic else "SGMT",
+                f"{text(f'MARKET {mic}')} - {text(f'INSTITUTION {i}')}",
+                text(f"ENTITY {i}"),
+                "".join(rng.choices(alphabet, k=20)),
+                rng.choice(list(MCC)).name.upper(),
+                mic,
+                rng.choice(countries),
+                rng.choice(cities),
+                f"WWW.{mic}.COM",
+                rng.choice(list(Status)).name.upper(),
+                "20050523",
+                "20240101",
+                "",
+                "",
+                text(f"SYNTHETIC ROW {i}."),
+            ))
+            i += 1
+    rng.shuffle(lines)
+
+    with path.open("w", newline="") as outfile:
+        writer = csv.writer(outfile)
+        writer.writerow(HEADER)
+        writer.writerows(lines)
+
+
+def measure(
+    func: Callable[[], _T], memory: bool
+) -> Tuple[_T, float, Union[int, None]]:
+    """Run `func`, returning its result, the elapsed time and (if `memory`)
+    the peak traced memory of a second, traced run.
+
+    """
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+
+    peak = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        func()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return result, elapsed, peak
+
+
+def report(
+    stage: str, rows: int, elapsed: float, peak: Union[int, None]
+) -> None:
+    line = (
+        f"{stage:<10} {rows:>10,} rows: {elapsed:8.3f}s "
+        f"({rows / elapsed:>10,.0f} rows/s)"
+    )
+    if peak is not None:
+        line += f" peak {peak / 2 ** 20:8.1f} MiB"
+    print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the build pipeline on synthetic data"
+    )
+    parser.add_argument(
+        "rows", type=int, nargs="*", default=[25_000, 50_000, 100_000],
+        help="row counts to benchmark",
+    )
+    parser.add_argument("--segments", type=float, default=0.75)
+    parser.add_argument("--depth", type=int, default=1)
+    parser.add_argument("--string-size", type=int, default=16)
+    parser.add_argument("--stream", action="store_true",
+                        help="benchmark the streaming parse mode")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip the (slow) traced peak memory runs")
+    args = parser.parse_args()
+    memory = not args.no_memory
+
+    with tempfile.TemporaryDirectory() as tmp:
+        out = pathlib.Path(tmp)
+        for rows in args.rows:
+            path = out / f"{rows}.csv"
+            synthetic_csv(
+                path, rows, args.segments, args.depth, args.string_size
+            )
+
+            mics, elapsed, peak = measure(
+                lambda: Parser.parse(path, stream=args.stream), memory
+            )
+            report("parse", rows, elapsed, peak)
+
+            _, elapsed, peak = measure(
+                lambda: [Serializer.serialize(e) for e in mics], memory
+            )
+            report("serialize", rows, elapsed, peak)
+
+            _, elapsed, peak = measure(
+                lambda: Serializer.serialize_all(mics), memory
+            )
+            report("bulk", rows, elapsed, peak)
+
+            _, elapsed, peak = measure(lambda: build(mics, out), memory)
+            report("build", rows, elapsed, peak)
+
+
+if __name__ == "__main__":
+    main()
@@ -19,13 +19,20 @@ __license__ = "Apache 2.0 License"
 __copyright__ = "Copyright (c) 2024 Tanner Corcoran"
 
 
-import re
-import csv
+import io
+import os
+import ast
 import sys
-import copy
 import enum
+import json
+import struct
+import sqlite3
 import pathlib
+import argparse
 import datetime
+import contextlib
+import dataclasses
+import concurrent.futures
 from typing import *
 
 from _base import (
@@ -34,122 +41,35 @@ from _base import (
     City,
     Status,
     MICEntry,
+    Parser,
+    _Deserializer,
+    _is_expired,
+    _digest,
+    _data_header,
+    _DATA_MAGIC,
+    _DATA_VERSION,
+    _FLAG_ALIASES,
+    _aliases,
+    _DELTA_MAGIC,
+    _DELTA_VERSION,
+    _DELTA_PUT,
+    _DELTA_EXPIRE,
+    _HISTORY_MAGIC,
+    _HISTORY_VERSION,
 )
 
 
 PD = pathlib.Path(__file__).parent
+OUT = PD / "src" / "iso10383"
+DATA = OUT / "_data"
 _T = TypeVar("_T")
 
 
-class Parser:
-    """Parses the MIC sheet
-    (https://www.iso20022.org/market-identifier-codes) into `MICEntry`
-    instances.
-
-    """
-    hyphen_re = re.compile(
-        r"[\u002D\u058A\u05BE\u1400\u1806\u2010-\u2015\u2E17\u2E1A\u2E3A"
-        r"\u2E3B\u2E40\u301C\u3030\u30A0\uFE31\uFE32\uFE58\uFE63\uFF0D]"
-    )
-    ws_re = re.compile(r"\s+")
-
-    @staticmethod
-    def _parse_date(datestr: str) -> datetime.date:
-        return datetime.date(
-            year=int(datestr[:4]),
-            month=int(datestr[4:6]),
-            day=int(datestr[6:])
-        )
-
-    @classmethod
-    def _normalize(cls, value: str) -> str:
-        return re.sub(cls.hyphen_re, "-", re.sub(cls.ws_re, " ", value))
-
-    @staticmethod
-    def _parse_icc(icc: str) -> ISOCC:
-        if icc in {"in", "is"}:
-            icc += "_"
-        return ISOCC[icc]
-
-    @classmethod
-    def parse(
-        cls, csv_src: pathlib.Path
-    ) -> Tuple[MICEntry, ...]:
-        mics: Dict[str, MICEntry] = dict()
-
-        with csv_src.open("r") as infile:
-            reader = csv.reader(infile.readlines())
-            next(reader) # skip header
-            lines: List[Tuple[str, ...]] = list(reader)
-
-        while lines:
-            for entry in copy.deepcopy(lines):
-                (
-                    mic,
-                    op_mic,
-                    _,
-                    mname_and_inst_desc,
-                    le_name,
-                    le_id,
-                    mcc,
-                    anym,
-                    icc,
-                    city,
-                    website,
-                    status,
-                    c_date,
-                    lu_date,
-                    lv_date,
-                    e_date,
-                    comments,
-                ) = entry
-
-                if mic != op_mic and op_mic.lower() not in mics:
-                    continue
-
-                mname, inst_desc, *_ = (
-                    *re.split(r" - ", mname_and_inst_desc, maxsplit=1),
-                    None,
-                )
-
-                mics[mic.lower()] = MICEntry(
-                    mic=mic,
-                    market_name=cls._normalize(mname),
-                    market_category_code=MCC[mcc.lower()],
-                    creation_date=cls._parse_date(c_date),
-                    status=Status[status.lower()],
-                    city=(
-                        City(cls._normalize(city).title())
-                        if city and city != "N/A" else None
-                    ),
-                    operating_mic=(
-                        mics[op_mic.lower()] if mic != op_mic else None
-                    ),
-                    institution_description=inst_desc,
-                    legel_entity_name=(le_name or None),
-                    legal_entity_identifier=(le_id or None),
-                    acronym=(anym or None),
-                    iso_country_code=(
-                        cls._parse_icc(icc.lower()) if icc else None
-                    ),
-                    website=(website.lower() or None),
-                    last_update_date=(
-                        cls._parse_date(lu_date) if lu_date else None
-                    ),
-                    last_validation_date=(
-                        cls._parse_date(lv_date) if lv_date else None
-                    ),
-                    expiry_date=(
-                        cls._parse_date(e_date) if e_date else None
-                    ),
-                    comments=(comments or None)
-                )
-                lines.remove(entry)
-        
-        return tuple(mics.values())
-
-
 class Serializer:
+    # market category code, creation date, status, null bitmap
+    _fixed = struct.Struct(">B3sBH")
+    _bytes = tuple(bytes((i,)) for i in range(256))
+
     @staticmethod
     def _o(
         value: Union[_T, None], serializer: Callable[..., bytes], *args: Any
@@ -181,8 +101,178 @@ class Serializer:
     def _e(value: enum.Enum, size: int) -> bytes:
         return int(value.value).to_bytes(size, "big")
 
+    @staticmethod
+    def _v(value: int) -> bytes:
+        # unsigned LEB128
+        encoded = bytearray()
+        while value >= 0x80:
+            encoded.append((value & 0x7f) | 0x80)
+            value >>= 7
+        encoded.append(value)
+        return bytes(encoded)
+
+    @classmethod
+    def _sv(cls, value: str) -> bytes:
+        encoded = value.encode("utf-8")
+        return cls._v(len(encoded)) + encoded
+
     @classmethod
     def serialize(cls, e: MICEntry) -> bytes:
+        """Serialize `e` as a version 2 record: required fields, then a
+        2-byte null bitmap, then the optional fields that are present.
+
+        """
+        optional = (
+            (e.city, cls._e, 2),
+            ((e.operating_mic and e.operating_mic.mic), cls._sv),
+            (e.institution_description, cls._sv),
+            (e.legel_entity_name, cls._sv),
+            (e.legal_entity_identifier, cls._sv),
+            (e.acronym, cls._sv),
+            (e.iso_country_code, cls._e, 1),
+            (e.website, cls._sv),
+            (e.last_update_date, cls._d),
+            (e.last_validation_date, cls._d),
+            (e.expiry_date, cls._d),
+            (e.comments, cls._sv),
+        )
+
+        def gen() -> Generator[bytes, None, None]:
+            yield cls._sv(e.mic)
+            yield cls._sv(e.market_name)
+            yield cls._e(e.market_category_code, 1)
+            yield cls._d(e.creation_date)
+            yield cls._e(e.status, 1)
+
+            present = 0
+            for bit, (value, *_) in enumerate(optional):
+                if value is not None:
+                    present |= 1 << bit
+            yield present.to_bytes(2, "big")
+
+            for value, serializer, *args in optional:
+                if value is not None:
+                    yield serializer(value, *args)
+
+        return b"".join(gen())
+
+    @classmethod
+    def serialize_all(cls, mics: Sequence[MICEntry]) -> bytes:
+        """Serialize every entry of `mics` (as `serialize` would) into a
+        single buffer. Encoded strings and dates are cached since many of
+        them repeat, enum ids are read straight from `_value_`, and the
+        fixed-size fields of each record are packed with one struct call.
+
+        """
+        # join sizes the result once and copies every chunk into it
+        return b"".join(cls._chunks(mics)[0])
+
+    @classmethod
+    def serialize_each(cls, mics: Sequence[MICEntry]) -> List[bytes]:
+        """Like `serialize_all`, but returns the record of each entry."""
+        chunks, starts = cls._chunks(mics)
+        starts.append(len(chunks))
+        join = b"".join
+        return [join(chunks[a:b]) for a, b in zip(starts, starts[1:])]
+
+    @classmethod
+    def _chunks(
+        cls, mics: Sequence[MICEntry]
+    ) -> Tuple[List[bytes], List[int]]:
+        # the chunks of the records of `mics`, and the index of the first
+        # chunk of each record
+        small = cls._bytes
+        strings: Dict[str, bytes] = dict()
+        dates: Dict[datetime.date, bytes] = dict()
+
+        def s(value: str) -> bytes:
+            encoded = value.encode("utf-8")
+            length = len(encoded)
+            strings[value] = encoded = (
+                small[length] if length < 0x80 else cls._v(length)
+            ) + encoded
+            return encoded
+
+        def d(value: datetime.date) -> bytes:
+            dates[value] = encoded = cls._d(value)
+            return encoded
+
+        sget = strings.get
+        dget = dates.get
+        pack = cls._fixed.pack
+        chunks: List[bytes] = []
+        add = chunks.append
+        starts: List[int] = []
+        start = starts.append
+
+        for e in mics:
+            start(len(chunks))
+            add(sget(e.mic) or s(e.mic))
+            add(sget(e.market_name) or s(e.market_name))
+            fixed = len(chunks)
+            add(b"")
+
+            present = 0
+            v: Any = e.city
+            if v is not None:
+                present |= 1 << 0
+                add(v._value_.to_bytes(2, "big"))
+            v = e.operating_mic
+            if v is not None:
+                present |= 1 << 1
+                add(sget(v.mic) or s(v.mic))
+            v = e.institution_description
+            if v is not None:
+                present |= 1 << 2
+                add(sget(v) or s(v))
+            v = e.legel_entity_name
+            if v is not None:
+                present |= 1 << 3
+                add(sget(v) or s(v))
+            v = e.legal_entity_identifier
+            if v is not None:
+                present |= 1 << 4
+                add(sget(v) or s(v))
+            v = e.acronym
+            if v is not None:
+                present |= 1 << 5
+                add(sget(v) or s(v))
+            v = e.iso_country_code
+            if v is not None:
+                present |= 1 << 6
+                add(small[v._value_])
+            v = e.website
+            if v is not None:
+                present |= 1 << 7
+                add(sget(v) or s(v))
+            v = e.last_update_date
+            if v is not None:
+                present |= 1 << 8
+                add(dget(v) or d(v))
+            v = e.last_validation_date
+            if v is not None:
+                present |= 1 << 9
+                add(dget(v) or d(v))
+            v = e.expiry_date
+            if v is not None:
+                present |= 1 << 10
+                add(dget(v) or d(v))
+            v = e.comments
+            if v is not None:
+                present |= 1 << 11
+                add(sget(v) or s(v))
+
+            chunks[fixed] = pack(
+                e.market_category_code._value_,
+                dget(e.creation_date) or d(e.creation_date),
+                e.status._value_,
+                present,
+            )
+
+        return chunks, starts
+
+    @classmethod
+    def serialize_v1(cls, e: MICEntry) -> bytes:
         def gen() -> Generator[bytes, None, None]:
             yield cls._s(e.mic, 1)
             yield cls._s(e.market_name, 1)
@@ -204,8 +294,193 @@ class Serializer:
 
         return b"".join(gen())
 
+    @classmethod
+    def expire(cls, mic: str, expiry_date: datetime.date) -> bytes:
+        return cls._sv(mic) + cls._d(expiry_date)
+
+    @classmethod
+    def aliases(cls, mics: Sequence[MICEntry]) -> bytes:
+        """Serialize the alias table (former names extracted from comments,
+        see `_base._aliases`): the number of aliases, then each alias
+        followed by the number and positions of the entries it refers to.
+
+        """
+        table: Dict[str, List[int]] = dict()
+        for i, e in enumerate(mics):
+            for alias in _aliases(e):
+                table.setdefault(alias, []).append(i)
+
+        parts = [cls._v(len(table))]
+        for alias, indexes in table.items():
+            parts.append(cls._sv(alias))
+            parts.append(cls._v(len(indexes)))
+            parts.extend(cls._v(i) for i in indexes)
+        return b"".join(parts)
+
+
+def _records(data: bytes) -> Dict[str, bytes]:
+    """Get the serialized records of a data file, keyed by MIC. Records of
+    older format versions are re-serialized, so they are always in the
+    current format.
+
+    """
+    if _data_header(data)[0] == _DATA_VERSION:
+        return _Deserializer.records(data)
+    mics = _Deserializer.read(data)[0]
+    return {mic: Serializer.serialize(e) for mic, e in mics.items()}
+
+
+class _Decoder(Dict[str, MICEntry]):
+    """Entries decoded from serialized (current format) records on first
+    access, along with their operating MICs.
+
+    """
+    def __init__(self, records: Dict[str, bytes]) -> None:
+        super().__init__()
+        self._records = records
+
+    def __missing__(self, mic: str) -> MICEntry:
+        with io.BytesIO(self._records[mic]) as buf:
+            entry = self[mic] = _Deserializer.deserialize_v2(buf, self)[1]
+        return entry
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, MICEntry):
+        return value.mic
+    if isinstance(value, City):
+        return value.value.name
+    if isinstance(value, ISOCC):
+        return value.name.rstrip("_")
+    if isinstance(value, enum.Enum):
+        return value.name
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    return value
+
+
+def _is_private(name: str) -> bool:
+    return name.startswith("_") and not name.startswith("__")
+
+
+def _stub_function(node: ast.FunctionDef) -> ast.FunctionDef:
+    docstring = ast.get_docstring(node, clean=False)
+    node.body = [ast.Expr(ast.Constant(
+        docstring if docstring is not None else ...
+    ))]
+    return node
+
+
+def _stub_class(node: ast.ClassDef) -> ast.ClassDef:
+    body: List[ast.stmt] = []
+    for child in node.body:
+        if isinstance(child, ast.FunctionDef):
+            if not _is_private(child.name):
+                body.append(_stub_function(child))
+        elif isinstance(child, ast.ClassDef):
+            body.append(_stub_class(child))
+        elif isinstance(child, (ast.Assign, ast.AnnAssign, ast.Expr)):
+            body.append(child)
+    node.body = body or [ast.Expr(ast.Constant(...))]
+    return node
+
+
+def _imported(package: pathlib.Path = OUT) -> Set[str]:
+    """Get the private names that the other modules of the package import
+    from the generated module, which the stub has to keep.
+
+    """
+    names: Set[str] = set()
+    for path in package.glob("*.py"):
+        for node in ast.walk(ast.parse(path.read_text())):
+            if (
+                isinstance(node, ast.ImportFrom)
+                and node.level == 1
+                and node.module == "_iso10383"
+            ):
+                names.update(
+                    alias.name for alias in node.names
+                    if _is_private(alias.name)
+                )
+    return names
+
+
+def _stub(
+    source: str, keep: AbstractSet[str] = frozenset()
+) -> List[ast.stmt]:
+    """Turn module source into stub statements: imports, classes and
+    public functions are kept with their bodies replaced by `...` (or
+    their docstring), annotated public variables lose their values, and
+    everything else (private functions and variables other than type
+    variables and the names in `keep`, module-level code) is dropped.
+    Both branches of `if` statements are stubbed the same way. Private
+    classes are kept for now, see `_prune`.
+
+    """
+    return _stub_body(ast.parse(source).body, keep)
+
+
+def _stub_body(
+    nodes: List[ast.stmt], keep: AbstractSet[str]
+) -> List[ast.stmt]:
+    def private(name: str) -> bool:
+        return _is_private(name) and name not in keep
+
+    body: List[ast.stmt] = []
+    for node in nodes:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            body.append(node)
+        elif isinstance(node, ast.If):
+            node.body = _stub_body(node.body, keep)
+            node.orelse = _stub_body(node.orelse, keep)
+            if node.body or node.orelse:
+                node.body = node.body or [ast.Expr(ast.Constant(...))]
+                body.append(node)
+        elif isinstance(node, ast.ClassDef):
+            body.append(_stub_class(node))
+        elif isinstance(node, ast.FunctionDef):
+            if not private(node.name):
+                body.append(_stub_function(node))
+        elif isinstance(node, ast.AnnAssign):
+            if (
+                isinstance(node.target, ast.Name)
+                and not private(node.target.id)
+            ):
+                node.value = None
+                body.append(node)
+        elif (
+            isinstance(node, ast.Assign)
+            and isinstance(node.value, ast.Call)
+            and isinstance(node.value.func, ast.Name)
+            and node.value.func.id == "TypeVar"
+        ):
+            body.append(node)
+    return body
+
 
-def build(mics: Sequence[MICEntry]) -> None:
+def _prune(
+    body: List[ast.stmt], keep: AbstractSet[str] = frozenset()
+) -> List[ast.stmt]:
+    """Drop private classes that nothing else in the stub (or `keep`)
+    refers to.
+
+    """
+    referenced = set(keep) | {
+        name.id
+        for node in body
+        if not (isinstance(node, ast.ClassDef) and _is_private(node.name))
+        for name in ast.walk(node)
+        if isinstance(name, ast.Name)
+    }
+    return [
+        node for node in body
+        if not isinstance(node, ast.ClassDef)
+        or not _is_private(node.name)
+        or node.name in referenced
+    ]
+
+
+def build_source(mics: Sequence[MICEntry], out: pathlib.Path = OUT) -> None:
     def format_mic(mic: str) -> str:
         mic = mic.lower()
         if (
@@ -215,44 +490,460 @@ def build(mics: Sequence[MICEntry]) -> None:
             return f"_{mic}"
         return mic
 
-    # create the source file
-    with (PD / "src" / "iso10383" / "_iso10383.py").open("w") as outfile:
-        # base file
-        with (PD / "_base.py").open("r") as infile:
-            outfile.write(infile.read().strip())
+    with (PD / "_base.py").open("r") as infile:
+        base = infile.read().strip()
+    with (PD / "_deserializer.txt").open("r") as infile:
+        deserializer = infile.read().strip()
 
-        # enum contents
-        for e in mics:
-            outfile.write(f"\n    {format_mic(e.mic)} = None")
+    # create the source file (the `MIC` enum is built when it is imported)
+    with (out / "_iso10383.py").open("w") as outfile:
+        outfile.write(base)
         outfile.write("\n\n\n")
+        outfile.write(deserializer)
+        outfile.write("\n")
 
-        # deserializer
-        with (PD / "_deserializer.txt").open("r") as infile:
-            outfile.write(infile.read().strip())
+    # create the stub file, which is the only place the members of `MIC`
+    # are spelled out
+    with (out / "_iso10383.pyi").open("w") as outfile:
+        outfile.write("# Generated by _build.py, do not edit.\n\n")
+        previous = None
+        keep = _imported()
+        for node in _prune(
+            [*_stub(base, keep), *_stub(deserializer, keep)], keep
+        ):
+            kind = isinstance(node, (ast.Import, ast.ImportFrom))
+            if previous is not None:
+                outfile.write("\n" if kind and previous else "\n\n")
+            outfile.write(ast.unparse(node))
+            previous = kind
 
-        # final newline
+        outfile.write("\n\n\nclass MIC(enum.Enum):\n    value: MICEntry")
+        for e in mics:
+            outfile.write(f"\n    {format_mic(e.mic)} = ...")
         outfile.write("\n")
 
-    # serialize mics
-    with (PD / "src" / "iso10383" / "_data").open("wb") as outfile:
-        outfile.write(len(mics).to_bytes(2, "big"))
-        for e in mics:
-            outfile.write(Serializer.serialize(e))
 
+def build_data(
+    mics: Sequence[MICEntry],
+    records: Union[Sequence[bytes], None] = None,
+    out: pathlib.Path = OUT,
+) -> None:
+    # serialize mics (unless already serialized)
+    if records is None:
+        records = (Serializer.serialize_all(mics),)
+
+    payload = b"".join((
+        Serializer._v(len(mics)),
+        *records,
+        Serializer.aliases(mics),
+    ))
+
+    with (out / "_data").open("wb") as outfile:
+        outfile.write(_DATA_MAGIC)
+        outfile.write(bytes((_DATA_VERSION, _FLAG_ALIASES)))
+        outfile.write(_digest(payload))
+        outfile.write(payload)
+
+
+def build(mics: Sequence[MICEntry], out: pathlib.Path = OUT) -> None:
+    build_source(mics, out)
+    build_data(mics, out=out)
+
+
+def build_incremental(
+    mics: Sequence[MICEntry],
+    changelog: Union[pathlib.Path, None] = None,
+    out: pathlib.Path = OUT,
+) -> Dict[str, Any]:
+    """Rebuild against the existing `_data`, comparing serialized records
+    directly so that only changed records are decoded (to diff them), and
+    `_data` is only rewritten when a record changed. The source file is
+    always regenerated, since it holds the reader of `_data`. Returns (and optionally writes to `changelog` as JSON) the added,
+    removed, modified and newly expired MICs, with field-level diffs for
+    modified ones.
+
+    """
+    data = (out / "_data").read_bytes()
+    old = _records(data)
+    prev_entries = _Decoder(old)
+    records = Serializer.serialize_each(mics)
+    today = datetime.date.today()
+
+    log: Dict[str, Any] = {
+        "added": [],
+        "removed": sorted(old.keys() - {e.mic for e in mics}),
+        "modified": [],
+        "expired": [],
+    }
+    for e, record in zip(mics, records):
+        prev_record = old.get(e.mic)
+        if prev_record is None:
+            log["added"].append({
+                "mic": e.mic,
+                "fields": {
+                    f.name: _jsonable(getattr(e, f.name))
+                    for f in dataclasses.fields(e)
+                },
+            })
+            if _is_expired(e, today):
+                log["expired"].append(e.mic)
+        elif record != prev_record:
+            prev = prev_entries[e.mic]
+            log["modified"].append({
+                "mic": e.mic,
+                "changes": {
+                    f.name: [
+                        _jsonable(getattr(prev, f.name)),
+                        _jsonable(getattr(e, f.name)),
+                    ]
+                    for f in dataclasses.fields(e)
+                    if _jsonable(getattr(prev, f.name))
+                    != _jsonable(getattr(e, f.name))
+                },
+            })
+            if _is_expired(e, today) and not _is_expired(prev, today):
+                log["expired"].append(e.mic)
+
+    build_source(mics, out)
+    # the data file only changes if a record did (or the order of records,
+    # or the format version)
+    if (
+        list(old.values()) != records
+        or _data_header(data)[0] != _DATA_VERSION
+    ):
+        build_data(mics, records, out)
+
+    if changelog is not None:
+        with changelog.open("w") as outfile:
+            json.dump(log, outfile, indent=2)
+            outfile.write("\n")
+
+    return log
+
+
+def build_delta(mics: Sequence[MICEntry], delta: pathlib.Path) -> int:
+    """Write a delta file that turns the existing `_data` into `mics`
+    without rebuilding the package. Deltas are applied at load time from
+    the paths in the `ISO10383_DELTAS` environment variable. Added and
+    changed records are stored whole, records that only expired (and MICs
+    missing from `mics`) as an expiry. Returns the number of operations.
+
+    """
+    base = DATA.read_bytes()
+    old = _records(base)
+    prev_entries = _Decoder(old)
+
+    ops: List[bytes] = []
+    for e, record in zip(mics, Serializer.serialize_each(mics)):
+        prev_record = old.get(e.mic)
+        if record == prev_record:
+            continue
+
+        prev = None if prev_record is None else prev_entries[e.mic]
+        if (
+            prev is not None
+            and e.status is Status.expired
+            and e.expiry_date is not None
+            and Serializer.serialize(dataclasses.replace(
+                prev, status=e.status, expiry_date=e.expiry_date
+            )) == record
+        ):
+            ops.append(bytes((_DELTA_EXPIRE,))
+                       + Serializer.expire(e.mic, e.expiry_date))
+        else:
+            ops.append(bytes((_DELTA_PUT,)) + record)
+
+    today = datetime.date.today()
+    for mic in old.keys() - {e.mic for e in mics}:
+        if prev_entries[mic].status is not Status.expired:
+            ops.append(bytes((_DELTA_EXPIRE,)) + Serializer.expire(mic, today))
+
+    with delta.open("wb") as outfile:
+        outfile.write(_DELTA_MAGIC)
+        outfile.write(bytes((_DELTA_VERSION,)))
+        outfile.write(_data_header(base)[2])
+        outfile.write(Serializer._v(len(ops)))
+        for op in ops:
+            outfile.write(op)
+
+    return len(ops)
+
+
+_Release = Tuple[datetime.date, bytes]
+
+
+def _read_history(
+    history: pathlib.Path,
+) -> Tuple[List[_Release], Dict[str, MICEntry], Dict[str, bytes]]:
+    # the (date, operations) of every release of `history`, and the latest
+    # entries and their records after replaying them all
+    releases: List[_Release] = []
+    latest: Dict[str, MICEntry] = dict()
+    records: Dict[str, bytes] = dict()
+    if not history.exists():
+        return releases, latest, records
+
+    data = history.read_bytes()
+    if data[:4] != _HISTORY_MAGIC:
+        raise ValueError(f"{history} is not a history file")
+    if data[4] != _HISTORY_VERSION:
+        raise ValueError(f"unsupported history file version {data[4]}")
+
+    buf = io.BytesIO(data)
+    buf.seek(5)
+    for _ in range(_Deserializer._v(buf)):
+        date = _Deserializer._d(buf)
+        size = _Deserializer._v(buf)
+        releases.append((date, data[buf.tell():buf.tell() + size]))
+        _Deserializer.apply_ops(buf, _DELTA_VERSION, latest, records)
+
+    # expired entries have no stored record
+    for mic in latest.keys() - records.keys():
+        records[mic] = Serializer.serialize(latest[mic])
+
+    return releases, latest, records
+
+
+def build_history(
+    mics: Sequence[MICEntry],
+    release: datetime.date,
+    history: pathlib.Path,
+) -> int:
+    """Append `mics` to the history file `history` (created if needed) as
+    the release of `release`, which must be later than every release
+    already in it. Only records that changed since the previous release
+    are stored, and MICs missing from `mics` are stored as an expiry.
+    Returns the number of operations of the new release.
+
+    """
+    releases, latest, latest_records = _read_history(history)
+    if releases and release <= releases[-1][0]:
+        raise ValueError(
+            f"release {release} is not later than the last release "
+            f"({releases[-1][0]})"
+        )
+
+    ops: List[bytes] = []
+    for e, record in zip(mics, Serializer.serialize_each(mics)):
+        if record != latest_records.get(e.mic):
+            ops.append(bytes((_DELTA_PUT,)) + record)
+    for mic in latest.keys() - {e.mic for e in mics}:
+        if latest[mic].status is not Status.expired:
+            ops.append(
+                bytes((_DELTA_EXPIRE,)) + Serializer.expire(mic, release)
+            )
+
+    body = Serializer._v(len(ops)) + b"".join(ops)
+    releases.append((release, body))
+    with history.open("wb") as outfile:
+        outfile.write(_HISTORY_MAGIC)
+        outfile.write(bytes((_HISTORY_VERSION,)))
+        outfile.write(Serializer._v(len(releases)))
+        for date, body in releases:
+            outfile.write(Serializer._d(date))
+            outfile.write(Serializer._v(len(body)))
+            outfile.write(body)
+
+    return len(ops)
+
+
+FIELDS = tuple(f.name for f in dataclasses.fields(MICEntry))
+
+
+def _rows(mics: Sequence[MICEntry]) -> List[Tuple[Any, ...]]:
+    return [
+        tuple(_jsonable(getattr(e, field)) for field in FIELDS)
+        for e in mics
+    ]
+
+
+def write_json(rows: Sequence[Tuple[Any, ...]], path: pathlib.Path) -> None:
+    """Write canonical JSON: a list of objects in data order, with sorted
+    keys and no insignificant whitespace.
+
+    """
+    with path.open("w") as outfile:
+        json.dump(
+            [dict(zip(FIELDS, row)) for row in rows],
+            outfile,
+            sort_keys=True,
+            separators=(",", ":"),
+        )
 
-def main() -> None:
-    if len(sys.argv) != 2:
-        print("Must provide absolute path to ISO_10383 CSV file")
-        return
 
-    # get path
-    path = pathlib.Path(sys.argv[1])
+def write_sqlite(rows: Sequence[Tuple[Any, ...]], path: pathlib.Path) -> None:
+    """Write a SQLite database with a `mic` table (dates as ISO 8601 text,
+    enums by name) indexed on every column commonly filtered on.
+
+    """
+    tmp = path.with_name(f".{path.name}.tmp")
+    tmp.unlink(missing_ok=True)
+    with contextlib.closing(sqlite3.connect(tmp)) as db, db:
+        db.execute(
+            f"CREATE TABLE mic ({', '.join(FIELDS)}, PRIMARY KEY (mic))"
+        )
+        db.executemany(
+            f"INSERT INTO mic VALUES ({', '.join('?' * len(FIELDS))})", rows
+        )
+        for field in (
+            "operating_mic",
+            "market_category_code",
+            "status",
+            "city",
+            "iso_country_code",
+            "expiry_date",
+        ):
+            db.execute(f"CREATE INDEX mic_{field} ON mic ({field})")
+    os.replace(tmp, path)
+
+
+def write_arrow(rows: Sequence[Tuple[Any, ...]], path: pathlib.Path) -> None:
+    """Write an Arrow IPC file (requires `pyarrow`), with dates as
+    `date32` and everything else as strings.
+
+    """
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise RuntimeError("The arrow target requires pyarrow") from None
+
+    dates = {
+        "creation_date",
+        "last_update_date",
+        "last_validation_date",
+        "expiry_date",
+    }
+    columns = list(zip(*rows)) or [()] * len(FIELDS)
+    table = pa.table({
+        field: pa.array(
+            [
+                datetime.date.fromisoformat(v) if v is not None else None
+                for v in column
+            ] if field in dates else column,
+            pa.date32() if field in dates else pa.string(),
+        )
+        for field, column in zip(FIELDS, columns)
+    })
+    with pa.OSFile(str(path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+
+
+TARGETS: Dict[str, Tuple[pathlib.Path, Callable[..., None]]] = {
+    "json": (PD / "iso10383.json", write_json),
+    "sqlite": (PD / "iso10383.sqlite", write_sqlite),
+    "arrow": (PD / "iso10383.arrow", write_arrow),
+}
+
+
+def build_targets(
+    mics: Sequence[MICEntry],
+    targets: Dict[str, pathlib.Path],
+    incremental: bool = False,
+    changelog: Union[pathlib.Path, None] = None,
+) -> None:
+    """Build every target in `targets` (mapping target names to output
+    paths) from the same parsed entries, writing them concurrently. The
+    `data` target is the package itself (`_data` and the generated
+    sources), and its path is the output directory.
+
+    """
+    rows = _rows(mics) if set(targets) - {"data"} else []
+
+    with concurrent.futures.ThreadPoolExecutor() as pool:
+        futures: List[concurrent.futures.Future] = []
+        for name, path in targets.items():
+            if name == "data" and incremental:
+                futures.append(
+                    pool.submit(build_incremental, mics, changelog, path)
+                )
+            elif name == "data":
+                futures.append(pool.submit(build, mics, path))
+            else:
+                futures.append(pool.submit(TARGETS[name][1], rows, path))
+
+        for future in futures:
+            log = future.result()
+            if isinstance(log, dict):
+                print(
+                    f"{len(log['added'])} added, "
+                    f"{len(log['removed'])} removed, "
+                    f"{len(log['modified'])} modified, "
+                    f"{len(log['expired'])} expired"
+                )
+
+
+def _target(value: str) -> Tuple[str, pathlib.Path]:
+    name, _, path = value.partition("=")
+    if name == "data":
+        return (name, pathlib.Path(path) if path else OUT)
+    if name not in TARGETS:
+        raise argparse.ArgumentTypeError(f"unknown target {name!r}")
+    return (name, pathlib.Path(path) if path else TARGETS[name][0])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Build the iso10383 package data from an ISO 10383 CSV"
+    )
+    parser.add_argument(
+        "csv", type=pathlib.Path, help="path to the ISO 10383 CSV file"
+    )
+    parser.add_argument(
+        "--stream", action="store_true",
+        help="parse the CSV row by row (see Parser.iter_parse)",
+    )
+    parser.add_argument(
+        "--incremental", action="store_true",
+        help="only re-serialize records that changed since the last build",
+    )
+    parser.add_argument(
+        "--changelog", type=pathlib.Path, default=None,
+        help="write the change log of an incremental build to this file",
+    )
+    parser.add_argument(
+        "--delta", type=pathlib.Path, default=None,
+        help="write a delta file against the existing data to this file "
+             "(instead of building, unless targets are given)",
+    )
+    parser.add_argument(
+        "--history", type=pathlib.Path, default=None,
+        help="append the CSV as a release to this history file (instead "
+             "of building, unless targets are given)",
+    )
+    parser.add_argument(
+        "--release", type=datetime.date.fromisoformat, default=None,
+        metavar="YYYY-MM-DD",
+        help="date of the release appended with --history (defaults to "
+             "today)",
+    )
+    parser.add_argument(
+        "-t", "--target", type=_target, action="append",
+        metavar="NAME[=PATH]",
+        help="output to build: data (the package, default), json, sqlite "
+             "or arrow; may be given multiple times",
+    )
+    args = parser.parse_args()
+    targets = dict(args.target or (
+        [] if args.delta or args.history else [("data", OUT)]
+    ))
 
     # parse csv
-    mics = Parser.parse(path)
+    mics = Parser.parse(args.csv, stream=args.stream)
+
+    # the delta is made against the existing data, so it goes first
+    if args.delta is not None:
+        num_ops = build_delta(mics, args.delta)
+        print(f"{num_ops} delta operations written to {args.delta}")
+
+    if args.history is not None:
+        release = args.release or datetime.date.today()
+        num_ops = build_history(mics, release, args.history)
+        print(f"{num_ops} changes in the {release} release written to "
+              f"{args.history}")
 
     # build
-    build(mics)
+    build_targets(mics, targets, args.incremental, args.changelog)
 
 
 if __name__ == "__main__":
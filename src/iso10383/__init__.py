@@ -25,7 +25,37 @@ from ._iso10383 import (
     Status,
     MICEntry,
     MIC,
+    MIC_BY_PACKED,
+    data_fingerprint,
+    encode_mic,
+    decode_mic,
+    encode_mics,
+    decode_mics,
+    is_mic,
+    index_of,
+    get_bytes,
+    lookup_bytes,
+    current_equivalent,
+    current_equivalents,
+    MICRegistry,
+    OverlayRegistry,
+    MICSet,
+    as_of,
+    load_data,
+    load_csv,
 )
+from ._stream import (
+    ValidationReport,
+    validate,
+    validate_csv,
+    ENRICH_FIELDS,
+    enrich,
+)
+from ._diff import (
+    RegistryDiff,
+    diff,
+)
+from ._reload import ReloadableRegistry
 
 
 __all__ = (
@@ -35,4 +65,30 @@ __all__ = (
     "Status",
     "MICEntry",
     "MIC",
+    "MIC_BY_PACKED",
+    "data_fingerprint",
+    "encode_mic",
+    "decode_mic",
+    "encode_mics",
+    "decode_mics",
+    "is_mic",
+    "index_of",
+    "get_bytes",
+    "lookup_bytes",
+    "current_equivalent",
+    "current_equivalents",
+    "MICRegistry",
+    "OverlayRegistry",
+    "MICSet",
+    "as_of",
+    "load_data",
+    "load_csv",
+    "ValidationReport",
+    "validate",
+    "validate_csv",
+    "ENRICH_FIELDS",
+    "enrich",
+    "RegistryDiff",
+    "diff",
+    "ReloadableRegistry",
 )
@@ -0,0 +1,115 @@
+"""Structural diffs between two sets of MIC entries.
+
+:copyright: (c) 2024 Tanner Corcoran
+:license: Apache 2.0, see LICENSE for more details.
+
+"""
+
+__author__ = "Tanner Corcoran"
+__license__ = "Apache 2.0 License"
+__copyright__ = "Copyright (c) 2024 Tanner Corcoran"
+
+
+import pathlib
+import operator
+import dataclasses
+from typing import Any, Union
+from collections.abc import Mapping
+from os import PathLike
+
+from ._iso10383 import MICEntry, _Deserializer, _data_header
+
+
+_FIELDS = tuple(f.name for f in dataclasses.fields(MICEntry))
+_OPERATING_MIC = _FIELDS.index("operating_mic")
+_values = operator.attrgetter(*_FIELDS)
+
+
+def _flat(entry: MICEntry) -> tuple[Any, ...]:
+    # field values with the operating MIC as a code, so that comparing two
+    # entries never recurses into their operating MICs
+    values = list(_values(entry))
+    op_mic = values[_OPERATING_MIC]
+    if op_mic is not None:
+        values[_OPERATING_MIC] = op_mic.mic
+    return tuple(values)
+
+
+@dataclasses.dataclass
+class RegistryDiff:
+    """The differences between two sets of MIC entries.
+
+    `added` and `removed` map MIC codes to their entries, and `changed`
+    maps the codes of changed MICs to their changed fields, each as an
+    `(old, new)` pair. Operating MICs are given by code.
+
+    """
+    added: dict[str, MICEntry] = dataclasses.field(default_factory=dict)
+    removed: dict[str, MICEntry] = dataclasses.field(default_factory=dict)
+    changed: dict[str, dict[str, tuple[Any, Any]]] = dataclasses.field(
+        default_factory=dict
+    )
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+_Snapshot = Union[Mapping[str, MICEntry], bytes, str, PathLike]
+
+
+def _read(
+    snapshot: _Snapshot,
+) -> tuple[Mapping[str, MICEntry], Union[dict[str, bytes], None], int]:
+    # entries, records (for data files) and data file version
+    if isinstance(snapshot, Mapping):
+        return snapshot, None, -1
+    if not isinstance(snapshot, bytes):
+        snapshot = pathlib.Path(snapshot).read_bytes()
+    records: dict[str, bytes] = dict()
+    mics = _Deserializer.read(snapshot, records)[0]
+    return mics, records, _data_header(snapshot)[0]
+
+
+def diff(old: _Snapshot, new: _Snapshot) -> RegistryDiff:
+    """Diff two sets of MIC entries, each given as a mapping of MIC codes
+    to entries (such as a `MICRegistry`), or as a data file (its path or
+    contents).
+
+    Unchanged entries are skipped without comparing their fields: data
+    files of the same format version are compared record by record, and
+    entries shared between mappings (as between releases returned by
+    `as_of`) by identity.
+
+    """
+    old_mics, old_records, old_version = _read(old)
+    new_mics, new_records, new_version = _read(new)
+    result = RegistryDiff()
+
+    records = None
+    if old_version == new_version and old_records and new_records:
+        records = (old_records, new_records)
+
+    for code, entry in new_mics.items():
+        prev = old_mics.get(code)
+        if prev is None:
+            result.added[code] = entry
+            continue
+        if prev is entry or (
+            records is not None and records[0][code] == records[1][code]
+        ):
+            continue
+
+        prev_values, values = _flat(prev), _flat(entry)
+        if prev_values == values:
+            continue
+        result.changed[code] = {
+            name: (a, b)
+            for name, a, b in zip(_FIELDS, prev_values, values)
+            if a != b
+        }
+
+    for code, entry in old_mics.items():
+        if code not in new_mics:
+            result.removed[code] = entry
+
+    return result
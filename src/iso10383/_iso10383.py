@@ -10,18 +10,34 @@ __license__ = "Apache 2.0 License"
 __copyright__ = "Copyright (c) 2024 Tanner Corcoran"
 
 
+import io
+import os
+import re
+import csv
 import sys
 import enum
+import array
+import bisect
+import hashlib
 import pathlib
+import warnings
 import datetime
+import functools
 import dataclasses
+import collections.abc
 from typing import (
     Any,
     BinaryIO,
     TypeVar,
     Union,
 )
-from collections.abc import Callable
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
 if sys.version_info >= (3, 11):
     from typing import Self
 else:
@@ -30,6 +46,26 @@ else:
 
 _T = TypeVar("_T")
 _E = TypeVar("_E", bound=enum.Enum)
+_U32 = "I" if array.array("I").itemsize == 4 else "L"
+
+# data file header (see `_data_header`)
+_DATA_MAGIC = b"MICS"
+_DATA_VERSION = 2
+# a perfect hash table over the codes follows the entries (no longer
+# written, and skipped when reading)
+_FLAG_MPH = 0x01
+_FLAG_ALIASES = 0x02
+
+# delta files (see `_build.build_delta`)
+_DELTA_MAGIC = b"MICD"
+_DELTA_VERSION = 2
+_DELTA_PUT = 1
+_DELTA_EXPIRE = 2
+_DELTA_ENV = "ISO10383_DELTAS"
+
+# history files (see `_build.build_history`)
+_HISTORY_MAGIC = b"MICH"
+_HISTORY_VERSION = 1
 
 
 class MCC(enum.Enum):
@@ -616,2744 +652,157 @@ class MICEntry:
     comments: Union[str, None] = None
 
 
-class MIC(enum.Enum):
-    value: MICEntry
-    drsp = None
-    xcnq = None
-    pure = None
-    zodm = None
-    norx = None
-    pose = None
-    pund = None
-    ucbg = None
-    xoch = None
-    bblx = None
-    spbe = None
-    otcm = None
-    frex = None
-    idxm = None
-    mbcp = None
-    ocea = None
-    osds = None
-    ossg = None
-    rr4g = None
-    truk = None
-    ugen = None
-    cnod = None
-    bglu = None
-    gfam = None
-    tmcy = None
-    ubec = None
-    eslo = None
-    iotf = None
-    seba = None
-    ubim = None
-    xubs = None
-    xump = None
-    amlg = None
-    bred = None
-    dbix = None
-    rusx = None
-    ungb = None
-    xlqc = None
-    xmos = None
-    cfic = None
-    hbfr = None
-    klsh = None
-    mudx = None
-    trax = None
-    trnl = None
-    xpet = None
-    levl = None
-    ebxv = None
-    strm = None
-    abnc = None
-    bnpc = None
-    pbgr = None
-    sidx = None
-    sifx = None
-    teur = None
-    ailt = None
-    arax = None
-    cgxs = None
-    midc = None
-    rabl = None
-    rmms = None
-    rmmx = None
-    ceca = None
-    dbdc = None
-    dbse = None
-    dbcx = None
-    dbcr = None
-    jnsi = None
-    xswx = None
-    xdlp = None
-    xswm = None
-    xsls = None
-    xseb = None
-    xbtr = None
-    xvtx = None
-    xqod = None
-    xqmh = None
-    bnpx = None
-    btrl = None
-    ntuk = None
-    eqos = None
-    lmnr = None
-    eqca = None
-    equs = None
-    evol = None
-    stee = None
-    bulk = None
-    rbcc = None
-    bebg = None
-    xtxd = None
-    sswm = None
-    xosl = None
-    merk = None
-    xobd = None
-    bsab = None
-    bspl = None
-    bstx = None
-    xnom = None
-    olbb = None
-    sgmu = None
-    afex = None
-    bnpl = None
-    capl = None
-    ccmx = None
-    msbi = None
-    sgmv = None
-    sgmw = None
-    t212 = None
-    tmex = None
-    xcbo = None
-    cone = None
-    ctwo = None
-    c2ox = None
-    xpom = None
-    clst = None
-    llat = None
-    immh = None
-    aqse = None
-    enms = None
-    fast = None
-    ilcm = None
-    lele = None
-    mcxx = None
-    pepw = None
-    wflb = None
-    wfse = None
-    nbfl = None
-    nexx = None
-    nexg = None
-    nexl = None
-    nexd = None
-    maxd = None
-    btbs = None
-    axsi = None
-    skbb = None
-    bdsk = None
-    dexe = None
-    otpr = None
-    sbij = None
-    xotp = None
-    xbvm = None
-    maqe = None
-    memx = None
-    park = None
-    pipr = None
-    skyx = None
-    glom = None
-    trai = None
-    cboe = None
-    cohr = None
-    stfu = None
-    stfx = None
-    xicb = None
-    xlch = None
-    clch = None
-    buyn = None
-    atdf = None
-    bghx = None
-    csas = None
-    ltse = None
-    xfex = None
-    calh = None
-    omip = None
-    xlis = None
-    dauk = None
-    bslb = None
-    cfil = None
-    rbcm = None
-    thre = None
-    weed = None
-    xwee = None
-    bkkt = None
-    iuob = None
-    xpus = None
-    bmli = None
-    bmlx = None
-    itgl = None
-    xamm = None
-    amnl = None
-    vfgb = None
-    vfuk = None
-    sebl = None
-    viuk = None
-    _24ex = None
-    bbsx = None
-    jlsi = None
-    scot = None
-    spex = None
-    ifad = None
-    jlqd = None
-    lamp = None
-    rcma = None
-    eris = None
-    mktf = None
-    xsgb = None
-    ykna = None
-    csda = None
-    dowm = None
-    gsxc = None
-    gsxk = None
-    gsxt = None
-    vagm = None
-    bmcm = None
-    ewsm = None
-    gxgr = None
-    gxgm = None
-    gxgf = None
-    abfi = None
-    dash = None
-    misx = None
-    bajd = None
-    neoe = None
-    neod = None
-    neon = None
-    neoc = None
-    trpx = None
-    kome = None
-    trcx = None
-    erbx = None
-    iber = None
-    allt = None
-    bilu = None
-    cbsk = None
-    coda = None
-    pdqx = None
-    smbd = None
-    stfl = None
-    xalt = None
-    sage = None
-    arch = None
-    expm = None
-    jpms = None
-    snuk = None
-    arkx = None
-    svxi = None
-    xals = None
-    cgmg = None
-    puma = None
-    _4axe = None
-    ebhu = None
-    euch = None
-    eurm = None
-    eusc = None
-    fnuk = None
-    uchu = None
-    cbnl = None
-    ftus = None
-    bguk = None
-    clve = None
-    cpgx = None
-    cepl = None
-    cepu = None
-    dbab = None
-    otcn = None
-    rtsl = None
-    tral = None
-    tdgf = None
-    ubsb = None
-    ubsd = None
-    ubsl = None
-    bfpt = None
-    conc = None
-    ifbx = None
-    scxo = None
-    scxm = None
-    syfx = None
-    ssil = None
-    manl = None
-    betx = None
-    btlx = None
-    ccex = None
-    aqeu = None
-    aqea = None
-    aqxe = None
-    bkdm = None
-    bnld = None
-    cavd = None
-    gipb = None
-    gspx = None
-    icpm = None
-    imgi = None
-    imrd = None
-    imet = None
-    imgb = None
-    immm = None
-    imfd = None
-    imce = None
-    imed = None
-    jleu = None
-    smff = None
-    sptr = None
-    elxe = None
-    scag = None
-    sgas = None
-    smfe = None
-    trxe = None
-    mhbe = None
-    csgi = None
-    eucc = None
-    brea = None
-    xtxe = None
-    blue = None
-    btam = None
-    cabv = None
-    rfbk = None
-    towr = None
-    bpas = None
-    flwx = None
-    blux = None
-    dblx = None
-    dhlx = None
-    khhu = None
-    mcid = None
-    ncme = None
-    ipnl = None
-    iswp = None
-    iswn = None
-    iswt = None
-    msel = None
-    ncml = None
-    xpuk = None
-    csag = None
-    gsbe = None
-    hreu = None
-    stsi = None
-    crem = None
-    dwfi = None
-    bnpp = None
-    cibh = None
-    csmd = None
-    simd = None
-    gmes = None
-    gmeo = None
-    kbll = None
-    mhbp = None
-    mheu = None
-    ubcz = None
-    atln = None
-    lbcw = None
-    agbp = None
-    ebsn = None
-    eceu = None
-    tpic = None
-    xtrd = None
-    mlex = None
-    mler = None
-    mles = None
-    mlib = None
-    athl = None
-    bcsc = None
-    cfif = None
-    jefe = None
-    mhbl = None
-    nowx = None
-    pkop = None
-    vusa = None
-    vfmi = None
-    aban = None
-    eqie = None
-    eqld = None
-    gpbc = None
-    rtsx = None
-    ohvo = None
-    rbcg = None
-    rmtf = None
-    ucba = None
-    ucde = None
-    ucit = None
-    brga = None
-    xnor = None
-    bcma = None
-    csob = None
-    icur = None
-    ifxc = None
-    ifxa = None
-    ifxr = None
-    musn = None
-    spdx = None
-    nibc = None
-    uice = None
-    xndu = None
-    ecsl = None
-    msax = None
-    msnt = None
-    mseu = None
-    tpis = None
-    brde = None
-    cibc = None
-    cibp = None
-    ftfs = None
-    cabk = None
-    ccrm = None
-    ccxe = None
-    deka = None
-    icot = None
-    issi = None
-    jysi = None
-    nwnv = None
-    otpb = None
-    rbhu = None
-    renc = None
-    tpeu = None
-    wsil = None
-    ingw = None
-    makx = None
-    wsin = None
-    slhb = None
-    sibc = None
-    weln = None
-    bmlb = None
-    welx = None
-    xsat = None
-    baip = None
-    baep = None
-    davy = None
-    imcm = None
-    imcd = None
-    liga = None
-    mbpl = None
-    tpfr = None
-    tepi = None
-    tpmf = None
-    tpsy = None
-    wels = None
-    cbal = None
-    scxa = None
-    siab = None
-    bksk = None
-    cmci = None
-    mhbd = None
-    csot = None
-    muse = None
-    nabe = None
-    abna = None
-    bbie = None
-    erst = None
-    ikbs = None
-    tqex = None
-    tqeb = None
-    tqem = None
-    tqea = None
-    apaw = None
-    nabl = None
-    obkl = None
-    twjp = None
-    hrtf = None
-    smbb = None
-    cgmd = None
-    hemo = None
-    imct = None
-    metz = None
-    mibl = None
-    mubl = None
-    mubm = None
-    mubp = None
-    rbiv = None
-    smbg = None
-    mube = None
-    jpeu = None
-    smbe = None
-    smbp = None
-    leue = None
-    leuf = None
-    hela = None
-    nesi = None
-    bhwa = None
-    isba = None
-    isbv = None
-    kbcb = None
-    maqi = None
-    maqu = None
-    fico = None
-    lbbw = None
-    lbwl = None
-    lbws = None
-    nuro = None
-    xnlx = None
-    nurd = None
-    tpmg = None
-    edga = None
-    edgd = None
-    edgo = None
-    edgx = None
-    bats = None
-    baty = None
-    byxd = None
-    bzxd = None
-    eddp = None
-    bato = None
-    bape = None
-    base = None
-    bcee = None
-    bpko = None
-    btfe = None
-    hrsi = None
-    r5fx = None
-    sisi = None
-    beis = None
-    blbb = None
-    basx = None
-    hrtx = None
-    icas = None
-    incr = None
-    iofb = None
-    ocsi = None
-    edrf = None
-    bnsx = None
-    exse = None
-    tplf = None
-    aixk = None
-    lbcm = None
-    rlbo = None
-    sbex = None
-    vtbc = None
-    zarx = None
-    ipsx = None
-    tpde = None
-    tsfg = None
-    tsff = None
-    comm = None
-    atlb = None
-    ccms = None
-    daiw = None
-    iinx = None
-    opco = None
-    tsbx = None
-    tmxs = None
-    belb = None
-    imtf = None
-    magm = None
-    blxa = None
-    gfks = None
-    sgoe = None
-    ubsa = None
-    ubss = None
-    ibis = None
-    pdqd = None
-    tfsd = None
-    tras = None
-    tsig = None
-    utsl = None
-    bmfx = None
-    cszh = None
-    stal = None
-    xijp = None
-    euwa = None
-    exsy = None
-    a2xx = None
-    fxop = None
-    trde = None
-    nave = None
-    akis = None
-    bpsx = None
-    igdl = None
-    jssi = None
-    sebx = None
-    twgp = None
-    gmgd = None
-    gmgl = None
-    npex = None
-    oapa = None
-    ddtx = None
-    hpcx = None
-    sb1m = None
-    sedr = None
-    ants = None
-    ieng = None
-    sgmx = None
-    ssbi = None
-    dbag = None
-    mkap = None
-    gsal = None
-    gsxh = None
-    sigh = None
-    swee = None
-    swlt = None
-    swlv = None
-    oddo = None
-    odoc = None
-    pulx = None
-    sant = None
-    ubin = None
-    cslb = None
-    jisi = None
-    jefs = None
-    vwdx = None
-    vtls = None
-    bamx = None
-    sebs = None
-    xabc = None
-    gfic = None
-    kelr = None
-    mlxn = None
-    mlax = None
-    xbox = None
-    nord = None
-    otxb = None
-    semx = None
-    aaca = None
-    absi = None
-    binv = None
-    glmx = None
-    gtxe = None
-    jpcb = None
-    nlbx = None
-    rosr = None
-    xrot = None
-    xllb = None
-    xvpb = None
-    hbpl = None
-    xabg = None
-    alsi = None
-    sbsi = None
-    tdbl = None
-    bnpa = None
-    bnpf = None
-    bnps = None
-    iceo = None
-    iofi = None
-    iofx = None
-    iogb = None
-    iocd = None
-    ioed = None
-    iogi = None
-    ioir = None
-    iomm = None
-    iswa = None
-    nwms = None
-    rbce = None
-    xsga = None
-    kblm = None
-    kotf = None
-    lasp = None
-    tdon = None
-    tsaf = None
-    ubis = None
-    xiel = None
-    xoaa = None
-    bana = None
-    boal = None
-    csec = None
-    mlix = None
-    mlrq = None
-    svex = None
-    sves = None
-    aapa = None
-    cimd = None
-    curx = None
-    sksi = None
-    squa = None
-    ssbt = None
-    ssfx = None
-    afsa = None
-    afsi = None
-    aria = None
-    dvfx = None
-    etpa = None
-    loui = None
-    rabo = None
-    bbva = None
-    btnl = None
-    capi = None
-    xrcb = None
-    apex = None
-    tgat = None
-    xgrm = None
-    nysi = None
-    xmal = None
-    casi = None
-    cnsi = None
-    xosa = None
-    cceu = None
-    xtxm = None
-    gfsm = None
-    gfso = None
-    aurb = None
-    iswr = None
-    iswc = None
-    iswb = None
-    vagl = None
-    bcsl = None
-    bcsi = None
-    gfib = None
-    gfif = None
-    gfin = None
-    gfir = None
-    ingb = None
-    sfcl = None
-    sunb = None
-    tpsl = None
-    tsmr = None
-    vont = None
-    bkbr = None
-    bkbf = None
-    cbka = None
-    tpes = None
-    tpso = None
-    cbkd = None
-    cbkf = None
-    cbke = None
-    cbkg = None
-    cgml = None
-    cptx = None
-    maql = None
-    dzbk = None
-    xpos = None
-    tpel = None
-    tefd = None
-    temf = None
-    temi = None
-    tird = None
-    temb = None
-    temr = None
-    tpeo = None
-    tegb = None
-    tomg = None
-    tepf = None
-    twhk = None
-    twjt = None
-    twsg = None
-    wood = None
-    xrfq = None
-    xpac = None
-    loyd = None
-    scxf = None
-    bofs = None
-    sunt = None
-    swbi = None
-    wbkp = None
-    bgsi = None
-    bplc = None
-    bbsi = None
-    lssi = None
-    biva = None
-    bkln = None
-    bklf = None
-    fisu = None
-    jbsi = None
-    napa = None
-    potc = None
-    ppex = None
-    baad = None
-    inve = None
-    emch = None
-    vola = None
-    xdnb = None
-    ifls = None
-    exot = None
-    hsxe = None
-    anzl = None
-    echo = None
-    fbsi = None
-    hsbc = None
-    hsbt = None
-    natx = None
-    stan = None
-    vcmo = None
-    advt = None
-    csin = None
-    cssi = None
-    dowg = None
-    ampx = None
-    fxgb = None
-    tomx = None
-    trsi = None
-    btee = None
-    ebsm = None
-    ebss = None
-    rbcb = None
-    rbct = None
-    gsib = None
-    bisi = None
-    hudx = None
-    imcs = None
-    ubsy = None
-    xdub = None
-    xatl = None
-    bilt = None
-    mufp = None
-    vfil = None
-    vfsi = None
-    vfxo = None
-    ccml = None
-    cftw = None
-    dapa = None
-    vlex = None
-    _3579 = None
-    mhip = None
-    wins = None
-    winx = None
-    enxl = None
-    alxl = None
-    masg = None
-    tcml = None
-    frte = None
-    them = None
-    ledg = None
-    muti = None
-    ndcm = None
-    ndex = None
-    spec = None
-    bcrm = None
-    bark = None
-    mtus = None
-    gotc = None
-    mfxc = None
-    mfxr = None
-    mfxa = None
-    snsi = None
-    vert = None
-    apxl = None
-    cltd = None
-    drct = None
-    mtxx = None
-    cave = None
-    otcb = None
-    pinl = None
-    pini = None
-    pinx = None
-    otcq = None
-    psgm = None
-    pinc = None
-    xeee = None
-    mtso = None
-    mtsc = None
-    eluk = None
-    elno = None
-    _else = None
-    eleu = None
-    frei = None
-    nosi = None
-    xbdv = None
-    difx = None
-    autx = None
-    autp = None
-    nexs = None
-    virt = None
-    balt = None
-    bltx = None
-    cgma = None
-    cgmh = None
-    cgmi = None
-    lqfi = None
-    cgmx = None
-    citx = None
-    citd = None
-    lqed = None
-    mtxa = None
-    ptpg = None
-    ufex = None
-    tsad = None
-    xisl = None
-    xkar = None
-    xlah = None
-    xlgt = None
-    peel = None
-    xphx = None
-    caze = None
-    jpbx = None
-    jpsi = None
-    jsef = None
-    arex = None
-    csau = None
-    cfau = None
-    cseu = None
-    cscf = None
-    cshk = None
-    cfhk = None
-    csjp = None
-    cfjp = None
-    edge = None
-    ficx = None
-    gbot = None
-    grif = None
-    ibgh = None
-    iexg = None
-    lmec = None
-    nexo = None
-    nmrj = None
-    nxjp = None
-    nxvw = None
-    parx = None
-    elix = None
-    trdx = None
-    xbel = None
-    xblb = None
-    xmun = None
-    xnxc = None
-    xves = None
-    xhon = None
-    icus = None
-    itsm = None
-    jata = None
-    kmts = None
-    xsur = None
-    mtsp = None
-    xasm = None
-    xiex = None
-    xjkt = None
-    mtax = None
-    xbmk = None
-    xbmf = None
-    iceu = None
-    xa1x = None
-    nome = None
-    xbsp = None
-    necd = None
-    fxmt = None
-    atsa = None
-    xsic = None
-    xtlx = None
-    xlof = None
-    xmic = None
-    qmts = None
-    xeus = None
-    xnyf = None
-    bamp = None
-    xedx = None
-    xtar = None
-    urce = None
-    xfnx = None
-    csfb = None
-    xhce = None
-    xher = None
-    crdl = None
-    baik = None
-    umts = None
-    xpin = None
-    xrtr = None
-    xplu = None
-    xrov = None
-    damp = None
-    xljs = None
-    xrms = None
-    _360t = None
-    aats = None
-    acex = None
-    afdl = None
-    afet = None
-    afse = None
-    aixe = None
-    aqst = None
-    aqsl = None
-    aqsn = None
-    aqsg = None
-    aqsf = None
-    aqsd = None
-    aqua = None
-    asex = None
-    xipo = None
-    euax = None
-    awbx = None
-    awex = None
-    bace = None
-    baml = None
-    bapa = None
-    bapx = None
-    barx = None
-    bard = None
-    bbsf = None
-    bcfs = None
-    xmvl = None
-    bcmm = None
-    bcse = None
-    bcxe = None
-    lisx = None
-    chix = None
-    beam = None
-    beex = None
-    betp = None
-    bfex = None
-    bgcf = None
-    bgcd = None
-    fncs = None
-    bgci = None
-    bhsf = None
-    bids = None
-    blev = None
-    blpx = None
-    bpol = None
-    bltd = None
-    bmex = None
-    sbil = None
-    sbar = None
-    xval = None
-    xbar = None
-    xlat = None
-    xmef = None
-    xmpw = None
-    xmrv = None
-    bmtf = None
-    bnyc = None
-    boat = None
-    bosc = None
-    bova = None
-    bovm = None
-    brix = None
-    brnx = None
-    bsex = None
-    btec = None
-    bvca = None
-    xcar = None
-    bvmf = None
-    bvur = None
-    cand = None
-    canx = None
-    cmap = None
-    cats = None
-    ccfe = None
-    ccfx = None
-    cclx = None
-    cco2 = None
-    cded = None
-    cdel = None
-    cdsl = None
-    fxsw = None
-    ceti = None
-    cgit = None
-    cgnd = None
-    cgeb = None
-    cgqt = None
-    cgcm = None
-    cggd = None
-    chev = None
-    blnk = None
-    chia = None
-    chic = None
-    chie = None
-    chij = None
-    kaix = None
-    chis = None
-    chiv = None
-    clau = None
-    clhk = None
-    cljp = None
-    clmx = None
-    clph = None
-    cmee = None
-    cmet = None
-    cmmt = None
-    cmsf = None
-    coal = None
-    comg = None
-    cotc = None
-    cred = None
-    caes = None
-    cryd = None
-    cryp = None
-    cryx = None
-    cssx = None
-    dasi = None
-    dbhk = None
-    dbox = None
-    dbsx = None
-    dcsx = None
-    deal = None
-    dgcx = None
-    dktc = None
-    dots = None
-    dsmd = None
-    dumx = None
-    ecag = None
-    ecgs = None
-    ecal = None
-    ecxe = None
-    eeal = None
-    eese = None
-    eftp = None
-    egmt = None
-    egsi = None
-    embx = None
-    emid = None
-    emir = None
-    emdr = None
-    encl = None
-    eotc = None
-    epex = None
-    etsc = None
-    exeu = None
-    excp = None
-    exbo = None
-    exdc = None
-    extr = None
-    fair = None
-    fgex = None
-    finr = None
-    finy = None
-    ootc = None
-    fish = None
-    fltb = None
-    fmts = None
-    frrf = None
-    fsef = None
-    fshx = None
-    fxal = None
-    fxcm = None
-    g1xx = None
-    gemx = None
-    getb = None
-    gfia = None
-    xgfi = None
-    gfim = None
-    gllc = None
-    glps = None
-    glpx = None
-    gmeg = None
-    xgsx = None
-    gmex = None
-    gmtf = None
-    govx = None
-    gree = None
-    grse = None
-    gsci = None
-    gsco = None
-    gsef = None
-    gsil = None
-    gssi = None
-    gsxl = None
-    gtco = None
-    gtsx = None
-    gtxs = None
-    gxma = None
-    hchc = None
-    hdat = None
-    hegx = None
-    hkme = None
-    hmtf = None
-    hrfq = None
-    hppo = None
-    hsfx = None
-    hstc = None
-    xhnx = None
-    hsxa = None
-    hupx = None
-    ibal = None
-    ibex = None
-    icap = None
-    plsx = None
-    icdx = None
-    icel = None
-    icxl = None
-    ifca = None
-    ifeu = None
-    ifut = None
-    ifsg = None
-    ifus = None
-    iepa = None
-    imcg = None
-    imir = None
-    imcr = None
-    imen = None
-    ices = None
-    imag = None
-    imbd = None
-    imex = None
-    isda = None
-    isex = None
-    itgi = None
-    ivzx = None
-    ixsp = None
-    jadx = None
-    jefx = None
-    jnst = None
-    jpmi = None
-    jpmx = None
-    jses = None
-    jsjx = None
-    kabu = None
-    kccp = None
-    kdpw = None
-    kleu = None
-    knig = None
-    knem = None
-    knli = None
-    kncm = None
-    kocn = None
-    krme = None
-    lasf = None
-    lava = None
-    lafd = None
-    lchc = None
-    lica = None
-    liqu = None
-    liqf = None
-    lius = None
-    liuh = None
-    lifi = None
-    lmax = None
-    lotc = None
-    pldx = None
-    lppm = None
-    ltaa = None
-    lxjp = None
-    mael = None
-    mxlm = None
-    malx = None
-    mxnl = None
-    maqh = None
-    maqj = None
-    maqx = None
-    matn = None
-    matx = None
-    mbul = None
-    mcur = None
-    mdip = None
-    meau = None
-    mehk = None
-    mfgl = None
-    mibg = None
-    mihi = None
-    xmio = None
-    mizx = None
-    mlve = None
-    mleu = None
-    msal = None
-    msco = None
-    mstx = None
-    mslp = None
-    msip = None
-    msms = None
-    bvus = None
-    mtsb = None
-    mtxs = None
-    mtxc = None
-    mtxm = None
-    mytr = None
-    n2ex = None
-    namx = None
-    nasb = None
-    nasx = None
-    nblx = None
-    nbot = None
-    ncel = None
-    nfsc = None
-    ngxc = None
-    nilx = None
-    nlpx = None
-    nmce = None
-    nmra = None
-    icsh = None
-    icsz = None
-    ickr = None
-    ichk = None
-    nxse = None
-    ictw = None
-    nncs = None
-    nodx = None
-    noff = None
-    nops = None
-    nosc = None
-    notc = None
-    npga = None
-    nsxb = None
-    nxeu = None
-    nxus = None
-    nymx = None
-    nypc = None
-    ofex = None
-    ollc = None
-    omel = None
-    omga = None
-    lynx = None
-    omic = None
-    opex = None
-    opra = None
-    oslc = None
-    otce = None
-    otcx = None
-    pave = None
-    pdex = None
-    pfts = None
-    pftq = None
-    pieu = None
-    pipe = None
-    pirm = None
-    pmts = None
-    prse = None
-    pvmf = None
-    pxil = None
-    qmtf = None
-    qwix = None
-    rbsx = None
-    ricx = None
-    ricd = None
-    roco = None
-    rofx = None
-    rotc = None
-    rpdx = None
-    rsex = None
-    rtsp = None
-    s3fm = None
-    secc = None
-    secd = None
-    sece = None
-    secf = None
-    sedc = None
-    selc = None
-    sepe = None
-    sgex = None
-    sgma = None
-    shar = None
-    shaw = None
-    shad = None
-    siga = None
-    sigj = None
-    sigx = None
-    simv = None
-    slxt = None
-    smex = None
-    soho = None
-    spim = None
-    sprz = None
-    spxe = None
-    ssex = None
-    sstx = None
-    stox = None
-    xscu = None
-    xstx = None
-    swap = None
-    sxsi = None
-    tera = None
-    tfex = None
-    tfsa = None
-    tfsu = None
-    tfsv = None
-    tlab = None
-    tmid = None
-    tocp = None
-    tpie = None
-    tpim = None
-    tpse = None
-    tpsv = None
-    trck = None
-    tfss = None
-    dbvx = None
-    tfsc = None
-    oilx = None
-    tcme = None
-    tfse = None
-    treu = None
-    trqx = None
-    trqd = None
-    trux = None
-    trwb = None
-    twsf = None
-    dwsf = None
-    trfx = None
-    tsef = None
-    tweu = None
-    twem = None
-    twea = None
-    tweo = None
-    ubsp = None
-    ubsg = None
-    ubsf = None
-    ubst = None
-    ubsx = None
-    ukex = None
-    ukpx = None
-    ultx = None
-    vega = None
-    vfcm = None
-    vmfx = None
-    wsag = None
-    xabj = None
-    xace = None
-    xads = None
-    xaex = None
-    xafr = None
-    xafx = None
-    xalb = None
-    xalg = None
-    xams = None
-    xeui = None
-    tnla = None
-    xhft = None
-    xeue = None
-    xant = None
-    xaom = None
-    xapi = None
-    xaqs = None
-    xarc = None
-    xarm = None
-    xasx = None
-    asxt = None
-    asxb = None
-    asxv = None
-    asxp = None
-    xsfe = None
-    xats = None
-    xauk = None
-    xazx = None
-    xbaa = None
-    xbab = None
-    bajm = None
-    xbah = None
-    xban = None
-    xbav = None
-    xbbf = None
-    xbbj = None
-    xbbk = None
-    xbcc = None
-    mvcx = None
-    xbce = None
-    xbcl = None
-    xbcm = None
-    xbcx = None
-    xbcv = None
-    xbda = None
-    xber = None
-    zobx = None
-    eqta = None
-    eqtb = None
-    eqtc = None
-    eqtd = None
-    xeqt = None
-    xbey = None
-    xbfo = None
-    xbkk = None
-    xbkf = None
-    xbln = None
-    xbnv = None
-    xbog = None
-    xbol = None
-    xbom = None
-    bsme = None
-    xbot = None
-    botv = None
-    xbra = None
-    xbre = None
-    xbrm = None
-    xbrn = None
-    xbru = None
-    xbrd = None
-    xbrv = None
-    xbse = None
-    xbsd = None
-    xbtf = None
-    xbud = None
-    xtnd = None
-    xbue = None
-    xmev = None
-    xbul = None
-    abul = None
-    xbvc = None
-    xbvp = None
-    xbvr = None
-    xcai = None
-    xcal = None
-    xcas = None
-    xcay = None
-    cbsx = None
-    xcbf = None
-    xcbt = None
-    fcbt = None
-    xkbt = None
-    xcce = None
-    xccx = None
-    xcde = None
-    xcet = None
-    xcfe = None
-    xcff = None
-    xcgs = None
-    xchg = None
-    xcie = None
-    xcme = None
-    glbx = None
-    xiom = None
-    cmes = None
-    cbts = None
-    nyms = None
-    cecs = None
-    xcnf = None
-    xcol = None
-    xcor = None
-    xcrc = None
-    xcro = None
-    xcsc = None
-    xcse = None
-    mndk = None
-    fndk = None
-    dndk = None
-    mcse = None
-    xfnd = None
-    xcsx = None
-    xcue = None
-    xcur = None
-    xcxd = None
-    xcys = None
-    xecm = None
-    xdar = None
-    xdce = None
-    xdes = None
-    xdfb = None
-    xdfm = None
-    xdha = None
-    xdpa = None
-    xdse = None
-    xdsx = None
-    xdtb = None
-    xdus = None
-    xqtx = None
-    xdwz = None
-    xebi = None
-    xecb = None
-    xecc = None
-    xecs = None
-    xelx = None
-    xemd = None
-    xems = None
-    xeti = None
-    xetc = None
-    xetr = None
-    xetb = None
-    xeta = None
-    xeup = None
-    xeur = None
-    xfcm = None
-    xffe = None
-    xfka = None
-    xfmn = None
-    xfom = None
-    xfra = None
-    xdbv = None
-    fraa = None
-    frad = None
-    frab = None
-    xdbx = None
-    xnew = None
-    xfta = None
-    xgas = None
-    xgcl = None
-    xgha = None
-    xgme = None
-    xgmx = None
-    xgse = None
-    xgtg = None
-    xgua = None
-    xham = None
-    hamm = None
-    haml = None
-    hamn = None
-    xhan = None
-    xhel = None
-    dhel = None
-    mhel = None
-    xhir = None
-    xhkf = None
-    xhkg = None
-    shsc = None
-    szsc = None
-    xgem = None
-    xiab = None
-    xibe = None
-    xice = None
-    dnis = None
-    isec = None
-    dice = None
-    mnis = None
-    xicx = None
-    xidx = None
-    xihk = None
-    xima = None
-    ximc = None
-    xime = None
-    xins = None
-    icbx = None
-    mocx = None
-    xinv = None
-    xipe = None
-    xiqs = None
-    xist = None
-    xeqy = None
-    xisx = None
-    xjam = None
-    xjnb = None
-    xjpx = None
-    xosj = None
-    xjse = None
-    altx = None
-    xsaf = None
-    xsfa = None
-    yldx = None
-    xjwy = None
-    xkac = None
-    xkaz = None
-    xkce = None
-    xkfb = None
-    xkgt = None
-    xkha = None
-    xkhr = None
-    xkie = None
-    xkis = None
-    xkkt = None
-    xkls = None
-    mesq = None
-    xkor = None
-    xkrx = None
-    xkfe = None
-    xkos = None
-    xkcm = None
-    xkem = None
-    xkse = None
-    xkst = None
-    xkuw = None
-    xkyo = None
-    xlao = None
-    xlbm = None
-    xlce = None
-    xldn = None
-    xlif = None
-    xlfx = None
-    xlim = None
-    mfox = None
-    wqxl = None
-    xlit = None
-    xlju = None
-    xlme = None
-    xlon = None
-    xlsm = None
-    xlto = None
-    xlus = None
-    xlux = None
-    emtf = None
-    xmab = None
-    xmac = None
-    xmae = None
-    pros = None
-    xman = None
-    xmap = None
-    xmau = None
-    xmdg = None
-    xmds = None
-    xmer = None
-    xmex = None
-    xmge = None
-    xmid = None
-    xmif = None
-    xmil = None
-    mivx = None
-    xaim = None
-    xdmi = None
-    macx = None
-    mtaa = None
-    xmlx = None
-    xmnt = None
-    xmnx = None
-    xmoc = None
-    xmod = None
-    xmol = None
-    xmoo = None
-    xmsw = None
-    xmtb = None
-    xmts = None
-    nmts = None
-    plus = None
-    xmus = None
-    xnaf = None
-    xnai = None
-    xnam = None
-    xnas = None
-    xndq = None
-    xngs = None
-    xncm = None
-    xnim = None
-    xbos = None
-    bosd = None
-    xbxo = None
-    xpor = None
-    xpsx = None
-    xbrt = None
-    psxd = None
-    xpbt = None
-    xpho = None
-    xphl = None
-    xncd = None
-    xnec = None
-    xnee = None
-    xnep = None
-    xngm = None
-    nmtf = None
-    xngo = None
-    xnii = None
-    xnks = None
-    xnql = None
-    xnsa = None
-    xnse = None
-    xnst = None
-    xnyc = None
-    xnym = None
-    xcec = None
-    xnye = None
-    xnyl = None
-    xnys = None
-    xase = None
-    xnli = None
-    nysd = None
-    amxo = None
-    arcd = None
-    arco = None
-    xnze = None
-    xode = None
-    xoff = None
-    xome = None
-    burg = None
-    merd = None
-    xoam = None
-    burm = None
-    xosc = None
-    xoad = None
-    xosd = None
-    nibr = None
-    xosm = None
-    xost = None
-    xotb = None
-    xotc = None
-    xpae = None
-    xpar = None
-    xmat = None
-    xmon = None
-    xphs = None
-    xpic = None
-    xpow = None
-    xpra = None
-    xprm = None
-    strt = None
-    spad = None
-    xpri = None
-    xpse = None
-    xpst = None
-    xpty = None
-    xpxe = None
-    xqui = None
-    xrbm = None
-    xrio = None
-    xris = None
-    fnlv = None
-    xrmz = None
-    xros = None
-    xrox = None
-    xtuc = None
-    xrpm = None
-    xrus = None
-    xsam = None
-    xsap = None
-    xsau = None
-    xsco = None
-    xsef = None
-    xses = None
-    xsim = None
-    xsce = None
-    xsge = None
-    xsgo = None
-    xshe = None
-    xshg = None
-    xsib = None
-    xsme = None
-    xsom = None
-    xsop = None
-    xsps = None
-    xsrm = None
-    xsse = None
-    xstc = None
-    xste = None
-    xsto = None
-    dsto = None
-    xstu = None
-    euwx = None
-    xsva = None
-    xswa = None
-    xswb = None
-    xswo = None
-    xtad = None
-    xtae = None
-    xtaf = None
-    xtai = None
-    xtal = None
-    fnee = None
-    xteh = None
-    xtfe = None
-    xtff = None
-    xtfn = None
-    xtir = None
-    xtka = None
-    xtko = None
-    xtkt = None
-    xtoe = None
-    xtra = None
-    xtrn = None
-    xtrz = None
-    xtse = None
-    xtsx = None
-    xtnx = None
-    xtun = None
-    xtup = None
-    tpsd = None
-    tpre = None
-    tpeq = None
-    xtpe = None
-    tben = None
-    xtur = None
-    xuax = None
-    xuga = None
-    xukr = None
-    xula = None
-    xuni = None
-    xuse = None
-    xvar = None
-    xvla = None
-    xvpa = None
-    xvse = None
-    xwar = None
-    plpo = None
-    plps = None
-    wblc = None
-    wbcl = None
-    wbon = None
-    wmtf = None
-    wder = None
-    wcde = None
-    poee = None
-    wgas = None
-    plpx = None
-    xwbo = None
-    wbah = None
-    wbdm = None
-    xvie = None
-    xxsc = None
-    xxxx = None
-    xyie = None
-    xykt = None
-    xzag = None
-    xzce = None
-    xzim = None
-    zkbx = None
-    kmux = None
-    ukca = None
-    asef = None
-    memm = None
-    xebs = None
-    nspo = None
-    otci = None
-    gfox = None
-    fnft = None
-    hgsp = None
-    term = None
-    patf = None
-    bbvx = None
-    odxe = None
-    hpsx = None
-    dbdx = None
-    emce = None
-    hpso = None
-    artx = None
-    sptx = None
-    tsir = None
-    stxs = None
-    eufn = None
-    tsfx = None
-    gfau = None
-    cse2 = None
-    xigg = None
-    smbc = None
-    fnxb = None
-    bgca = None
-    aqxd = None
-    xftx = None
-    nabp = None
-    usob = None
-    btun = None
-    ecnl = None
-    rits = None
-    fxsm = None
-    fxnm = None
-    mswp = None
-    cast = None
-    xabx = None
-    trbx = None
-    cilh = None
-    uswp = None
-    cbae = None
-    trdc = None
-    usef = None
-    nssa = None
-    cmcm = None
-    eblx = None
-    erfq = None
-    entw = None
-    fusd = None
-    xete = None
-    xetx = None
-    sfox = None
-    bjse = None
-    neeq = None
-    vfex = None
-    msdm = None
-    lneq = None
-    lnfi = None
-    ibsi = None
-    raja = None
-    lpsf = None
-    gbsi = None
-    tpid = None
-    ingu = None
-    sisu = None
-    sewb = None
-    dkwb = None
-    nowb = None
-    seob = None
-    dkob = None
-    euob = None
-    gbob = None
-    noob = None
-    otxt = None
-    mxop = None
-    bocf = None
-    fpwb = None
-    spax = None
-    lebv = None
-    lesi = None
-    bgem = None
-    jleq = None
-    gmge = None
-    iexc = None
-    intl = None
-    brmf = None
-    cxab = None
-    cxai = None
-    tmuk = None
-    xcbd = None
-    u360 = None
-    bdpl = None
-    vmex = None
-    inft = None
-    edxm = None
-    ibkr = None
-    algo = None
-    xand = None
-    fnds = None
-    iffx = None
-    qunt = None
-    gslo = None
-    rtxf = None
-    arda = None
-    vuba = None
-    g360 = None
-    acxl = None
-    acxc = None
-    ximx = None
-    atad = None
-    gsxn = None
-    rule = None
-    msxb = None
-    xcvd = None
-    mslc = None
-    xanm = None
-    cfim = None
-    msxo = None
-    xatx = None
-    adrk = None
-    rfim = None
-    bnds = None
-    sphr = None
-    afts = None
-    tmeu = None
-    nxfo = None
-    tpda = None
-    tict = None
-    xbry = None
-    xmme = None
-    gsxm = None
-    ntrl = None
-    scle = None
-    nxbx = None
-    accx = None
-    potl = None
-    npms = None
-    lbul = None
-    m2ae = None
-    rrsi = None
-    octl = None
-    bxda = None
-    bgcj = None
-    lmas = None
-    gfsg = None
-    bgsg = None
-    eesx = None
-    bnph = None
-    spdk = None
-    spno = None
-    spfi = None
-    speu = None
-    d2xg = None
-    optx = None
-    phsi = None
-    _360x = None
-    etor = None
-    vwap = None
-    xwap = None
-    itsl = None
-    jpjx = None
-    jefa = None
-    odst = None
-    rvsa = None
-    dwin = None
-    rfqu = None
-    rfqs = None
-    rfqn = None
-    dpar = None
-    dbru = None
-    dlis = None
-    dams = None
-    ddub = None
-    dosl = None
-    dmil = None
-    cbms = None
-    xggi = None
-    octc = None
-    icps = None
-    mssa = None
-    vams = None
-    ibco = None
-    hwhe = None
-    xema = None
-    xemi = None
-    xemb = None
-    bbsn = None
-    sclb = None
-    sfmp = None
-    iexa = None
-    d2xc = None
-    rbcs = None
-    lake = None
-    nzxc = None
-    nzxm = None
-    _21xx = None
-    xans = None
-    tpsb = None
-    tdxs = None
-    dmad = None
-    wflp = None
-    xacd = None
-    hane = None
-    hand = None
-    hanc = None
-    xgai = None
-    bpag = None
-    nxte = None
-    pvbl = None
-    wbma = None
-    synk = None
-    tpsg = None
-    fmxs = None
-    xcts = None
-    stuh = None
-    ocfx = None
-    ocxl = None
-    ocxe = None
-    pgtp = None
-    oyld = None
-    gsbs = None
-    xmti = None
-    xnrg = None
-    alpx = None
-    bpxx = None
-    ctdd = None
-    ctcc = None
-    ctss = None
-    fgml = None
-    xjax = None
-    nzxd = None
-    peur = None
-    phel = None
-    pcse = None
-    psto = None
-    pfse = None
-    mepx = None
-    bfsd = None
-    opmx = None
-    ivwp = None
-    onex = None
-    onep = None
-    gtsm = None
-    wmfs = None
-    gara = None
-    besa = None
-    wmsw = None
-    obge = None
-    wmus = None
-    wtrs = None
-    lakx = None
-    srpt = None
-    brae = None
-    crbx = None
-    cxae = None
-    iswq = None
-    moon = None
-    opsi = None
-    crsx = None
-    liqh = None
-    em3s = None
-    otco = None
-    xmfe = None
-    _3dxe = None
-    boss = None
-    cdna = None
-    fnfx = None
-    nzfx = None
-    bacr = None
-    stuf = None
-    xstp = None
-    stue = None
-    hcer = None
-    gmbg = None
-    xglo = None
-    wind = None
-    fnix = None
-    latg = None
-    ensl = None
-    dbmo = None
-    dbln = None
-    abxx = None
-    fxrs = None
-    fxps = None
-    xbis = None
-    tpee = None
-    eqoc = None
-    eqod = None
-    aqed = None
-    eixe = None
-    hpcs = None
-    noco = None
-    mabx = None
-    hpco = None
-    icor = None
-    tper = None
-    xsdx = None
-    cedx = None
-    cbks = None
-    xoas = None
-    sga2 = None
-    ewrm = None
-    bbok = None
-    blfx = None
-    onec = None
-    mbsi = None
-    pepq = None
-    pepy = None
-    peph = None
-    pepm = None
-    grow = None
-    eprd = None
-    gspl = None
-    tlcm = None
-    memd = None
-    ebso = None
-    vndm = None
-    wabr = None
-    xsca = None
-    tmcc = None
-    edbt = None
-    edgl = None
-    etlx = None
-    basp = None
-    bteq = None
-    eqse = None
-    vabd = None
-    imcc = None
-    next = None
-    nexn = None
-    nexf = None
-    xndx = None
-    xnmr = None
-    sbiu = None
-    xsbi = None
-    sbiv = None
-    eqsl = None
-    jser = None
-    hesp = None
-    hede = None
-    pjcx = None
-    cima = None
-    xzam = None
-    cgee = None
-    cgec = None
-    cgme = None
-    cgmc = None
-    nexy = None
-    trqs = None
-    core = None
-    cicx = None
-    malm = None
-    xpsf = None
-    xpot = None
-    cslp = None
-    cgmu = None
-    cscl = None
-    csvw = None
-    ukre = None
-    ukor = None
-    tuob = None
-    bmls = None
-    bmsi = None
-    sgmz = None
-    pfxd = None
-    trqc = None
-    gsbx = None
-    beta = None
-    xpol = None
-    xpal = None
-    aspi = None
-    asmt = None
-    aspn = None
-    cisd = None
-    cdsi = None
-    resf = None
-    ebsf = None
-    xdex = None
-    dowe = None
-    wopo = None
-    iebs = None
-    mkaa = None
-    cget = None
-    xeub = None
-    nsme = None
-    beup = None
-    beuf = None
-    ceud = None
-    beud = None
-    ceux = None
-    ceuo = None
-    beue = None
-    xbnd = None
-    blkx = None
-    plpd = None
-    nmsx = None
-    xlod = None
-    lafx = None
-    fltr = None
-    bate = None
-    batf = None
-    batd = None
-    btqe = None
-    btqg = None
-    ebra = None
-    xcan = None
-    xrmo = None
-    xnco = None
-    knmx = None
-    tnlk = None
-    xdrk = None
-    vdrk = None
-    gfpo = None
-    pumx = None
-    vwda = None
-    bgfu = None
-    mczk = None
-    hung = None
-    emts = None
-    mtsa = None
-    gmts = None
-    mtsg = None
-    imts = None
-    rmts = None
-    amts = None
-    port = None
-    slkk = None
-    vmts = None
-    smts = None
-    ebsi = None
-    rese = None
-    ebsd = None
-    eusp = None
-    xmfx = None
-    trfw = None
-    teeg = None
-    nlax = None
-    ubse = None
-    ubsi = None
-    wbgf = None
-    xetv = None
-    xetw = None
-    xetu = None
-    frav = None
-    fraw = None
-    frau = None
-    ipxw = None
-    zero = None
-    scxs = None
-    tpir = None
-    xchi = None
-    xcis = None
-    celp = None
-    zbul = None
-    imsb = None
-    aqxa = None
-    jbul = None
-    bleq = None
-    mcad = None
-    ebmx = None
-    enxb = None
-    xmsm = None
-    xesm = None
-    ukgd = None
-    gbul = None
-    tnll = None
-    trqm = None
-    xblk = None
-    iswo = None
-    fxrq = None
-    fxfm = None
-    pbul = None
-    xetf = None
-    gsei = None
-    cbkc = None
-    kblc = None
-    kbls = None
-    kblt = None
-    xets = None
-    fras = None
-    ceue = None
-    valx = None
-    cesi = None
-    tpio = None
-    dsme = None
-    fsme = None
-    xnfi = None
-    espd = None
-    ssme = None
-    jesi = None
-    vcrs = None
-    brds = None
-    xnxd = None
-    icxr = None
-    mesi = None
-    gbwb = None
-    mscx = None
-    brdl = None
-    ftfm = None
-    baru = None
-    beuo = None
-    beut = None
-    capa = None
-    lisz = None
-    iats = None
-    ipxp = None
-    bgfx = None
-    bgfi = None
-    iece = None
-    temg = None
-    teof = None
-    tomf = None
-    tepg = None
-    tepx = None
-    tepr = None
-    tepm = None
-    tsuk = None
-    tsmc = None
-    tsmg = None
-    tsmi = None
-    tsmb = None
-    icen = None
-    nabu = None
-    naba = None
-    bbis = None
-    exyy = None
-    exsf = None
-    exsp = None
-    exsd = None
-    exsb = None
-    exsh = None
-    trqb = None
-    finn = None
-    xfci = None
-    xfda = None
-    mtsm = None
-    temc = None
-    zfxm = None
-    bliq = None
-    bsfx = None
-    bdea = None
-    blbs = None
-    msrp = None
-    mssi = None
-    melo = None
-    cblc = None
-    cioi = None
-    xehq = None
-    mose = None
-    dose = None
-    ibeq = None
-    emld = None
-    belf = None
-    asxc = None
-    cfbc = None
-    sbmf = None
-    bmfm = None
-    bmfa = None
-    jasr = None
-    xmce = None
-    bond = None
-    tfsg = None
-    tcds = None
-    zapa = None
-    iswe = None
-    iswv = None
-    hpcv = None
-    sgmy = None
-    ssbm = None
-    dbes = None
-    teco = None
-    xzap = None
-    vtps = None
-    imco = None
-    ensx = None
-    inca = None
-    ssob = None
-    xapa = None
-    rest = None
-    xrep = None
-    lmao = None
-    lmae = None
-    lmaf = None
-    apcl = None
-    sedx = None
-    cmed = None
-    iecl = None
-    mdrv = None
-    iidx = None
-    iblx = None
-    rcbx = None
-    ifsm = None
-    mtss = None
-    mtsw = None
-    anlp = None
-    macb = None
-    brfq = None
-    bntw = None
-    blox = None
-    iotc = None
-    basi = None
-    mlsi = None
-    cimv = None
-    cimb = None
-    cime = None
-    inge = None
-    ingf = None
-    afso = None
-    afsx = None
-    afsl = None
-    xgat = None
-    tgsi = None
-    cgmt = None
-    trqa = None
-    auro = None
-    bgcm = None
-    exsi = None
-    sunm = None
-    tscb = None
-    bgco = None
-    gfbm = None
-    gfbo = None
-    suno = None
-    tsre = None
-    tscd = None
-    tsgb = None
-    tsfi = None
-    tsed = None
-    tsgi = None
-    tsmm = None
-    tere = None
-    tefx = None
-    temm = None
-    tegi = None
-    teir = None
-    jseb = None
-    esto = None
-    onse = None
-    xsmp = None
-    ebsx = None
-    bmea = None
-    ebsc = None
-    aimx = None
-    xlom = None
-    sics = None
-    tomd = None
-    rbsi = None
-    rtsi = None
-    mund = None
-    munc = None
-    wipo = None
-    iexd = None
-    xeye = None
-    xhnf = None
-    xsbt = None
-    ensy = None
-    alxb = None
-    mlxb = None
-    xmli = None
-    alxp = None
-    sgmt = None
-    mtsd = None
-    mtsf = None
-    isdx = None
-    imeq = None
-    ndxs = None
-    alxa = None
-    etfp = None
-    bart = None
-    baro = None
-    bmts = None
-    ibul = None
-    xeer = None
-    xeeo = None
-    prme = None
-    csbx = None
-    cxot = None
-    dked = None
-    dkfi = None
-    noed = None
-    seed = None
-    pned = None
-    uswb = None
-    nofi = None
-    fied = None
-    ebon = None
-    euwb = None
-    trea = None
-    treo = None
-    autb = None
-    cxrt = None
-    ackf = None
-    grio = None
-    xstf = None
-    stuc = None
-    stud = None
-    xceg = None
-    xrsp = None
-    hotc = None
-    xade = None
-    enax = None
-    xath = None
-    blbf = None
-    xmot = None
-    motx = None
-    munb = None
-    muna = None
-    xopv = None
-    xvia = None
-    xwce = None
-    nasn = None
-    xeas = None
-    ceto = None
-    expa = None
-    nbxo = None
-    thrd = None
-    xtaa = None
-    vrxp = None
-    mlco = None
-    mlvx = None
-    bcdx = None
-    barl = None
-    chiy = None
-    chio = None
-    batp = None
-    chid = None
-    botc = None
-    bgcb = None
-    send = None
-    xdrf = None
-    marf = None
-    bmcl = None
-    merf = None
-    xbil = None
-    xmad = None
-    vtex = None
-    nyfx = None
-    icsu = None
-    astr = None
-    fxcl = None
-    cgqd = None
-    cgdb = None
-    cgtr = None
-    cxar = None
-    cxac = None
-    cxap = None
-    cxam = None
-    cxaq = None
-    cxav = None
-    cxaf = None
-    cxan = None
-    cxaw = None
-    xcx2 = None
-    cmec = None
-    auto = None
-    emib = None
-    exor = None
-    exvp = None
-    exmp = None
-    exlp = None
-    exgm = None
-    xeda = None
-    xeid = None
-    xadf = None
-    finc = None
-    fino = None
-    xgdx = None
-    xldx = None
-    xgcx = None
-    hmod = None
-    wclk = None
-    icah = None
-    icse = None
-    ictq = None
-    iflx = None
-    ifll = None
-    ifen = None
-    iflo = None
-    imfx = None
-    ifed = None
-    vkab = None
-    lafl = None
-    lcur = None
-    lmad = None
-    lmnx = None
-    mcxr = None
-    mcxs = None
-    eprl = None
-    mprl = None
-    mspl = None
-    mstc = None
-    nfsd = None
-    xstm = None
-    nfsa = None
-    xqlx = None
-    xstv = None
-    tru2 = None
-    tru1 = None
-    bndd = None
-    ubsc = None
-    xeuc = None
-    bera = None
-    berb = None
-    berc = None
-    xmai = None
-    bote = None
-    eqwb = None
-    vpxb = None
-    tnlb = None
-    xras = None
-    fcme = None
-    ximm = None
-    dcse = None
-    xcyo = None
-    dusa = None
-    dusb = None
-    dusc = None
-    dusd = None
-    xetd = None
-    xert = None
-    xere = None
-    xeum = None
-    xdbc = None
-    hama = None
-    hamb = None
-    hanb = None
-    hana = None
-    mnfi = None
-    fnfi = None
-    dnfi = None
-    fnis = None
-    mice = None
-    icro = None
-    xpms = None
-    xfno = None
-    xdsm = None
-    xise = None
-    gmni = None
-    xtpz = None
-    mcry = None
-    xisa = None
-    xtk1 = None
-    xjas = None
-    xtks = None
-    xose = None
-    xtam = None
-    xtk3 = None
-    xtk2 = None
-    xbes = None
-    xkon = None
-    fnlt = None
-    xljm = None
-    mtah = None
-    atfx = None
-    cmts = None
-    tmts = None
-    lmts = None
-    eacm = None
-    bvuk = None
-    nasd = None
-    xnms = None
-    inse = None
-    aldp = None
-    arcx = None
-    xspm = None
-    mtch = None
-    xsc2 = None
-    xsc3 = None
-    xsc1 = None
-    xscl = None
-    xine = None
-    xsec = None
-    xssc = None
-    dnse = None
-    fnse = None
-    csto = None
-    mnse = None
-    msto = None
-    stub = None
-    stua = None
-    tpcd = None
-    tbla = None
-    tpfd = None
-    tpsp = None
-    rpwc = None
-    tbsp = None
-    tbsa = None
-    bosp = None
-    wetp = None
-    exaa = None
-    ieos = None
-    icat = None
-    pcds = None
+def _is_expired(entry: MICEntry, as_of: datetime.date) -> bool:
+    """Check whether `entry` is no longer in use as of `as_of`: its status
+    is `Status.expired`, or its expiry date has been reached.
+
+    """
+    return entry.status is Status.expired or (
+        entry.expiry_date is not None and entry.expiry_date <= as_of
+    )
+
+
+def encode_mic(code: Union[str, bytes]) -> int:
+    """Pack a 4-character MIC code into an unsigned 32-bit integer. The
+    code is upper-cased and packed big-endian, so packed codes sort in the
+    same order as the codes themselves.
+
+    """
+    if isinstance(code, str):
+        code = code.encode("ascii")
+    if len(code) != 4:
+        raise ValueError(f"MIC codes must be 4 characters long: {code!r}")
+    return int.from_bytes(code.upper(), "big")
+
+
+def decode_mic(packed: int) -> str:
+    """Unpack an integer produced by `encode_mic` into a MIC code."""
+    return packed.to_bytes(4, "big").decode("ascii")
+
+
+def encode_mics(codes: Iterable[Union[str, bytes]]) -> array.array:
+    """Pack many MIC codes at once into an array of unsigned 32-bit
+    integers.
+
+    """
+    encoded: list[bytes] = [
+        c.encode("ascii") if isinstance(c, str) else c for c in codes
+    ]
+    for code in encoded:
+        if len(code) != 4:
+            raise ValueError(
+                f"MIC codes must be 4 characters long: {code!r}"
+            )
+
+    packed = array.array(_U32)
+    packed.frombytes(b"".join(encoded).upper())
+    if sys.byteorder == "little":
+        packed.byteswap()
+    return packed
+
+
+def decode_mics(packed: Iterable[int]) -> list[str]:
+    """Unpack many integers produced by `encode_mic`/`encode_mics` into MIC
+    codes.
+
+    """
+    packed = array.array(_U32, packed)
+    if sys.byteorder == "little":
+        packed.byteswap()
+    data = packed.tobytes().decode("ascii")
+    return [data[i:i + 4] for i in range(0, len(data), 4)]
+
+
+def _digest(data: bytes) -> bytes:
+    """Content digest of a data file (written to its header)."""
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _data_header(data: bytes) -> tuple[int, int, bytes, int]:
+    """Parse the header of a data file, returning its format version,
+    feature flags, content digest and the offset of the entries.
+
+    The header is the magic, a 1-byte format version, 1 byte of feature
+    flags and the 16-byte digest of everything after the header. Files
+    written before the header was introduced are reported as version 0,
+    and their digest is computed. Versions 0 and 1 use fixed-size lengths
+    and a flag byte per optional field, version 2 uses varint lengths and
+    a null bitmap per record.
+
+    """
+    if data[:4] != _DATA_MAGIC:
+        return (0, 0, _digest(data), 0)
+    version, flags = data[4], data[5]
+    if version > _DATA_VERSION:
+        raise ValueError(f"Unsupported data format version: {version}")
+    return (version, flags, data[6:22], 22)
+
+
+# comment phrases naming a former name of a MIC
+_ALIAS_RES = (
+    # FORMERLY (KNOWN AS) X, PREVIOUSLY (NAMED) X, FORMER X
+    re.compile(
+        r"\b(?:FORMERLY|FORMER|PREVIOUSLY|PREVISOULY)(?: \(\d{4}\))?"
+        r"(?: KNOWN AS| NAMED)? ([^.,;()\"]+(?:\([^)]*\))?)"
+    ),
+    # X IS RENAMED ..., X HAVE BEEN RENAMED ...
+    re.compile(
+        r"(?:^|\. )([^.,;()\"]+(?:\([^)]*\))?) "
+        r"(?:IS|WAS|HAS BEEN|HAVE BEEN) RENAMED\b"
+    ),
+    # RENAMED FROM "X"
+    re.compile(r"\bRENAMED FROM \"([^\"]+)\""),
+)
+_ALIAS_ACRONYM_RE = re.compile(r"^(.*?)\s*\(([^)]*)\)$")
+
+
+def _alias_key(name: str) -> str:
+    """Normalize a (former) name for alias lookups: upper-cased, with runs
+    of punctuation and whitespace collapsed to single spaces, and without a
+    leading "THE".
+
+    """
+    key = re.sub(r"[^A-Z0-9]+", " ", name.upper()).strip()
+    return key[4:] if key.startswith("THE ") else key
+
+
+def _aliases(entry: MICEntry) -> list[str]:
+    """Extract the (normalized) former names of `entry` from its comments,
+    e.g. "FORMERLY KNOWN AS THE CANADIAN NATIONAL STOCK EXCHANGE (CNSX)"
+    gives "CANADIAN NATIONAL STOCK EXCHANGE" and "CNSX".
+
+    """
+    if not entry.comments:
+        return []
+    names = [
+        match.group(1).strip()
+        for pattern in _ALIAS_RES
+        for match in pattern.finditer(entry.comments)
+    ]
+    if not names:
+        return []
+
+    own = {
+        _alias_key(name)
+        for name in (entry.mic, entry.market_name, entry.acronym)
+        if name
+    }
+    aliases: list[str] = []
+    for name in names:
+        parts = _ALIAS_ACRONYM_RE.match(name)
+        for part in parts.groups() if parts else (name,):
+            key = _alias_key(part)
+            if key and not key.isdigit() and key not in own:
+                if key not in aliases:
+                    aliases.append(key)
+    return aliases
 
 
 class _Deserializer:
+    """Reads data, delta and history files (shared by the build and the
+    runtime).
+
+    """
     @staticmethod
     def _o(
         buf: BinaryIO, deserializer: Callable[..., _T], *args: Any
@@ -3392,6 +841,21 @@ class _Deserializer:
             )
         return e
 
+    @staticmethod
+    def _v(buf: BinaryIO) -> int:
+        # unsigned LEB128
+        value = shift = 0
+        while True:
+            b = buf.read(1)[0]
+            value |= (b & 0x7f) << shift
+            if b < 0x80:
+                return value
+            shift += 7
+
+    @classmethod
+    def _sv(cls, buf: BinaryIO) -> str:
+        return buf.read(cls._v(buf)).decode("utf-8")
+
     @staticmethod
     def _format_mic(mic: str) -> str:
         mic = mic.lower()
@@ -3408,7 +872,7 @@ class _Deserializer:
     ) -> tuple[str, MICEntry]:
         def _m(value: Union[str, None]) -> Union[MICEntry, None]:
             if value:
-                return existing[cls._format_mic(value)]
+                return existing[value]
             return None
 
         entry = MICEntry(
@@ -3431,21 +895,1703 @@ class _Deserializer:
             comments                = cls._o(buf, cls._s, 2)
         )
 
-        return (cls._format_mic(entry.mic), entry)
+        return (entry.mic, entry)
+
+    @classmethod
+    def deserialize_v2(
+        cls, buf: BinaryIO, existing: dict[str, MICEntry]
+    ) -> tuple[str, MICEntry]:
+        def _m(value: Union[str, None]) -> Union[MICEntry, None]:
+            if value:
+                return existing[value]
+            return None
 
+        mic = cls._sv(buf)
+        market_name = cls._sv(buf)
+        market_category_code = cls._e(buf, 1, MCC)
+        creation_date = cls._d(buf)
+        status = cls._e(buf, 1, Status)
 
-def _build_mic(data: pathlib.Path) -> enum.Enum:
-    mics: dict[str, MICEntry] = dict()
+        # null bitmap, with bit n set if the nth optional field is present
+        present = int.from_bytes(buf.read(2), "big")
 
-    # deserialize data file
-    with data.open("rb") as infile:
-        num_entries = int.from_bytes(infile.read(2), "big")
+        def _p(
+            bit: int, deserializer: Callable[..., _T], *args: Any
+        ) -> Union[_T, None]:
+            if present & (1 << bit):
+                return deserializer(buf, *args)
+            return None
+
+        entry = MICEntry(
+            mic                     = mic,
+            market_name             = market_name,
+            market_category_code    = market_category_code,
+            creation_date           = creation_date,
+            status                  = status,
+            city                    = _p(0, cls._e, 2, City),
+            operating_mic           = _m(_p(1, cls._sv)),
+            institution_description = _p(2, cls._sv),
+            legel_entity_name       = _p(3, cls._sv),
+            legal_entity_identifier = _p(4, cls._sv),
+            acronym                 = _p(5, cls._sv),
+            iso_country_code        = _p(6, cls._e, 1, ISOCC),
+            website                 = _p(7, cls._sv),
+            last_update_date        = _p(8, cls._d),
+            last_validation_date    = _p(9, cls._d),
+            expiry_date             = _p(10, cls._d),
+            comments                = _p(11, cls._sv)
+        )
+
+        return (entry.mic, entry)
+
+    @classmethod
+    def aliases(
+        cls, buf: BinaryIO, codes: Sequence[str]
+    ) -> dict[str, tuple[str, ...]]:
+        # alias table, with entry positions resolved to MIC codes
+        aliases: dict[str, tuple[str, ...]] = dict()
+        for _ in range(cls._v(buf)):
+            alias = cls._sv(buf)
+            aliases[alias] = tuple(
+                codes[cls._v(buf)] for _ in range(cls._v(buf))
+            )
+        return aliases
+
+    @classmethod
+    def apply_ops(
+        cls,
+        buf: BinaryIO,
+        version: int,
+        mics: dict[str, MICEntry],
+        records: Union[dict[str, bytes], None] = None,
+        repoint: bool = True,
+    ) -> list[str]:
+        """Apply the (count-prefixed) operations of a delta to `mics` in
+        place, returning the MICs they added or replaced. Version 1 deltas
+        hold version 1 records, version 2 deltas hold version 2 records.
+        If given, `records` is kept up to date with the serialized records
+        of added and replaced entries, and expired entries are removed from
+        it (their records are not stored).
+
+        Segments of replaced operating MICs are pointed at the new entries
+        (and returned as replaced too), unless `repoint` is false, in which
+        case that is up to the caller.
+
+        """
+        if version == 1:
+            num_ops = int.from_bytes(buf.read(4), "big")
+            deserialize, read_mic = cls.deserialize, lambda: cls._s(buf, 1)
+        else:
+            num_ops = cls._v(buf)
+            deserialize, read_mic = cls.deserialize_v2, lambda: cls._sv(buf)
+
+        changed: list[str] = []
+        replaced = False
+        for _ in range(num_ops):
+            op = buf.read(1)[0]
+            if op == _DELTA_PUT:
+                start = buf.tell()
+                k, v = deserialize(buf, mics)
+                replaced |= k in mics
+                mics[k] = v
+                changed.append(k)
+                if records is not None:
+                    end = buf.tell()
+                    buf.seek(start)
+                    records[k] = buf.read(end - start)
+            elif op == _DELTA_EXPIRE:
+                k = read_mic()
+                mics[k] = dataclasses.replace(
+                    mics[k], status=Status.expired, expiry_date=cls._d(buf)
+                )
+                replaced = True
+                changed.append(k)
+                if records is not None:
+                    records.pop(k, None)
+            else:
+                raise ValueError(f"unknown delta operation {op}")
+
+        # point segments at replaced operating MICs (operating MICs always
+        # come before their segments, so one pass is enough)
+        if replaced and repoint:
+            for k, v in mics.items():
+                if v.operating_mic is not None:
+                    op_mic = mics[v.operating_mic.mic]
+                    if op_mic is not v.operating_mic:
+                        mics[k] = dataclasses.replace(v, operating_mic=op_mic)
+                        changed.append(k)
+
+        return changed
+
+    @classmethod
+    def apply_delta(
+        cls, buf: BinaryIO, base_digest: bytes, mics: dict[str, MICEntry]
+    ) -> Union[dict[str, MICEntry], None]:
+        """Apply a delta file on top of `mics`, returning the patched
+        entries, or `None` if the delta was made against a different base.
+
+        """
+        if buf.read(4) != _DELTA_MAGIC:
+            raise ValueError("not a delta file")
+        version = buf.read(1)[0]
+        if version not in {1, 2}:
+            raise ValueError(f"unsupported delta file version {version}")
+        if buf.read(16) != base_digest:
+            return None
+
+        mics = dict(mics)
+        cls.apply_ops(buf, version, mics)
+        return mics
+
+    # sizes of the fixed-size optional fields of version 2 records, by bit
+    # of the null bitmap (0 for strings)
+    _V2_SIZES = (2, 0, 0, 0, 0, 0, 1, 0, 3, 3, 3, 0)
+
+    @staticmethod
+    def _varint(data: bytes, pos: int) -> tuple[int, int]:
+        # like `_v`, reading from `data` at `pos` (returns the new position)
+        value = shift = 0
+        while True:
+            b = data[pos]
+            pos += 1
+            value |= (b & 0x7f) << shift
+            if b < 0x80:
+                return value, pos
+            shift += 7
+
+    @classmethod
+    def records(cls, encoded: bytes) -> dict[str, bytes]:
+        """Split a version 2 data file into its serialized records, keyed by
+        MIC, without decoding anything but the MICs.
+
+        """
+        version, _, _, offset = _data_header(encoded)
+        if version != 2:
+            raise ValueError(f"expected a version 2 data file, got {version}")
+
+        varint, sizes = cls._varint, cls._V2_SIZES
+        records: dict[str, bytes] = dict()
+        num_entries, pos = varint(encoded, offset)
         for _ in range(num_entries):
-            k, v = _Deserializer.deserialize(infile, mics)
-            mics[k] = v
+            start = pos
+            size, pos = varint(encoded, pos)
+            mic = encoded[pos:pos + size].decode("utf-8")
+            size, pos = varint(encoded, pos + size)
+            # market name, then market category code, creation date, status
+            pos += size + 5
+            present = (encoded[pos] << 8) | encoded[pos + 1]
+            pos += 2
+            for bit, size in enumerate(sizes):
+                if present & (1 << bit):
+                    if not size:
+                        size, pos = varint(encoded, pos)
+                    pos += size
+            records[mic] = encoded[start:pos]
+        return records
+
+    @classmethod
+    def read(
+        cls,
+        encoded: bytes,
+        records: Union[dict[str, bytes], None] = None,
+    ) -> tuple[
+        dict[str, MICEntry],
+        bytes,
+        Union[dict[str, tuple[str, ...]], None],
+    ]:
+        """Read a data file, returning its entries (keyed by MIC), its
+        content digest and its alias table (if it has one). The serialized record of every entry is stored in `records`
+        if given.
+
+        """
+        mics: dict[str, MICEntry] = dict()
+        version, flags, digest, offset = _data_header(encoded)
+        with io.BytesIO(encoded) as infile:
+            infile.seek(offset)
+            if version >= 2:
+                num_entries = cls._v(infile)
+                deserialize = cls.deserialize_v2
+            else:
+                num_entries = int.from_bytes(infile.read(2), "big")
+                deserialize = cls.deserialize
+            for _ in range(num_entries):
+                start = infile.tell()
+                k, v = deserialize(infile, mics)
+                mics[k] = v
+                if records is not None:
+                    records[k] = encoded[start:infile.tell()]
+            if not version or flags & _FLAG_MPH:
+                infile.seek(4 * num_entries, io.SEEK_CUR)
+            aliases = None
+            if flags & _FLAG_ALIASES:
+                aliases = cls.aliases(infile, list(mics))
+
+        return (mics, digest, aliases)
+
+
+class Parser:
+    """Parses the MIC sheet
+    (https://www.iso20022.org/market-identifier-codes) into `MICEntry`
+    instances.
+
+    """
+    hyphen_re = re.compile(
+        r"[\u002D\u058A\u05BE\u1400\u1806\u2010-\u2015\u2E17\u2E1A\u2E3A"
+        r"\u2E3B\u2E40\u301C\u3030\u30A0\uFE31\uFE32\uFE58\uFE63\uFF0D]"
+    )
+    ws_re = re.compile(r"\s+")
+
+    @staticmethod
+    def _parse_date(datestr: str) -> datetime.date:
+        return datetime.date(
+            year=int(datestr[:4]),
+            month=int(datestr[4:6]),
+            day=int(datestr[6:])
+        )
+
+    @classmethod
+    def _normalize(cls, value: str) -> str:
+        return re.sub(cls.hyphen_re, "-", re.sub(cls.ws_re, " ", value))
+
+    @staticmethod
+    def _parse_icc(icc: str) -> ISOCC:
+        if icc in {"in", "is"}:
+            icc += "_"
+        return ISOCC[icc]
+
+    @classmethod
+    def _entry(
+        cls, row: Sequence[str], mics: dict[str, MICEntry]
+    ) -> MICEntry:
+        (
+            mic,
+            op_mic,
+            _,
+            mname_and_inst_desc,
+            le_name,
+            le_id,
+            mcc,
+            anym,
+            icc,
+            city,
+            website,
+            status,
+            c_date,
+            lu_date,
+            lv_date,
+            e_date,
+            comments,
+        ) = row
+
+        mname, inst_desc, *_ = (
+            *re.split(r" - ", mname_and_inst_desc, maxsplit=1),
+            None,
+        )
+
+        return MICEntry(
+            mic=mic,
+            market_name=cls._normalize(mname),
+            market_category_code=MCC[mcc.lower()],
+            creation_date=cls._parse_date(c_date),
+            status=Status[status.lower()],
+            city=(
+                # looked up by name (see `City.__new__`)
+                City(cls._normalize(city).title())  # type: ignore[arg-type]
+                if city and city != "N/A" else None
+            ),
+            operating_mic=(
+                mics[op_mic.lower()] if mic != op_mic else None
+            ),
+            institution_description=inst_desc,
+            legel_entity_name=(le_name or None),
+            legal_entity_identifier=(le_id or None),
+            acronym=(anym or None),
+            iso_country_code=(
+                cls._parse_icc(icc.lower()) if icc else None
+            ),
+            website=(website.lower() or None),
+            last_update_date=(
+                cls._parse_date(lu_date) if lu_date else None
+            ),
+            last_validation_date=(
+                cls._parse_date(lv_date) if lv_date else None
+            ),
+            expiry_date=(
+                cls._parse_date(e_date) if e_date else None
+            ),
+            comments=(comments or None)
+        )
+
+    @staticmethod
+    def _order(lines: Sequence[Sequence[str]]) -> list[int]:
+        """Order row indexes so that every operating MIC comes before its
+        segments.
+
+        The order is the one produced by repeatedly sweeping the rows and
+        taking each row whose operating MIC has already been taken: a row
+        is taken in the same sweep as its operating MIC if it comes after
+        it, and in the next sweep otherwise. Sweeps are computed per row
+        (following each chain once), so this is linear in the row count.
+
+        """
+        index: dict[str, int] = dict()
+        for i, line in enumerate(lines):
+            index.setdefault(line[0].lower(), i)
+
+        sweeps: list[int] = [0] * len(lines)
+        for i in range(len(lines)):
+            # walk up to the first row with a known sweep
+            chain: list[int] = []
+            seen: set[int] = set()
+            j = i
+            while not sweeps[j]:
+                mic, op_mic = lines[j][0], lines[j][1]
+                if mic == op_mic:
+                    sweeps[j] = 1
+                    break
+                if j in seen:
+                    raise ValueError(f"Circular operating MIC: {mic!r}")
+                chain.append(j)
+                seen.add(j)
+                if op_mic.lower() not in index:
+                    raise ValueError(
+                        f"Unknown operating MIC {op_mic!r} of {mic!r}"
+                    )
+                j = index[op_mic.lower()]
+
+            # and back down, assigning sweeps
+            for k in reversed(chain):
+                op = index[lines[k][1].lower()]
+                sweeps[k] = sweeps[op] + (op > k)
+
+        buckets: list[list[int]] = [[] for _ in range(max(sweeps, default=0))]
+        for i, sweep in enumerate(sweeps):
+            buckets[sweep - 1].append(i)
+        return [i for bucket in buckets for i in bucket]
+
+    @classmethod
+    def iter_parse(
+        cls, csv_src: Union[str, os.PathLike]
+    ) -> Iterator[MICEntry]:
+        """Parse the rows of `csv_src` as they are read, yielding each entry
+        as soon as its operating MIC has been yielded. Only segment rows
+        whose operating MIC has not been seen yet are buffered, and they
+        are yielded right after it.
+
+        """
+        mics: dict[str, MICEntry] = dict()
+        pending: dict[str, list[list[str]]] = dict()
+
+        with open(csv_src, "r", newline="") as infile:
+            reader = csv.reader(infile)
+            next(reader) # skip header
+
+            for row in reader:
+                if row[0] != row[1] and row[1].lower() not in mics:
+                    pending.setdefault(row[1].lower(), []).append(row)
+                    continue
+
+                ready = [row]
+                while ready:
+                    row = ready.pop()
+                    entry = mics[row[0].lower()] = cls._entry(row, mics)
+                    yield entry
+                    ready.extend(reversed(pending.pop(row[0].lower(), ())))
+
+        if pending:
+            raise ValueError(
+                f"Unknown operating MIC(s): {', '.join(sorted(pending))}"
+            )
+
+    @classmethod
+    def parse(
+        cls, csv_src: Union[str, os.PathLike], stream: bool = False
+    ) -> tuple[MICEntry, ...]:
+        """Parse `csv_src`. By default the whole file is read up front and
+        entries keep the file order as closely as possible; with `stream`,
+        rows are processed as they are read (see `iter_parse`), so only
+        unresolved segment rows are held in memory.
+
+        """
+        if stream:
+            return tuple(
+                {e.mic.lower(): e for e in cls.iter_parse(csv_src)}.values()
+            )
+
+        mics: dict[str, MICEntry] = dict()
+
+        with open(csv_src, "r") as infile:
+            reader = csv.reader(infile.readlines())
+            next(reader) # skip header
+            lines: list[list[str]] = list(reader)
+
+        for i in cls._order(lines):
+            mics[lines[i][0].lower()] = cls._entry(lines[i], mics)
+
+        return tuple(mics.values())
+
+
+# comment phrases naming the successor of a MIC, as (pattern, group of the
+# old MIC (0 for the commented entry), group of the new MIC (0 likewise))
+_SUCCESSION_RES = (
+    (re.compile(
+        r"\b(?:([A-Z0-9]{4}) )?(?:IS )?(?:REPLACED BY|CHANGED INTO) "
+        r"([A-Z0-9]{4})\b"
+    ), 1, 2),
+    (re.compile(r"\b(?:([A-Z0-9]{4}) )?REPLACES MIC ([A-Z0-9]{4})\b"), 2, 1),
+    (re.compile(r"\bMIC TO USE\b[^.]*?\bIS:? ([A-Z0-9]{4})\b"), 0, 1),
+    (re.compile(r"\bMIC TO USE: ([A-Z0-9]{4})\b"), 0, 1),
+    (re.compile(r"\bMIC IS NOW ([A-Z0-9]{4})\b"), 0, 1),
+    (re.compile(r"\b([A-Z0-9]{4}) (?:IS|WILL BE) THE MIC TO USE\b"), 0, 1),
+)
+
+
+def _successions(entry: MICEntry) -> Iterator[tuple[str, str]]:
+    # (old, new) MIC pairs stated by the comments of `entry`
+    if not entry.comments:
+        return
+    for pattern, old, new in _SUCCESSION_RES:
+        for match in pattern.finditer(entry.comments):
+            yield (
+                match.group(old) or entry.mic if old else entry.mic,
+                match.group(new) or entry.mic if new else entry.mic,
+            )
+
+
+def _code_keys(code: str) -> tuple[Union[str, bytes], ...]:
+    # the forms of `code` that lookups by code are keyed by
+    upper, lower = code.upper(), code.lower()
+    return (upper, lower, upper.encode("ascii"), lower.encode("ascii"))
+
+
+if sys.version_info >= (3, 10):
+    _popcount = int.bit_count
+else:
+    def _popcount(bits: int) -> int:
+        return bin(bits).count("1")
+
+
+# the positions of the set bits of every byte value
+_BYTE_BITS = tuple(
+    tuple(bit for bit in range(8) if byte & (1 << bit))
+    for byte in range(256)
+)
+
+
+def _bitmap(positions: Iterable[int], size: int) -> int:
+    buf = bytearray((size + 7) // 8)
+    for position in positions:
+        buf[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(buf, "little")
+
+
+class MICSet(collections.abc.Set):
+    """An immutable set of the MICs of a registry, stored as a bitmap over
+    their positions in it (see `MICRegistry.index_of`), so that unions,
+    intersections and differences of sets of the same registry are single
+    operations over the bitmaps. Iteration yields entries in registry
+    order, and membership can be checked by code or entry.
+
+    Sets compare equal to other sets with the same MICs (by code), of any
+    registry, so they are unhashable (like `set`) to keep hashing
+    consistent with equality.
+
+    """
+    __slots__ = ("_registry", "_bits")
+
+    _registry: "MICRegistry"
+    _bits: int
+
+    def __init__(
+        self,
+        registry: "MICRegistry",
+        codes: Iterable[Union[str, bytes, MICEntry]] = (),
+    ) -> None:
+        self._registry = registry
+        self._bits = _bitmap(
+            (
+                registry.index_of(c.mic if isinstance(c, MICEntry) else c)
+                for c in codes
+            ),
+            registry._positions,
+        )
+
+    @classmethod
+    def _from_bits(cls, registry: "MICRegistry", bits: int) -> "MICSet":
+        mic_set = cls.__new__(cls)
+        mic_set._registry = registry
+        mic_set._bits = bits
+        return mic_set
+
+    @classmethod
+    def from_bytes(cls, registry: "MICRegistry", data: bytes) -> "MICSet":
+        """Load a set of the MICs of `registry` serialized by `to_bytes`."""
+        if len(data) != (registry._positions + 7) // 8:
+            raise ValueError("MIC set was serialized for another registry")
+        bits = int.from_bytes(data, "little")
+        if bits & ~registry._universe:
+            raise ValueError("MIC set contains MICs not in the registry")
+        return cls._from_bits(registry, bits)
+
+    def to_bytes(self) -> bytes:
+        """Serialize the set as its bitmap (one bit per position of its
+        registry, little-endian).
+
+        """
+        return self._bits.to_bytes(
+            (self._registry._positions + 7) // 8, "little"
+        )
+
+    @property
+    def registry(self) -> "MICRegistry":
+        return self._registry
+
+    def _position(self, value: object) -> Union[int, None]:
+        # the position of `value` (a code or entry) in the registry, or
+        # None if it is not one of its MICs
+        if isinstance(value, MICEntry):
+            value = value.mic
+        if not isinstance(value, (str, bytes)):
+            return None
+        try:
+            return self._registry.index_of(value)
+        except (KeyError, ValueError, UnicodeError):
+            return None
+
+    def __contains__(self, value: object) -> bool:
+        position = self._position(value)
+        return position is not None and bool(self._bits >> position & 1)
+
+    def __iter__(self) -> Iterator[MICEntry]:
+        entries = self._registry._by_position
+        bits = self._bits
+        data = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+        for i, byte in enumerate(data):
+            if byte:
+                for bit in _BYTE_BITS[byte]:
+                    yield entries[(i << 3) | bit]  # type: ignore
+
+    def __len__(self) -> int:
+        return _popcount(self._bits)
+
+    def __bool__(self) -> bool:
+        return bool(self._bits)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({[e.mic for e in self]!r})"
+
+    def _other(self, other: Iterable[Any]) -> tuple[int, bool]:
+        # the bitmap of `other` over the registry, and whether it has
+        # elements that are not MICs of the registry (which the bitmap
+        # leaves out)
+        if isinstance(other, MICSet) and other._registry is self._registry:
+            return other._bits, False
+        positions = [self._position(value) for value in other]
+        bits = _bitmap(
+            (p for p in positions if p is not None), self._registry._positions
+        )
+        return bits, None in positions
+
+    def _members(self, other: Iterable[Any]) -> int:
+        # the bitmap of `other`, all of which must be MICs of the registry
+        if isinstance(other, MICSet) and other._registry is self._registry:
+            return other._bits
+        return MICSet(self._registry, other)._bits
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, collections.abc.Set):
+            return NotImplemented
+        bits, foreign = self._other(other)
+        return not foreign and self._bits == bits
+
+    def __le__(self, other: collections.abc.Set) -> bool:
+        if not isinstance(other, collections.abc.Set):
+            return NotImplemented
+        return not self._bits & ~self._other(other)[0]
+
+    def __ge__(self, other: collections.abc.Set) -> bool:
+        if not isinstance(other, collections.abc.Set):
+            return NotImplemented
+        bits, foreign = self._other(other)
+        return not foreign and not bits & ~self._bits
+
+    def __lt__(self, other: collections.abc.Set) -> bool:
+        if not isinstance(other, collections.abc.Set):
+            return NotImplemented
+        return self <= other and self != other
+
+    def __gt__(self, other: collections.abc.Set) -> bool:
+        if not isinstance(other, collections.abc.Set):
+            return NotImplemented
+        return self >= other and self != other
+
+    def __or__(self, other: Iterable[Any]) -> "MICSet":
+        if not isinstance(other, Iterable):
+            return NotImplemented
+        return self._from_bits(
+            self._registry, self._bits | self._members(other)
+        )
+
+    def __and__(self, other: Iterable[Any]) -> "MICSet":
+        if not isinstance(other, Iterable):
+            return NotImplemented
+        return self._from_bits(
+            self._registry, self._bits & self._other(other)[0]
+        )
+
+    def __sub__(self, other: Iterable[Any]) -> "MICSet":
+        if not isinstance(other, Iterable):
+            return NotImplemented
+        return self._from_bits(
+            self._registry, self._bits & ~self._other(other)[0]
+        )
+
+    def __rsub__(self, other: Iterable[Any]) -> "MICSet":
+        if not isinstance(other, Iterable):
+            return NotImplemented
+        return self._from_bits(
+            self._registry, self._members(other) & ~self._bits
+        )
+
+    def __xor__(self, other: Iterable[Any]) -> "MICSet":
+        if not isinstance(other, Iterable):
+            return NotImplemented
+        return self._from_bits(
+            self._registry, self._bits ^ self._members(other)
+        )
+
+    __ror__ = __or__
+    __rand__ = __and__
+    __rxor__ = __xor__
+
+    def __invert__(self) -> "MICSet":
+        """Get the MICs of the registry that are not in this set."""
+        return self._from_bits(
+            self._registry, self._registry._universe & ~self._bits
+        )
+
+    def isdisjoint(self, other: Iterable[Any]) -> bool:
+        return not self._bits & self._other(other)[0]
+
+
+def _key_of(code: object) -> str:
+    # the (upper case) key of `code` in a registry, which may be given as
+    # `str` or `bytes`
+    if isinstance(code, bytes):
+        return code.decode("latin-1").upper()
+    if isinstance(code, str):
+        return code.upper()
+    raise KeyError(code)
+
+
+def _normalized(entry: MICEntry) -> MICEntry:
+    # `entry` with its code upper-cased (as the keys of registries are)
+    code = decode_mic(encode_mic(entry.mic))
+    if entry.mic == code:
+        return entry
+    return dataclasses.replace(entry, mic=code)
+
+
+class MICRegistry(collections.abc.Mapping):
+    """An immutable set of MIC entries, keyed by upper case MIC code (looked
+    up case insensitively, as `str` or `bytes`). Entries keep the order
+    they were given in, which is the order `index_of` refers to. Lookup
+    tables are built on first use.
+
+    """
+    _entries: dict[str, MICEntry]
+    _alias_table: Union[dict[str, tuple[str, ...]], None]
+
+    def __init__(self, entries: Iterable[MICEntry] = ()) -> None:
+        self._entries = {e.mic: e for e in map(_normalized, entries)}
+        self._alias_table = None
+
+    @classmethod
+    def _wrap(
+        cls,
+        entries: dict[str, MICEntry],
+        aliases: Union[dict[str, tuple[str, ...]], None] = None,
+    ) -> "MICRegistry":
+        # takes ownership of `entries` (keyed by MIC) without copying it,
+        # along with the alias table over them (if there is one)
+        registry = cls.__new__(cls)
+        registry._entries = entries
+        registry._alias_table = aliases
+        return registry
+
+    def __getitem__(self, code: Union[str, bytes]) -> MICEntry:
+        try:
+            return self._entries[code]  # type: ignore[index]
+        except KeyError:
+            entry = self._entries.get(_key_of(code))
+            if entry is None:
+                raise
+            return entry
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} ({len(self)} entries)>"
+
+    @property
+    def _positions(self) -> int:
+        # number of positions `index_of` can return
+        return len(self._entries)
+
+    def overlay(
+        self,
+        entries: Iterable[MICEntry] = (),
+        overrides: Union[Mapping[str, Mapping[str, Any]], None] = None,
+        suppress: Iterable[str] = (),
+    ) -> "OverlayRegistry":
+        """Layer private entries, field overrides and suppressions over this
+        registry (see `OverlayRegistry`).
+
+        """
+        return OverlayRegistry(self, entries, overrides, suppress)
+
+    @classmethod
+    def default(cls) -> "MICRegistry":
+        """Get the registry of the packaged data (with any deltas applied),
+        which `MIC` and the module-level lookups are views of.
+
+        """
+        return _REGISTRY
+
+    def build_indexes(self) -> Self:
+        """Build every lookup table now rather than on first use (e.g.
+        before publishing a freshly loaded registry to other threads).
+
+        """
+        self._by_code, self._by_buffer, self.by_packed, self._predecessors
+        self._aliases, self._schedule, self._by_position, self._universe
+        for attr in self._INDEXED:
+            self._index(attr)
+        return self
+
+    @functools.cached_property
+    def _by_code(self) -> dict[Union[str, bytes], int]:
+        # positions keyed by upper and lower case codes (as `str` and
+        # `bytes`), so that most lookups are a single dict probe
+        by_code: dict[Union[str, bytes], int] = dict()
+        for position, code in enumerate(self._entries):
+            for key in _code_keys(code):
+                by_code[key] = position
+        return by_code
+
+    @functools.cached_property
+    def _by_buffer(self) -> dict[int, MICEntry]:
+        # raw (upper and lower case) codes packed without normalization
+        by_buffer: dict[int, MICEntry] = dict()
+        for entry in self._entries.values():
+            for code in (entry.mic.upper(), entry.mic.lower()):
+                by_buffer[int.from_bytes(code.encode("ascii"), "big")] = entry
+        return by_buffer
+
+    _INDEXED = (
+        "iso_country_code",
+        "market_category_code",
+        "status",
+        "city",
+        "operating_mic",
+    )
+
+    @functools.cached_property
+    def _indexes(self) -> dict[str, dict[Any, MICSet]]:
+        return dict()
+
+    @functools.cached_property
+    def _by_position(
+        self,
+    ) -> Union[list[Union[MICEntry, None]], "_Overlaid"]:
+        # the entry at every position (`None` for unused positions)
+        return list(self._entries.values())
+
+    @functools.cached_property
+    def _universe(self) -> int:
+        # bitmap of every position in use
+        return (1 << len(self._entries)) - 1
+
+    def mic_set(
+        self, codes: Iterable[Union[str, bytes, MICEntry]] = ()
+    ) -> MICSet:
+        """Get a `MICSet` of (the MICs of this registry among) `codes`."""
+        return MICSet(self, codes)
+
+    def all(self) -> MICSet:
+        """Get a `MICSet` of every MIC of this registry."""
+        return MICSet._from_bits(self, self._universe)
+
+    @staticmethod
+    def _key(entry: MICEntry, attr: str) -> Any:
+        # index key of `entry` (operating MICs are indexed by code)
+        key = getattr(entry, attr)
+        if attr == "operating_mic" and key is not None:
+            return key.mic
+        return key
+
+    def _build_index(self, attr: str) -> dict[Any, MICSet]:
+        groups: dict[Any, list[int]] = dict()
+        for position, e in enumerate(self._entries.values()):
+            groups.setdefault(self._key(e, attr), []).append(position)
+        return {
+            key: MICSet._from_bits(self, _bitmap(group, self._positions))
+            for key, group in groups.items()
+        }
+
+    def _index(self, attr: str) -> dict[Any, MICSet]:
+        # entries grouped by `attr`, built on first use
+        index = self._indexes.get(attr)
+        if index is None:
+            index = self._indexes[attr] = self._build_index(attr)
+        return index
+
+    def _lookup(self, attr: str, key: Any) -> MICSet:
+        found = self._index(attr).get(key)
+        return MICSet._from_bits(self, 0) if found is None else found
+
+    def by_country(self, country: ISOCC) -> MICSet:
+        """Get the entries of `country`."""
+        return self._lookup("iso_country_code", country)
+
+    def by_category(self, category: MCC) -> MICSet:
+        """Get the entries of market category `category`."""
+        return self._lookup("market_category_code", category)
+
+    def by_status(self, status: Status) -> MICSet:
+        """Get the entries with status `status`."""
+        return self._lookup("status", status)
+
+    def by_city(self, city: City) -> MICSet:
+        """Get the entries of `city`."""
+        return self._lookup("city", city)
+
+    def segments(self, code: str) -> MICSet:
+        """Get the segment MICs of the operating MIC `code`."""
+        return self._lookup("operating_mic", code.upper())
+
+    def operating_mics(self) -> MICSet:
+        """Get the operating MICs."""
+        return self._lookup("operating_mic", None)
+
+    @functools.cached_property
+    def by_packed(self) -> Mapping[int, MICEntry]:
+        """Entries keyed by their packed code (see `encode_mic`)."""
+        return {encode_mic(code): e for code, e in self._entries.items()}
+
+    @functools.cached_property
+    def _aliases(self) -> dict[str, tuple[MICEntry, ...]]:
+        # entries by normalized former name, from the alias table of the
+        # data file if there is one, otherwise extracted from comments
+        if self._alias_table is not None:
+            return {
+                alias: tuple(self[code] for code in codes)
+                for alias, codes in self._alias_table.items()
+            }
+        aliases: dict[str, list[MICEntry]] = dict()
+        for entry in self.values():
+            for alias in _aliases(entry):
+                aliases.setdefault(alias, []).append(entry)
+        return {alias: tuple(group) for alias, group in aliases.items()}
+
+    @functools.cached_property
+    def _schedule(self) -> tuple[list[datetime.date], list[MICEntry]]:
+        # expiry dates in ascending order, and the entries expiring on them
+        expiring = sorted(
+            (e for e in self.values() if e.expiry_date is not None),
+            key=lambda e: (e.expiry_date, e.mic),
+        )
+        return [e.expiry_date for e in expiring], expiring  # type: ignore
+
+    def expiring_between(
+        self, start: datetime.date, end: datetime.date
+    ) -> list[MICEntry]:
+        """Get the entries with an expiry date between `start` and `end`
+        (inclusive), ordered by expiry date.
+
+        """
+        dates, entries = self._schedule
+        return entries[
+            bisect.bisect_left(dates, start):bisect.bisect_right(dates, end)
+        ]
+
+    def next_expiries(
+        self, k: int, as_of: Union[datetime.date, None] = None
+    ) -> list[MICEntry]:
+        """Get the (up to) `k` entries expiring next, on or after `as_of`
+        (defaults to today), ordered by expiry date.
+
+        """
+        dates, entries = self._schedule
+        start = bisect.bisect_left(dates, as_of or datetime.date.today())
+        return entries[start:start + k]
+
+    def effective_status(
+        self, code: str, as_of: Union[datetime.date, None] = None
+    ) -> Status:
+        """Get the status of `code` as of `as_of` (defaults to today), which
+        is `Status.expired` once its expiry date has been reached, even if
+        its status has not been updated yet.
+
+        """
+        entry = self[code]
+        if _is_expired(entry, as_of or datetime.date.today()):
+            return Status.expired
+        return entry.status
+
+    def is_active(
+        self, code: str, as_of: Union[datetime.date, None] = None
+    ) -> bool:
+        """Check whether `code` is in use as of `as_of` (defaults to today),
+        i.e. whether its effective status is not `Status.expired`.
+
+        """
+        return self.effective_status(code, as_of) is not Status.expired
+
+    def by_alias(self, name: str) -> tuple[MICEntry, ...]:
+        """Get the entries formerly known as `name` (e.g. "NYBOT"), as
+        stated in their comments. Names are matched ignoring case,
+        punctuation and a leading "THE".
+
+        """
+        return self._aliases.get(_alias_key(name), ())
+
+    @functools.cached_property
+    def _succession(
+        self,
+    ) -> tuple[dict[str, MICEntry], dict[str, MICEntry]]:
+        # the successor of every replaced MIC, and the current equivalent of
+        # every MIC that has one
+        successors: dict[str, MICEntry] = dict()
+        today = datetime.date.today()
+
+        # successions stated in comments, where the old MIC has expired
+        for entry in self.values():
+            for old, new in _successions(entry):
+                if (
+                    old != new
+                    and old in self and new in self
+                    and _is_expired(self[old], today)
+                ):
+                    successors.setdefault(old, self[new])
+
+        # follow every chain to its end (stopping at cycles)
+        current: dict[str, MICEntry] = dict()
+        for code in successors:
+            seen = {code}
+            entry = successors[code]
+            while entry.mic in successors and entry.mic not in seen:
+                seen.add(entry.mic)
+                entry = successors[entry.mic]
+            current[code] = entry
+
+        return successors, current
+
+    @functools.cached_property
+    def _predecessors(self) -> dict[str, tuple[MICEntry, ...]]:
+        predecessors: dict[str, list[MICEntry]] = dict()
+        for code, successor in self._succession[0].items():
+            predecessors.setdefault(successor.mic, []).append(self[code])
+        return {code: tuple(group) for code, group in predecessors.items()}
+
+    def successor(self, code: str) -> Union[MICEntry, None]:
+        """Get the MIC that replaced `code`, if it was replaced.
+
+        Successions are taken from comments (e.g. "REPLACED BY ...", "MIC
+        TO USE IS ..."), and only count once the old MIC has expired.
+
+        """
+        entry = self[code]
+        return self._succession[0].get(entry.mic)
+
+    def predecessors(self, code: str) -> tuple[MICEntry, ...]:
+        """Get the MICs that `code` directly replaced."""
+        entry = self[code]
+        return self._predecessors.get(entry.mic, ())
+
+    def current_equivalent(self, code: str) -> MICEntry:
+        """Get the MIC that `code` was (possibly indirectly) replaced by, or
+        the entry of `code` itself if it was not replaced.
+
+        """
+        entry = self[code]
+        return self._succession[1].get(entry.mic, entry)
+
+    def current_equivalents(
+        self, codes: Iterable[str], default: Union[_T, None] = None
+    ) -> list[Union[MICEntry, _T, None]]:
+        """Like `current_equivalent`, for many codes at once. Unknown codes
+        get `default`.
+
+        """
+        current = self._succession[1]
+        out: list[Union[MICEntry, _T, None]] = []
+        for code in codes:
+            entry = self.get(code)
+            out.append(
+                default if entry is None else current.get(entry.mic, entry)
+            )
+        return out
+
+    def equivalence_map(self) -> dict[str, str]:
+        """Get the code of the current equivalent of every replaced MIC,
+        keyed by its code (e.g. for `pandas.Series.replace`).
+
+        """
+        return {code: e.mic for code, e in self._succession[1].items()}
+
+    def is_mic(self, code: Union[str, bytes]) -> bool:
+        """Check whether `code` is a MIC of this registry."""
+        by_code = self._by_code
+        if code in by_code:
+            return True
+        try:
+            # mixed case
+            return code.upper() in by_code
+        except AttributeError:
+            return False
+
+    def index_of(self, code: Union[str, bytes]) -> int:
+        """Get the position of the MIC `code` in this registry."""
+        by_code = self._by_code
+        position = by_code.get(code)
+        if position is None:
+            # mixed case
+            position = by_code.get(code.upper())
+            if position is None:
+                raise KeyError(code)
+        return position
+
+    def get_bytes(
+        self,
+        buf: Union[bytes, bytearray, memoryview],
+        default: Union[_T, None] = None,
+    ) -> Union[MICEntry, _T, None]:
+        """Get the entry for a MIC code given as a bytes-like object, or
+        `default` if it is not a MIC of this registry.
+
+        """
+        if len(buf) != 4:
+            return default
+        by_buffer = self._by_buffer
+        entry = by_buffer.get(int.from_bytes(buf, "big"))
+        if entry is None:
+            # mixed case
+            entry = by_buffer.get(int.from_bytes(bytes(buf).upper(), "big"))
+        return default if entry is None else entry
+
+    def lookup_bytes(
+        self, buf: Union[bytes, bytearray, memoryview]
+    ) -> MICEntry:
+        """Like `get_bytes`, but raises `KeyError` if `buf` is not a MIC of
+        this registry.
+
+        """
+        entry = self.get_bytes(buf)
+        if entry is None:
+            raise KeyError(bytes(buf))
+        return entry
+
+
+class _Overlaid(dict[int, Union[MICEntry, None]]):
+    """The entries at the positions an `OverlayRegistry` changed (`None`
+    for suppressed MICs), falling back to the entries of its base.
+
+    """
+    def __init__(
+        self, base: Union[list[Union[MICEntry, None]], "_Overlaid"]
+    ) -> None:
+        super().__init__()
+        self._base = base
+
+    def __missing__(self, position: int) -> Union[MICEntry, None]:
+        return self._base[position]
+
+
+class _PackedOverlay(collections.abc.Mapping):
+    """The entries of an `OverlayRegistry` keyed by their packed code,
+    looked up in the overlay and then in the base.
+
+    """
+    def __init__(self, registry: "OverlayRegistry") -> None:
+        self._registry = registry
+        self._base = registry._base.by_packed
+        self._overlay = {
+            encode_mic(code): e for code, e in registry._overlay.items()
+        }
+        self._suppressed = frozenset(
+            encode_mic(code) for code in registry._suppressed
+        )
+
+    def __getitem__(self, packed: int) -> MICEntry:
+        entry = self._overlay.get(packed)
+        if entry is not None:
+            return entry
+        if packed in self._suppressed:
+            raise KeyError(packed)
+        return self._base[packed]
+
+    def __iter__(self) -> Iterator[int]:
+        return map(encode_mic, self._registry)
+
+    def __len__(self) -> int:
+        return len(self._registry)
+
+
+class OverlayRegistry(MICRegistry):
+    """A registry layered over another one, chained-map style: private
+    `entries` are added, the fields of existing entries are replaced
+    (`overrides` maps MIC codes to fields and their new values) and the
+    MICs in `suppress` are hidden, without copying the base. Lookups check
+    the overlay and then the base, and indexes are merged from those of
+    the base on first use.
+
+    Entries of the base keep their positions (see `index_of`), private
+    entries are placed after them. A private entry with the code of an
+    existing entry replaces it. Segments of replaced operating MICs are
+    overlaid too, pointing at the new entries.
+
+    """
+    _base: MICRegistry
+    _overlay: dict[str, MICEntry]
+    _added: dict[str, int]
+    _suppressed: frozenset[str]
+
+    def __init__(
+        self,
+        base: MICRegistry,
+        entries: Iterable[MICEntry] = (),
+        overrides: Union[Mapping[str, Mapping[str, Any]], None] = None,
+        suppress: Iterable[str] = (),
+    ) -> None:
+        overlay = {e.mic: e for e in map(_normalized, entries)}
+        for code, fields in (overrides or {}).items():
+            code = code.upper()
+            overlay[code] = dataclasses.replace(
+                overlay[code] if code in overlay else base[code], **fields
+            )
+        suppressed = frozenset(code.upper() for code in suppress)
+
+        # point the segments of overlaid operating MICs (in the base or the
+        # overlay) at their overlay entries, following chains of segments
+        pending = list(overlay)
+        while pending:
+            code = pending.pop()
+            op_mic = overlay[code]
+            stale = [
+                e for e in overlay.values()
+                if e.operating_mic is not None
+                and e.operating_mic.mic == code
+                and e.operating_mic is not op_mic
+            ]
+            if code in base:
+                stale.extend(
+                    e for e in base.segments(code)
+                    if e.mic not in overlay and e.mic not in suppressed
+                )
+            for e in stale:
+                overlay[e.mic] = dataclasses.replace(e, operating_mic=op_mic)
+                pending.append(e.mic)
+
+        if suppressed & overlay.keys():
+            raise ValueError(
+                "MICs cannot be both suppressed and overlaid: "
+                + ", ".join(sorted(suppressed & overlay.keys()))
+            )
+
+        self._base = base
+        self._overlay = overlay
+        self._suppressed = suppressed
+        self._alias_table = None
+        self._added = {
+            code: base._positions + i
+            for i, code in enumerate(c for c in overlay if c not in base)
+        }
+
+    def __getitem__(self, code: Union[str, bytes]) -> MICEntry:
+        code = _key_of(code)
+        entry = self._overlay.get(code)
+        if entry is not None:
+            return entry
+        if code in self._suppressed:
+            raise KeyError(code)
+        return self._base[code]
+
+    def __iter__(self) -> Iterator[str]:
+        suppressed = self._suppressed
+        for code in self._base:
+            if code not in suppressed:
+                yield code
+        yield from self._added
+
+    @functools.cached_property
+    def _len(self) -> int:
+        hidden = sum(code in self._base for code in self._suppressed)
+        return len(self._base) - hidden + len(self._added)
+
+    def __len__(self) -> int:
+        return self._len
+
+    @property
+    def _positions(self) -> int:
+        return self._base._positions + len(self._added)
+
+    def is_mic(self, code: Union[str, bytes]) -> bool:
+        try:
+            self.index_of(code)
+        except KeyError:
+            return False
+        return True
+
+    def index_of(self, code: Union[str, bytes]) -> int:
+        key = _key_of(code)
+        position = self._added.get(key)
+        if position is not None:
+            return position
+        if key in self._suppressed:
+            raise KeyError(code)
+        return self._base.index_of(code)
+
+    def build_indexes(self) -> Self:
+        self._base.build_indexes()
+        self._len, self._by_buffer, self.by_packed
+        self._predecessors
+        self._aliases, self._schedule, self._by_position, self._universe
+        for attr in self._INDEXED:
+            self._index(attr)
+        return self
+
+    @functools.cached_property
+    def _hidden(self) -> int:
+        # bitmap of the positions of base entries that are suppressed or
+        # overlaid
+        return _bitmap(
+            (
+                self._base.index_of(code)
+                for code in self._suppressed | self._overlay.keys()
+                if code in self._base
+            ),
+            self._positions,
+        )
+
+    @functools.cached_property
+    def _by_position(self) -> _Overlaid:
+        positions = _Overlaid(self._base._by_position)
+        for code in self._suppressed:
+            if code in self._base:
+                positions[self._base.index_of(code)] = None
+        for code, entry in self._overlay.items():
+            positions[self.index_of(code)] = entry
+        return positions
+
+    @functools.cached_property
+    def _universe(self) -> int:
+        overlaid = _bitmap(
+            (self.index_of(code) for code in self._overlay), self._positions
+        )
+        return (self._base._universe & ~self._hidden) | overlaid
+
+    def _build_index(self, attr: str) -> dict[Any, MICSet]:
+        hidden = self._hidden
+        bits = {
+            key: found._bits & ~hidden
+            for key, found in self._base._index(attr).items()
+        }
+        for code, e in self._overlay.items():
+            key = self._key(e, attr)
+            bits[key] = bits.get(key, 0) | (1 << self.index_of(code))
+        return {
+            key: MICSet._from_bits(self, value)
+            for key, value in bits.items() if value
+        }
+
+    @functools.cached_property
+    def _aliases(self) -> dict[str, tuple[MICEntry, ...]]:
+        hidden = self._suppressed | self._overlay.keys()
+        aliases = {
+            alias: tuple(e for e in group if e.mic not in hidden)
+            for alias, group in self._base._aliases.items()
+        }
+        for entry in self._overlay.values():
+            for alias in _aliases(entry):
+                aliases[alias] = aliases.get(alias, ()) + (entry,)
+        return {alias: group for alias, group in aliases.items() if group}
+
+    @functools.cached_property
+    def _by_buffer(self) -> dict[int, MICEntry]:
+        # overlay entries only, the base is looked up after them
+        by_buffer: dict[int, MICEntry] = dict()
+        for code, entry in self._overlay.items():
+            for raw in (code, code.lower()):
+                by_buffer[int.from_bytes(raw.encode("ascii"), "big")] = entry
+        return by_buffer
+
+    @functools.cached_property
+    def by_packed(self) -> Mapping[int, MICEntry]:
+        """Entries keyed by their packed code (see `encode_mic`)."""
+        return _PackedOverlay(self)
+
+    def get_bytes(
+        self,
+        buf: Union[bytes, bytearray, memoryview],
+        default: Union[_T, None] = None,
+    ) -> Union[MICEntry, _T, None]:
+        entry = super().get_bytes(buf)
+        if entry is None:
+            entry = self._base.get_bytes(buf)
+            if entry is None or entry.mic in self._suppressed:
+                return default
+        return entry
+
+
+class _Release(MICRegistry):
+    """A release of a `_History`, looked up in the versions the history
+    keeps of each MIC rather than copied from the previous release. Lookup
+    tables over every entry (see `MICRegistry`) are built from a snapshot
+    taken on first use.
+
+    """
+    _history: "_History"
+    _release: int
+    _count: int
+
+    def __init__(self, history: "_History", release: int) -> None:
+        self._history = history
+        self._release = release
+        self._count = history._counts[release]
+        self._alias_table = None
+
+    def __getitem__(self, code: Union[str, bytes]) -> MICEntry:
+        versions = self._history._versions
+        found = versions.get(code)  # type: ignore[arg-type]
+        if found is None:
+            found = versions[_key_of(code)]
+        # latest version first, few MICs have more than one or two
+        for release, entry in reversed(found):
+            if release <= self._release:
+                return entry
+        raise KeyError(code)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._history._codes[:self._count])
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def _positions(self) -> int:
+        return self._count
+
+    @functools.cached_property
+    def _entries(self) -> dict[str, MICEntry]:  # type: ignore[override]
+        return {code: self[code] for code in self}
+
+
+class _History:
+    """The releases of a history file (see `_build.build_history`).
+
+    Releases are applied in order on first use, and every version of each
+    MIC is kept along with the release it was made in. A release is then a
+    view over those versions (see `_Release`), so applying one costs as
+    much as its changes, and unchanged entries are shared between
+    releases.
+
+    """
+    def __init__(self, encoded: bytes) -> None:
+        if encoded[:4] != _HISTORY_MAGIC:
+            raise ValueError("not a history file")
+        if encoded[4] != _HISTORY_VERSION:
+            raise ValueError(
+                f"unsupported history file version {encoded[4]}"
+            )
+
+        self._encoded = encoded
+        self.dates: list[datetime.date] = []
+        self._offsets: list[int] = []
+        self._releases: list[Union[MICRegistry, None]] = []
+
+        # the versions of each MIC as (release, entry) pairs, the MICs in
+        # order of appearance, and how many of them each applied release has
+        self._versions: dict[str, list[tuple[int, MICEntry]]] = dict()
+        self._codes: list[str] = []
+        self._counts: list[int] = []
+
+        # the entries of the latest applied release, and the segments of
+        # each operating MIC in it
+        self._latest: dict[str, MICEntry] = dict()
+        self._segments: dict[str, set[str]] = dict()
+
+        # index the releases, skipping over their operations
+        with io.BytesIO(encoded) as buf:
+            buf.seek(5)
+            for _ in range(_Deserializer._v(buf)):
+                self.dates.append(_Deserializer._d(buf))
+                self._offsets.append(buf.tell())
+                self._releases.append(None)
+                buf.seek(_Deserializer._v(buf) + buf.tell())
+
+    def _apply(self, release: int) -> None:
+        # apply the next release on top of the latest one
+        latest = self._latest
+        with io.BytesIO(self._encoded) as buf:
+            buf.seek(self._offsets[release])
+            _Deserializer._v(buf)  # size of the operations
+            changed = _Deserializer.apply_ops(
+                buf, _DELTA_VERSION, latest, repoint=False
+            )
+        changed = list(dict.fromkeys(changed))
+
+        versions = self._versions
+        segments = self._segments
+        for code in changed:
+            previous = versions.get(code)
+            if previous is not None and previous[-1][1].operating_mic:
+                segments[previous[-1][1].operating_mic.mic].discard(code)
+            op_mic = latest[code].operating_mic
+            if op_mic is not None:
+                segments.setdefault(op_mic.mic, set()).add(code)
+
+        # point the segments of replaced operating MICs at the new entries
+        # (the loop also visits the segments it appends, for deeper chains)
+        for code in changed:
+            for segment in segments.get(code, ()):
+                if latest[segment].operating_mic is not latest[code]:
+                    latest[segment] = dataclasses.replace(
+                        latest[segment], operating_mic=latest[code]
+                    )
+                    changed.append(segment)
+
+        for code in dict.fromkeys(changed):
+            if code not in versions:
+                versions[code] = []
+                self._codes.append(code)
+            versions[code].append((release, latest[code]))
+        self._counts.append(len(self._codes))
+
+    def release(self, index: int) -> MICRegistry:
+        registry = self._releases[index]
+        if registry is None:
+            while len(self._counts) <= index:
+                self._apply(len(self._counts))
+            registry = self._releases[index] = _Release(self, index)
+        return registry
+
+    def as_of(self, date: datetime.date) -> MICRegistry:
+        index = bisect.bisect_right(self.dates, date) - 1
+        if index < 0:
+            raise LookupError(f"No release on or before {date}")
+        return self.release(index)
+
+
+def _load_registry(
+    data: pathlib.Path, deltas: Sequence[pathlib.Path] = ()
+) -> tuple[MICRegistry, bytes]:
+    # deserialize data file
+    mics, digest, aliases = _Deserializer.read(data.read_bytes())
+
+    # apply deltas on top of the base data, chaining their digests onto
+    # that of the data file
+    fingerprint = digest
+    for delta in deltas:
+        try:
+            encoded = delta.read_bytes()
+            with io.BytesIO(encoded) as infile:
+                patched = _Deserializer.apply_delta(infile, digest, mics)
+        except (OSError, ValueError, KeyError, IndexError) as e:
+            warnings.warn(f"Ignoring delta file {str(delta)!r}: {e}")
+            continue
+        if patched is None:
+            warnings.warn(
+                f"Ignoring delta file {str(delta)!r}: made against a "
+                "different base"
+            )
+            continue
+        mics = patched
+        fingerprint = _digest(fingerprint + _digest(encoded))
+        # comments may have changed, aliases are extracted when needed
+        aliases = None
+
+    return MICRegistry._wrap(mics, aliases), fingerprint
+
+
+_REGISTRY: MICRegistry
+_REGISTRY, _FINGERPRINT = _load_registry(
+    pathlib.Path(__file__).parent / "_data",
+    [
+        pathlib.Path(path)
+        for path in os.environ.get(_DELTA_ENV, "").split(os.pathsep)
+        if path
+    ],
+)
+
+
+def data_fingerprint() -> str:
+    """Get a hex digest identifying the loaded data: the content digest
+    in the header of the data file, or, if delta files were applied, that
+    digest chained with the content digest of every applied delta.
+
+    """
+    return _FINGERPRINT.hex()
+
+
+# `MIC` (and the lookups below) are a view of the default registry
+MIC = enum.Enum(  # type: ignore[misc]
+    "MIC",
+    {_Deserializer._format_mic(k): v for k, v in _REGISTRY.items()},
+)
+_MEMBERS: dict[str, MIC] = {member.value.mic: member for member in MIC}
+
+
+MIC_BY_PACKED: dict[int, MIC] = {
+    packed: _MEMBERS[e.mic] for packed, e in _REGISTRY.by_packed.items()
+}
+
+
+# positions keyed by upper and lower case codes (see `MICRegistry.is_mic`)
+_BY_CODE = _REGISTRY._by_code
+
+
+def is_mic(code: Union[str, bytes]) -> bool:
+    """Check whether `code` (a `str` or `bytes` object, in any case) is a
+    MIC.
+
+    """
+    if code in _BY_CODE:
+        return True
+    try:
+        # mixed case
+        return code.upper() in _BY_CODE
+    except AttributeError:
+        return False
+
+
+def index_of(code: Union[str, bytes]) -> int:
+    """Get the position of the MIC `code` in the data file (which is also
+    its position in `MIC`).
+
+    """
+    return _REGISTRY.index_of(code)
+
+
+# raw (upper and lower case) codes packed without normalization, so that
+# buffers can be looked up without creating any intermediate objects
+_MIC_BY_BUFFER: dict[int, MIC] = {
+    packed: _MEMBERS[e.mic] for packed, e in _REGISTRY._by_buffer.items()
+}
+
+
+def get_bytes(
+    buf: Union[bytes, bytearray, memoryview],
+    default: Union[_T, None] = None,
+) -> Union[MIC, _T, None]:
+    """Get the `MIC` member for a MIC code given as a bytes-like object
+    (e.g. a field of a raw FIX or ITCH message), or `default` if it is not
+    a MIC.
+
+    """
+    if len(buf) != 4:
+        return default
+    member = _MIC_BY_BUFFER.get(int.from_bytes(buf, "big"))
+    if member is None:
+        # mixed case
+        member = _MIC_BY_BUFFER.get(int.from_bytes(bytes(buf).upper(), "big"))
+    return default if member is None else member
+
+
+def lookup_bytes(buf: Union[bytes, bytearray, memoryview]) -> MIC:
+    """Like `get_bytes`, but raises `KeyError` if `buf` is not a MIC."""
+    member = get_bytes(buf)
+    if member is None:
+        raise KeyError(bytes(buf))
+    return member
+
+
+def current_equivalent(code: str) -> MIC:
+    """Get the `MIC` member that `code` was (possibly indirectly) replaced
+    by, or that of `code` itself (see `MICRegistry.current_equivalent`).
+
+    """
+    return _MEMBERS[_REGISTRY.current_equivalent(code).mic]
+
+
+def current_equivalents(
+    codes: Iterable[str], default: Union[_T, None] = None
+) -> list[Union[MIC, _T, None]]:
+    """Like `current_equivalent`, for many codes at once. Unknown codes get
+    `default`.
+
+    """
+    return [
+        default if e is None else _MEMBERS[e.mic]
+        for e in _REGISTRY.current_equivalents(codes)
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def _history() -> _History:
+    path = pathlib.Path(__file__).parent / "_history"
+    if path.exists():
+        return _History(path.read_bytes())
+
+    # without a packaged history, the packaged data is the only release,
+    # dated by its most recent change
+    history = _History(_HISTORY_MAGIC + bytes((_HISTORY_VERSION, 0)))
+    history.dates.append(max(
+        max(e.creation_date, e.last_update_date or e.creation_date)
+        for e in _REGISTRY.values()
+    ))
+    history._releases.append(_REGISTRY)
+    return history
+
+
+@functools.lru_cache(maxsize=None)
+def _history_file(path: str) -> _History:
+    return _History(pathlib.Path(path).read_bytes())
+
+
+def as_of(
+    date: datetime.date,
+    history: Union[str, os.PathLike, None] = None,
+) -> MICRegistry:
+    """Get the registry as it was in the latest release on or before
+    `date`, from the history file at `history`, or by default from a
+    `_history` file next to the packaged data. No history is packaged, so
+    without one the packaged data is the only release. Releases are
+    applied on first use, each costing as much as its changes.
+
+    """
+    if history is None:
+        return _history().as_of(date)
+    return _history_file(os.fspath(history)).as_of(date)
+
+
+def load_data(path: Union[str, os.PathLike, bytes]) -> MICRegistry:
+    """Load a data file (its path or contents) into a registry, without
+    touching the packaged data. Files with a header are checked against
+    their digest, so truncated or corrupted files raise `ValueError`.
+
+    """
+    if not isinstance(path, bytes):
+        path = pathlib.Path(path).read_bytes()
+    if not path:
+        raise ValueError("empty data file")
+    version, _, digest, offset = _data_header(path)
+    if version and _digest(path[offset:]) != digest:
+        raise ValueError("data file does not match its digest")
+    mics, _, aliases = _Deserializer.read(path)
+    return MICRegistry._wrap(mics, aliases)
 
-    # create and return enum
-    return enum.Enum("MIC", mics)
 
+def load_csv(
+    path: Union[str, os.PathLike], stream: bool = False
+) -> MICRegistry:
+    """Parse an ISO 10383 CSV file (as published at
+    https://www.iso20022.org/market-identifier-codes) into a registry,
+    without rebuilding the package. See `Parser.parse` for `stream`.
 
-globals()["MIC"] = _build_mic(pathlib.Path(__file__).parent / "_data")
+    """
+    return MICRegistry(Parser.parse(path, stream=stream))
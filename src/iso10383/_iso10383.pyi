@@ -0,0 +1,3803 @@
+# Generated by _build.py, do not edit.
+
+import io
+import os
+import re
+import csv
+import sys
+import enum
+import array
+import bisect
+import hashlib
+import pathlib
+import warnings
+import datetime
+import functools
+import dataclasses
+import collections.abc
+from typing import Any, BinaryIO, TypeVar, Union
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+
+if sys.version_info >= (3, 11):
+    from typing import Self
+else:
+    from typing_extensions import Self
+
+_T = TypeVar('_T')
+
+_E = TypeVar('_E', bound=enum.Enum)
+
+class MCC(enum.Enum):
+    """Market Category Code (MCC)"""
+    appa = 0
+    atss = 1
+    casp = 2
+    dcms = 3
+    idqs = 4
+    mltf = 5
+    nspd = 6
+    otfs = 7
+    othr = 8
+    rmkt = 9
+    rmos = 10
+    sefs = 11
+    sint = 12
+    trfs = 13
+
+class ISOCC(enum.Enum):
+    """ISO Country Code"""
+    ae = 0
+    ag = 1
+    al = 2
+    am = 3
+    ao = 4
+    ar = 5
+    at = 6
+    au = 7
+    az = 8
+    ba = 9
+    bb = 10
+    bd = 11
+    be = 12
+    bg = 13
+    bh = 14
+    bm = 15
+    bo = 16
+    br = 17
+    bs = 18
+    bw = 19
+    by = 20
+    ca = 21
+    ch = 22
+    ci = 23
+    cl = 24
+    cm = 25
+    cn = 26
+    co = 27
+    cr = 28
+    cv = 29
+    cw = 30
+    cy = 31
+    cz = 32
+    de = 33
+    dk = 34
+    do = 35
+    dz = 36
+    ec = 37
+    ee = 38
+    eg = 39
+    es = 40
+    fi = 41
+    fj = 42
+    fo = 43
+    fr = 44
+    gb = 45
+    ge = 46
+    gg = 47
+    gh = 48
+    gi = 49
+    gr = 50
+    gt = 51
+    gy = 52
+    hk = 53
+    hn = 54
+    hr = 55
+    hu = 56
+    id = 57
+    ie = 58
+    il = 59
+    in_ = 60
+    iq = 61
+    ir = 62
+    is_ = 63
+    it = 64
+    jm = 65
+    jo = 66
+    jp = 67
+    ke = 68
+    kg = 69
+    kh = 70
+    kn = 71
+    kr = 72
+    kw = 73
+    ky = 74
+    kz = 75
+    la = 76
+    lb = 77
+    li = 78
+    lk = 79
+    lt = 80
+    lu = 81
+    lv = 82
+    ly = 83
+    ma = 84
+    md = 85
+    me = 86
+    mg = 87
+    mk = 88
+    mn = 89
+    mt = 90
+    mu = 91
+    mv = 92
+    mw = 93
+    mx = 94
+    my = 95
+    mz = 96
+    na = 97
+    ng = 98
+    ni = 99
+    nl = 100
+    no = 101
+    np = 102
+    nz = 103
+    om = 104
+    pa = 105
+    pe = 106
+    pg = 107
+    ph = 108
+    pk = 109
+    pl = 110
+    ps = 111
+    pt = 112
+    py = 113
+    qa = 114
+    ro = 115
+    rs = 116
+    ru = 117
+    rw = 118
+    sa = 119
+    sc = 120
+    sd = 121
+    se = 122
+    sg = 123
+    si = 124
+    sk = 125
+    sv = 126
+    sy = 127
+    sz = 128
+    th = 129
+    tn = 130
+    tr = 131
+    tt = 132
+    tw = 133
+    tz = 134
+    ua = 135
+    ug = 136
+    us = 137
+    uy = 138
+    uz = 139
+    vc = 140
+    ve = 141
+    vn = 142
+    vu = 143
+    za = 144
+    zm = 145
+    zw = 146
+    zz = 147
+    vg = 148
+
+class _City(int):
+    _name: str
+
+    def __new__(cls, id: int, name: str) -> Self:
+        ...
+
+    @property
+    def name(self) -> str:
+        ...
+
+class City(enum.Enum):
+    aabenraa = _City(0, 'Aabenraa')
+    aalborg = _City(1, 'Aalborg')
+    abidjan = _City(2, 'Abidjan')
+    abu_dhabi = _City(3, 'Abu Dhabi')
+    accra = _City(4, 'Accra')
+    ahmedabad = _City(5, 'Ahmedabad')
+    aichi = _City(6, 'Aichi')
+    alberta = _City(7, 'Alberta')
+    algiers = _City(8, 'Algiers')
+    almaty = _City(9, 'Almaty')
+    amman = _City(10, 'Amman')
+    amsterdam = _City(11, 'Amsterdam')
+    ankara = _City(12, 'Ankara')
+    antananarivo = _City(13, 'Antananarivo')
+    antwerpen = _City(14, 'Antwerpen')
+    astana = _City(15, 'Astana')
+    asti = _City(16, 'Asti')
+    asuncion = _City(17, 'Asuncion')
+    athens = _City(18, 'Athens')
+    atlanta = _City(19, 'Atlanta')
+    auckland = _City(20, 'Auckland')
+    aylesbury = _City(21, 'Aylesbury')
+    baghdad = _City(22, 'Baghdad')
+    baku = _City(23, 'Baku')
+    bangalore = _City(24, 'Bangalore')
+    bangkok = _City(25, 'Bangkok')
+    banja_luka = _City(26, 'Banja Luka')
+    barcelona = _City(27, 'Barcelona')
+    basseterre = _City(28, 'Basseterre')
+    bedminster = _City(29, 'Bedminster')
+    beijing = _City(30, 'Beijing')
+    beirut = _City(31, 'Beirut')
+    belgrade = _City(32, 'Belgrade')
+    bergamo = _City(33, 'Bergamo')
+    bergen = _City(34, 'Bergen')
+    berlin = _City(35, 'Berlin')
+    bermuda = _City(36, 'Bermuda')
+    berne = _City(37, 'Berne')
+    biella = _City(38, 'Biella')
+    bilbao = _City(39, 'Bilbao')
+    bishkek = _City(40, 'Bishkek')
+    blantyre = _City(41, 'Blantyre')
+    boca_raton = _City(42, 'Boca Raton')
+    bogota = _City(43, 'Bogota')
+    bologna = _City(44, 'Bologna')
+    boston = _City(45, 'Boston')
+    bradford = _City(46, 'Bradford')
+    bratislava = _City(47, 'Bratislava')
+    bremen = _City(48, 'Bremen')
+    bridgetown = _City(49, 'Bridgetown')
+    brussels = _City(50, 'Brussels')
+    bryanston_sandton = _City(51, 'Bryanston - Sandton')
+    bucharest = _City(52, 'Bucharest')
+    budaors = _City(53, 'Budaors')
+    budapest = _City(54, 'Budapest')
+    buenos_aires = _City(55, 'Buenos Aires')
+    cairo = _City(56, 'Cairo')
+    calcutta = _City(57, 'Calcutta')
+    calgary = _City(58, 'Calgary')
+    caracas = _City(59, 'Caracas')
+    casablanca = _City(60, 'Casablanca')
+    charlotte = _City(61, 'Charlotte')
+    chatham = _City(62, 'Chatham')
+    chicago = _City(63, 'Chicago')
+    chisinau = _City(64, 'Chisinau')
+    chittagong = _City(65, 'Chittagong')
+    chiyoda_ku = _City(66, 'Chiyoda-Ku')
+    cluj_napoca = _City(67, 'Cluj Napoca')
+    colombo = _City(68, 'Colombo')
+    copenhagen = _City(69, 'Copenhagen')
+    cordoba = _City(70, 'Cordoba')
+    corrientes = _City(71, 'Corrientes')
+    curitiba = _City(72, 'Curitiba')
+    cybercity_ebene = _City(73, 'Cybercity, Ebene')
+    dalian = _City(74, 'Dalian')
+    damascus = _City(75, 'Damascus')
+    dar_es_salaam = _City(76, 'Dar Es Salaam')
+    delhi = _City(77, 'Delhi')
+    dhaka = _City(78, 'Dhaka')
+    dnipropetrovsk = _City(79, 'Dnipropetrovsk')
+    doha = _City(80, 'Doha')
+    douala = _City(81, 'Douala')
+    dubai = _City(82, 'Dubai')
+    dublin = _City(83, 'Dublin')
+    duesseldorf = _City(84, 'Duesseldorf')
+    ebene = _City(85, 'Ebene')
+    ebene_city = _City(86, 'Ebene City')
+    eden_island = _City(87, 'Eden Island')
+    edinburgh = _City(88, 'Edinburgh')
+    ekaterinburg = _City(89, 'Ekaterinburg')
+    el_salvador = _City(90, 'El Salvador')
+    esch_sur_alzette = _City(91, 'Esch-Sur-Alzette')
+    eschborn = _City(92, 'Eschborn')
+    espirito_santo = _City(93, 'Espirito Santo')
+    espoo = _City(94, 'Espoo')
+    fiac = _City(95, 'Fiac')
+    firenze = _City(96, 'Firenze')
+    florence = _City(97, 'Florence')
+    frankfurt = _City(98, 'Frankfurt')
+    frankfurt_am_main = _City(99, 'Frankfurt Am Main')
+    fukuoka = _City(100, 'Fukuoka')
+    gaborone = _City(101, 'Gaborone')
+    gandhinagar = _City(102, 'Gandhinagar')
+    geneva = _City(103, 'Geneva')
+    genova = _City(104, 'Genova')
+    georgetown = _City(105, 'Georgetown')
+    gibraltar = _City(106, 'Gibraltar')
+    gift_city_gandhinagar = _City(107, 'Gift City, Gandhinagar')
+    glenview = _City(108, 'Glenview')
+    great_neck = _City(109, 'Great Neck')
+    greenwich = _City(110, 'Greenwich')
+    grindsted = _City(111, 'Grindsted')
+    guatemala = _City(112, 'Guatemala')
+    guayaquil = _City(113, 'Guayaquil')
+    guaynabo = _City(114, 'Guaynabo')
+    guildford = _City(115, 'Guildford')
+    hamburg = _City(116, 'Hamburg')
+    hamilton = _City(117, 'Hamilton')
+    hannover = _City(118, 'Hannover')
+    hanoi = _City(119, 'Hanoi')
+    harare = _City(120, 'Harare')
+    helsinki = _City(121, 'Helsinki')
+    hiroshima = _City(122, 'Hiroshima')
+    ho_chi_minh_city = _City(123, 'Ho Chi Minh City')
+    hong_kong = _City(124, 'Hong Kong')
+    horsens = _City(125, 'Horsens')
+    hove = _City(126, 'Hove')
+    illinois = _City(127, 'Illinois')
+    indore_madhya_pradesh = _City(128, 'Indore Madhya Pradesh')
+    islamabad = _City(129, 'Islamabad')
+    istanbul = _City(130, 'Istanbul')
+    izmir = _City(131, 'Izmir')
+    jaen = _City(132, 'Jaen')
+    jakarta = _City(133, 'Jakarta')
+    jersey_city = _City(134, 'Jersey City')
+    johannesburg = _City(135, 'Johannesburg')
+    kampala = _City(136, 'Kampala')
+    kansas_city = _City(137, 'Kansas City')
+    karachi = _City(138, 'Karachi')
+    kathmandu = _City(139, 'Kathmandu')
+    kharkov = _City(140, 'Kharkov')
+    khartoum = _City(141, 'Khartoum')
+    kiel = _City(142, 'Kiel')
+    kiev = _City(143, 'Kiev')
+    kigali = _City(144, 'Kigali')
+    kingston = _City(145, 'Kingston')
+    kingstown = _City(146, 'Kingstown')
+    klagenfurt_am_woerthersee = _City(147, 'Klagenfurt Am Woerthersee')
+    kobe = _City(148, 'Kobe')
+    kongsvinger = _City(149, 'Kongsvinger')
+    krakow = _City(150, 'Krakow')
+    kuala_lumpur = _City(151, 'Kuala Lumpur')
+    kuwait = _City(152, 'Kuwait')
+    kyoto = _City(153, 'Kyoto')
+    la_paz = _City(154, 'La Paz')
+    labuan = _City(155, 'Labuan')
+    lagos = _City(156, 'Lagos')
+    lahore = _City(157, 'Lahore')
+    lane_cove = _City(158, 'Lane Cove')
+    lao = _City(159, 'Lao')
+    larnaca = _City(160, 'Larnaca')
+    leipzig = _City(161, 'Leipzig')
+    lenexa = _City(162, 'Lenexa')
+    leuven = _City(163, 'Leuven')
+    lima = _City(164, 'Lima')
+    limassol = _City(165, 'Limassol')
+    linz = _City(166, 'Linz')
+    lisbon = _City(167, 'Lisbon')
+    ljubljana = _City(168, 'Ljubljana')
+    london = _City(169, 'London')
+    los_angeles = _City(170, 'Los Angeles')
+    luanda = _City(171, 'Luanda')
+    lusaka = _City(172, 'Lusaka')
+    luxembourg = _City(173, 'Luxembourg')
+    luzern = _City(174, 'Luzern')
+    madras = _City(175, 'Madras')
+    madrid = _City(176, 'Madrid')
+    makati_city = _City(177, 'Makati City')
+    male = _City(178, 'Male')
+    managua = _City(179, 'Managua')
+    manama = _City(180, 'Manama')
+    manila = _City(181, 'Manila')
+    maputo = _City(182, 'Maputo')
+    maringa = _City(183, 'Maringa')
+    mbabane = _City(184, 'Mbabane')
+    melbourne = _City(185, 'Melbourne')
+    mendoza = _City(186, 'Mendoza')
+    mexico = _City(187, 'Mexico')
+    miami = _City(188, 'Miami')
+    milan = _City(189, 'Milan')
+    minneapolis = _City(190, 'Minneapolis')
+    minsk = _City(191, 'Minsk')
+    montevideo = _City(192, 'Montevideo')
+    montreal = _City(193, 'Montreal')
+    moorpark = _City(194, 'Moorpark')
+    moscow = _City(195, 'Moscow')
+    mount_pleasant = _City(196, 'Mount Pleasant')
+    muenchen = _City(197, 'Muenchen')
+    mumbai = _City(198, 'Mumbai')
+    munich = _City(199, 'Munich')
+    muscat = _City(200, 'Muscat')
+    nablus = _City(201, 'Nablus')
+    nacka = _City(202, 'Nacka')
+    nagoya = _City(203, 'Nagoya')
+    nairobi = _City(204, 'Nairobi')
+    narberth = _City(205, 'Narberth')
+    nasau = _City(206, 'Nasau')
+    new_jersey = _City(207, 'New Jersey')
+    new_york = _City(208, 'New York')
+    new_york_ny = _City(209, 'New York, Ny')
+    newcastle = _City(210, 'Newcastle')
+    nicosia = _City(211, 'Nicosia')
+    nicosia_lefkosia = _City(212, 'Nicosia (Lefkosia)')
+    nigita = _City(213, 'Nigita')
+    nizhniy_novgorod = _City(214, 'Nizhniy Novgorod')
+    north_bergen = _City(215, 'North Bergen')
+    not_applicable = _City(216, 'Not Applicable')
+    novosibirsk = _City(217, 'Novosibirsk')
+    nyon = _City(218, 'Nyon')
+    odessa = _City(219, 'Odessa')
+    oldenburg = _City(220, 'Oldenburg')
+    osaka = _City(221, 'Osaka')
+    oslo = _City(222, 'Oslo')
+    oststeinbek = _City(223, 'Oststeinbek')
+    padova = _City(224, 'Padova')
+    palma_de_mallorca = _City(225, 'Palma De Mallorca')
+    panama = _City(226, 'Panama')
+    paris = _City(227, 'Paris')
+    pasig_city = _City(228, 'Pasig City')
+    philadelphia = _City(229, 'Philadelphia')
+    phnom_penh = _City(230, 'Phnom Penh')
+    phoenix = _City(231, 'Phoenix')
+    podgorica = _City(232, 'Podgorica')
+    polokwane = _City(233, 'Polokwane')
+    port_louis = _City(234, 'Port Louis')
+    port_moresby = _City(235, 'Port Moresby')
+    port_of_spain = _City(236, 'Port Of Spain')
+    port_vila = _City(237, 'Port Vila')
+    porto = _City(238, 'Porto')
+    prague = _City(239, 'Prague')
+    praia = _City(240, 'Praia')
+    princeton = _City(241, 'Princeton')
+    purchase = _City(242, 'Purchase')
+    quito = _City(243, 'Quito')
+    randers = _City(244, 'Randers')
+    red_bank = _City(245, 'Red Bank')
+    regensburg = _City(246, 'Regensburg')
+    reggio_emilia = _City(247, 'Reggio Emilia')
+    reykjavik = _City(248, 'Reykjavik')
+    riga = _City(249, 'Riga')
+    rio_de_janeiro = _City(250, 'Rio De Janeiro')
+    riyadh = _City(251, 'Riyadh')
+    rodgau = _City(252, 'Rodgau')
+    rome = _City(253, 'Rome')
+    rosario = _City(254, 'Rosario')
+    rostov = _City(255, 'Rostov')
+    s_hertogenbosch = _City(256, 'S-Hertogenbosch')
+    sabadell = _City(257, 'Sabadell')
+    saint_petersburg = _City(258, 'Saint-Petersburg')
+    salzburg = _City(259, 'Salzburg')
+    samara = _City(260, 'Samara')
+    san_carlos = _City(261, 'San Carlos')
+    san_francisco = _City(262, 'San Francisco')
+    san_jose = _City(263, 'San Jose')
+    san_pedro_sula = _City(264, 'San Pedro Sula')
+    santa_fe = _City(265, 'Santa Fe')
+    santander = _City(266, 'Santander')
+    santiago = _City(267, 'Santiago')
+    santo_domingo = _City(268, 'Santo Domingo')
+    sao_paulo = _City(269, 'Sao Paulo')
+    sapporo = _City(270, 'Sapporo')
+    sarajevo = _City(271, 'Sarajevo')
+    schwerin = _City(272, 'Schwerin')
+    sea_girt = _City(273, 'Sea Girt')
+    seoul = _City(274, 'Seoul')
+    shanghai = _City(275, 'Shanghai')
+    shenzhen = _City(276, 'Shenzhen')
+    shimonoseki = _City(277, 'Shimonoseki')
+    sibiu = _City(278, 'Sibiu')
+    silkeborg = _City(279, 'Silkeborg')
+    singapore = _City(280, 'Singapore')
+    skopje = _City(281, 'Skopje')
+    sliema = _City(282, 'Sliema')
+    sofia = _City(283, 'Sofia')
+    split = _City(284, 'Split')
+    st_albans = _City(285, 'St Albans')
+    st_john = _City(286, 'St John')
+    st_peter_port = _City(287, 'St. Peter Port')
+    stamford = _City(288, 'Stamford')
+    stockholm = _City(289, 'Stockholm')
+    stuttgart = _City(290, 'Stuttgart')
+    surabaya = _City(291, 'Surabaya')
+    suva = _City(292, 'Suva')
+    sydney = _City(293, 'Sydney')
+    taipei = _City(294, 'Taipei')
+    taiwan = _City(295, 'Taiwan')
+    tallinn = _City(296, 'Tallinn')
+    tashkent = _City(297, 'Tashkent')
+    tbilisi = _City(298, 'Tbilisi')
+    tegucigalpa = _City(299, 'Tegucigalpa')
+    tehran = _City(300, 'Tehran')
+    tel_aviv = _City(301, 'Tel Aviv')
+    the_hague = _City(302, 'The Hague')
+    the_woodlands = _City(303, 'The Woodlands')
+    tirana = _City(304, 'Tirana')
+    tokyo = _City(305, 'Tokyo')
+    torino = _City(306, 'Torino')
+    toronto = _City(307, 'Toronto')
+    torshavn = _City(308, 'Torshavn')
+    tripoli = _City(309, 'Tripoli')
+    tromso = _City(310, 'Tromso')
+    trondheim = _City(311, 'Trondheim')
+    tucuman = _City(312, 'Tucuman')
+    tunis = _City(313, 'Tunis')
+    ulaan_baatar = _City(314, 'Ulaan Baatar')
+    unterschleisshem = _City(315, 'Unterschleisshem')
+    utrecht = _City(316, 'Utrecht')
+    vaduz = _City(317, 'Vaduz')
+    valencia = _City(318, 'Valencia')
+    valletta = _City(319, 'Valletta')
+    valparaiso = _City(320, 'Valparaiso')
+    vancouver = _City(321, 'Vancouver')
+    varazdin = _City(322, 'Varazdin')
+    victoria = _City(323, 'Victoria')
+    victoria_falls = _City(324, 'Victoria Falls')
+    vienna = _City(325, 'Vienna')
+    vila = _City(326, 'Vila')
+    vilnius = _City(327, 'Vilnius')
+    vladivostok = _City(328, 'Vladivostok')
+    warsaw = _City(329, 'Warsaw')
+    washington = _City(330, 'Washington')
+    washington_new_york = _City(331, 'Washington/New York')
+    willemstad = _City(332, 'Willemstad')
+    wilmington = _City(333, 'Wilmington')
+    windhoek = _City(334, 'Windhoek')
+    winnipeg = _City(335, 'Winnipeg')
+    winter_park = _City(336, 'Winter Park')
+    wroclaw = _City(337, 'Wroclaw')
+    wuxi = _City(338, 'Wuxi')
+    yerevan = _City(339, 'Yerevan')
+    zagreb = _City(340, 'Zagreb')
+    zaragoza = _City(341, 'Zaragoza')
+    zhengzhou = _City(342, 'Zhengzhou')
+    zilina = _City(343, 'Zilina')
+    zurich = _City(344, 'Zurich')
+    milton_keynes = _City(345, 'Milton Keynes')
+    hradec_kralove = _City(346, 'Hradec Kralove')
+    zug = _City(347, 'Zug')
+    tortola = _City(348, 'Tortola')
+    value: _City
+
+    def __new__(cls, value: _City) -> Self:
+        ...
+
+class Status(enum.Enum):
+    active = 0
+    expired = 1
+    updated = 2
+
+@dataclasses.dataclass(frozen=True)
+class MICEntry:
+    """Represents a single MIC entry"""
+    mic: str
+    market_name: str
+    market_category_code: MCC
+    creation_date: datetime.date
+    status: Status
+    city: Union[City, None] = None
+    operating_mic: Union['MICEntry', None] = None
+    institution_description: Union[str, None] = None
+    legel_entity_name: Union[str, None] = None
+    legal_entity_identifier: Union[str, None] = None
+    acronym: Union[str, None] = None
+    iso_country_code: Union[ISOCC, None] = None
+    website: Union[str, None] = None
+    last_update_date: Union[datetime.date, None] = None
+    last_validation_date: Union[datetime.date, None] = None
+    expiry_date: Union[datetime.date, None] = None
+    comments: Union[str, None] = None
+
+def _is_expired(entry: MICEntry, as_of: datetime.date) -> bool:
+    """Check whether `entry` is no longer in use as of `as_of`: its status
+    is `Status.expired`, or its expiry date has been reached.
+
+    """
+
+def encode_mic(code: Union[str, bytes]) -> int:
+    """Pack a 4-character MIC code into an unsigned 32-bit integer. The
+    code is upper-cased and packed big-endian, so packed codes sort in the
+    same order as the codes themselves.
+
+    """
+
+def decode_mic(packed: int) -> str:
+    """Unpack an integer produced by `encode_mic` into a MIC code."""
+
+def encode_mics(codes: Iterable[Union[str, bytes]]) -> array.array:
+    """Pack many MIC codes at once into an array of unsigned 32-bit
+    integers.
+
+    """
+
+def decode_mics(packed: Iterable[int]) -> list[str]:
+    """Unpack many integers produced by `encode_mic`/`encode_mics` into MIC
+    codes.
+
+    """
+
+def _data_header(data: bytes) -> tuple[int, int, bytes, int]:
+    """Parse the header of a data file, returning its format version,
+    feature flags, content digest and the offset of the entries.
+
+    The header is the magic, a 1-byte format version, 1 byte of feature
+    flags and the 16-byte digest of everything after the header. Files
+    written before the header was introduced are reported as version 0,
+    and their digest is computed. Versions 0 and 1 use fixed-size lengths
+    and a flag byte per optional field, version 2 uses varint lengths and
+    a null bitmap per record.
+
+    """
+
+class _Deserializer:
+    """Reads data, delta and history files (shared by the build and the
+    runtime).
+
+    """
+
+    @classmethod
+    def deserialize(cls, buf: BinaryIO, existing: dict[str, MICEntry]) -> tuple[str, MICEntry]:
+        ...
+
+    @classmethod
+    def deserialize_v2(cls, buf: BinaryIO, existing: dict[str, MICEntry]) -> tuple[str, MICEntry]:
+        ...
+
+    @classmethod
+    def aliases(cls, buf: BinaryIO, codes: Sequence[str]) -> dict[str, tuple[str, ...]]:
+        ...
+
+    @classmethod
+    def apply_ops(cls, buf: BinaryIO, version: int, mics: dict[str, MICEntry], records: Union[dict[str, bytes], None]=None, repoint: bool=True) -> list[str]:
+        """Apply the (count-prefixed) operations of a delta to `mics` in
+        place, returning the MICs they added or replaced. Version 1 deltas
+        hold version 1 records, version 2 deltas hold version 2 records.
+        If given, `records` is kept up to date with the serialized records
+        of added and replaced entries, and expired entries are removed from
+        it (their records are not stored).
+
+        Segments of replaced operating MICs are pointed at the new entries
+        (and returned as replaced too), unless `repoint` is false, in which
+        case that is up to the caller.
+
+        """
+
+    @classmethod
+    def apply_delta(cls, buf: BinaryIO, base_digest: bytes, mics: dict[str, MICEntry]) -> Union[dict[str, MICEntry], None]:
+        """Apply a delta file on top of `mics`, returning the patched
+        entries, or `None` if the delta was made against a different base.
+
+        """
+    _V2_SIZES = (2, 0, 0, 0, 0, 0, 1, 0, 3, 3, 3, 0)
+
+    @classmethod
+    def records(cls, encoded: bytes) -> dict[str, bytes]:
+        """Split a version 2 data file into its serialized records, keyed by
+        MIC, without decoding anything but the MICs.
+
+        """
+
+    @classmethod
+    def read(cls, encoded: bytes, records: Union[dict[str, bytes], None]=None) -> tuple[dict[str, MICEntry], bytes, Union[dict[str, tuple[str, ...]], None]]:
+        """Read a data file, returning its entries (keyed by MIC), its
+        content digest and its alias table (if it has one). The serialized record of every entry is stored in `records`
+        if given.
+
+        """
+
+class Parser:
+    """Parses the MIC sheet
+    (https://www.iso20022.org/market-identifier-codes) into `MICEntry`
+    instances.
+
+    """
+    hyphen_re = re.compile('[\\u002D\\u058A\\u05BE\\u1400\\u1806\\u2010-\\u2015\\u2E17\\u2E1A\\u2E3A\\u2E3B\\u2E40\\u301C\\u3030\\u30A0\\uFE31\\uFE32\\uFE58\\uFE63\\uFF0D]')
+    ws_re = re.compile('\\s+')
+
+    @classmethod
+    def iter_parse(cls, csv_src: Union[str, os.PathLike]) -> Iterator[MICEntry]:
+        """Parse the rows of `csv_src` as they are read, yielding each entry
+        as soon as its operating MIC has been yielded. Only segment rows
+        whose operating MIC has not been seen yet are buffered, and they
+        are yielded right after it.
+
+        """
+
+    @classmethod
+    def parse(cls, csv_src: Union[str, os.PathLike], stream: bool=False) -> tuple[MICEntry, ...]:
+        """Parse `csv_src`. By default the whole file is read up front and
+        entries keep the file order as closely as possible; with `stream`,
+        rows are processed as they are read (see `iter_parse`), so only
+        unresolved segment rows are held in memory.
+
+        """
+
+class MICSet(collections.abc.Set):
+    """An immutable set of the MICs of a registry, stored as a bitmap over
+    their positions in it (see `MICRegistry.index_of`), so that unions,
+    intersections and differences of sets of the same registry are single
+    operations over the bitmaps. Iteration yields entries in registry
+    order, and membership can be checked by code or entry.
+
+    Sets compare equal to other sets with the same MICs (by code), of any
+    registry, so they are unhashable (like `set`) to keep hashing
+    consistent with equality.
+
+    """
+    __slots__ = ('_registry', '_bits')
+    _registry: 'MICRegistry'
+    _bits: int
+
+    def __init__(self, registry: 'MICRegistry', codes: Iterable[Union[str, bytes, MICEntry]]=()) -> None:
+        ...
+
+    @classmethod
+    def from_bytes(cls, registry: 'MICRegistry', data: bytes) -> 'MICSet':
+        """Load a set of the MICs of `registry` serialized by `to_bytes`."""
+
+    def to_bytes(self) -> bytes:
+        """Serialize the set as its bitmap (one bit per position of its
+        registry, little-endian).
+
+        """
+
+    @property
+    def registry(self) -> 'MICRegistry':
+        ...
+
+    def __contains__(self, value: object) -> bool:
+        ...
+
+    def __iter__(self) -> Iterator[MICEntry]:
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+    def __bool__(self) -> bool:
+        ...
+
+    def __repr__(self) -> str:
+        ...
+
+    def __eq__(self, other: object) -> bool:
+        ...
+
+    def __le__(self, other: collections.abc.Set) -> bool:
+        ...
+
+    def __ge__(self, other: collections.abc.Set) -> bool:
+        ...
+
+    def __lt__(self, other: collections.abc.Set) -> bool:
+        ...
+
+    def __gt__(self, other: collections.abc.Set) -> bool:
+        ...
+
+    def __or__(self, other: Iterable[Any]) -> 'MICSet':
+        ...
+
+    def __and__(self, other: Iterable[Any]) -> 'MICSet':
+        ...
+
+    def __sub__(self, other: Iterable[Any]) -> 'MICSet':
+        ...
+
+    def __rsub__(self, other: Iterable[Any]) -> 'MICSet':
+        ...
+
+    def __xor__(self, other: Iterable[Any]) -> 'MICSet':
+        ...
+    __ror__ = __or__
+    __rand__ = __and__
+    __rxor__ = __xor__
+
+    def __invert__(self) -> 'MICSet':
+        """Get the MICs of the registry that are not in this set."""
+
+    def isdisjoint(self, other: Iterable[Any]) -> bool:
+        ...
+
+class MICRegistry(collections.abc.Mapping):
+    """An immutable set of MIC entries, keyed by upper case MIC code (looked
+    up case insensitively, as `str` or `bytes`). Entries keep the order
+    they were given in, which is the order `index_of` refers to. Lookup
+    tables are built on first use.
+
+    """
+    _entries: dict[str, MICEntry]
+    _alias_table: Union[dict[str, tuple[str, ...]], None]
+
+    def __init__(self, entries: Iterable[MICEntry]=()) -> None:
+        ...
+
+    def __getitem__(self, code: Union[str, bytes]) -> MICEntry:
+        ...
+
+    def __iter__(self) -> Iterator[str]:
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+    def __repr__(self) -> str:
+        ...
+
+    def overlay(self, entries: Iterable[MICEntry]=(), overrides: Union[Mapping[str, Mapping[str, Any]], None]=None, suppress: Iterable[str]=()) -> 'OverlayRegistry':
+        """Layer private entries, field overrides and suppressions over this
+        registry (see `OverlayRegistry`).
+
+        """
+
+    @classmethod
+    def default(cls) -> 'MICRegistry':
+        """Get the registry of the packaged data (with any deltas applied),
+        which `MIC` and the module-level lookups are views of.
+
+        """
+
+    def build_indexes(self) -> Self:
+        """Build every lookup table now rather than on first use (e.g.
+        before publishing a freshly loaded registry to other threads).
+
+        """
+    _INDEXED = ('iso_country_code', 'market_category_code', 'status', 'city', 'operating_mic')
+
+    def mic_set(self, codes: Iterable[Union[str, bytes, MICEntry]]=()) -> MICSet:
+        """Get a `MICSet` of (the MICs of this registry among) `codes`."""
+
+    def all(self) -> MICSet:
+        """Get a `MICSet` of every MIC of this registry."""
+
+    def by_country(self, country: ISOCC) -> MICSet:
+        """Get the entries of `country`."""
+
+    def by_category(self, category: MCC) -> MICSet:
+        """Get the entries of market category `category`."""
+
+    def by_status(self, status: Status) -> MICSet:
+        """Get the entries with status `status`."""
+
+    def by_city(self, city: City) -> MICSet:
+        """Get the entries of `city`."""
+
+    def segments(self, code: str) -> MICSet:
+        """Get the segment MICs of the operating MIC `code`."""
+
+    def operating_mics(self) -> MICSet:
+        """Get the operating MICs."""
+
+    @functools.cached_property
+    def by_packed(self) -> Mapping[int, MICEntry]:
+        """Entries keyed by their packed code (see `encode_mic`)."""
+
+    def expiring_between(self, start: datetime.date, end: datetime.date) -> list[MICEntry]:
+        """Get the entries with an expiry date between `start` and `end`
+        (inclusive), ordered by expiry date.
+
+        """
+
+    def next_expiries(self, k: int, as_of: Union[datetime.date, None]=None) -> list[MICEntry]:
+        """Get the (up to) `k` entries expiring next, on or after `as_of`
+        (defaults to today), ordered by expiry date.
+
+        """
+
+    def effective_status(self, code: str, as_of: Union[datetime.date, None]=None) -> Status:
+        """Get the status of `code` as of `as_of` (defaults to today), which
+        is `Status.expired` once its expiry date has been reached, even if
+        its status has not been updated yet.
+
+        """
+
+    def is_active(self, code: str, as_of: Union[datetime.date, None]=None) -> bool:
+        """Check whether `code` is in use as of `as_of` (defaults to today),
+        i.e. whether its effective status is not `Status.expired`.
+
+        """
+
+    def by_alias(self, name: str) -> tuple[MICEntry, ...]:
+        """Get the entries formerly known as `name` (e.g. "NYBOT"), as
+        stated in their comments. Names are matched ignoring case,
+        punctuation and a leading "THE".
+
+        """
+
+    def successor(self, code: str) -> Union[MICEntry, None]:
+        """Get the MIC that replaced `code`, if it was replaced.
+
+        Successions are taken from comments (e.g. "REPLACED BY ...", "MIC
+        TO USE IS ..."), and only count once the old MIC has expired.
+
+        """
+
+    def predecessors(self, code: str) -> tuple[MICEntry, ...]:
+        """Get the MICs that `code` directly replaced."""
+
+    def current_equivalent(self, code: str) -> MICEntry:
+        """Get the MIC that `code` was (possibly indirectly) replaced by, or
+        the entry of `code` itself if it was not replaced.
+
+        """
+
+    def current_equivalents(self, codes: Iterable[str], default: Union[_T, None]=None) -> list[Union[MICEntry, _T, None]]:
+        """Like `current_equivalent`, for many codes at once. Unknown codes
+        get `default`.
+
+        """
+
+    def equivalence_map(self) -> dict[str, str]:
+        """Get the code of the current equivalent of every replaced MIC,
+        keyed by its code (e.g. for `pandas.Series.replace`).
+
+        """
+
+    def is_mic(self, code: Union[str, bytes]) -> bool:
+        """Check whether `code` is a MIC of this registry."""
+
+    def index_of(self, code: Union[str, bytes]) -> int:
+        """Get the position of the MIC `code` in this registry."""
+
+    def get_bytes(self, buf: Union[bytes, bytearray, memoryview], default: Union[_T, None]=None) -> Union[MICEntry, _T, None]:
+        """Get the entry for a MIC code given as a bytes-like object, or
+        `default` if it is not a MIC of this registry.
+
+        """
+
+    def lookup_bytes(self, buf: Union[bytes, bytearray, memoryview]) -> MICEntry:
+        """Like `get_bytes`, but raises `KeyError` if `buf` is not a MIC of
+        this registry.
+
+        """
+
+class OverlayRegistry(MICRegistry):
+    """A registry layered over another one, chained-map style: private
+    `entries` are added, the fields of existing entries are replaced
+    (`overrides` maps MIC codes to fields and their new values) and the
+    MICs in `suppress` are hidden, without copying the base. Lookups check
+    the overlay and then the base, and indexes are merged from those of
+    the base on first use.
+
+    Entries of the base keep their positions (see `index_of`), private
+    entries are placed after them. A private entry with the code of an
+    existing entry replaces it. Segments of replaced operating MICs are
+    overlaid too, pointing at the new entries.
+
+    """
+    _base: MICRegistry
+    _overlay: dict[str, MICEntry]
+    _added: dict[str, int]
+    _suppressed: frozenset[str]
+
+    def __init__(self, base: MICRegistry, entries: Iterable[MICEntry]=(), overrides: Union[Mapping[str, Mapping[str, Any]], None]=None, suppress: Iterable[str]=()) -> None:
+        ...
+
+    def __getitem__(self, code: Union[str, bytes]) -> MICEntry:
+        ...
+
+    def __iter__(self) -> Iterator[str]:
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+    def is_mic(self, code: Union[str, bytes]) -> bool:
+        ...
+
+    def index_of(self, code: Union[str, bytes]) -> int:
+        ...
+
+    def build_indexes(self) -> Self:
+        ...
+
+    @functools.cached_property
+    def by_packed(self) -> Mapping[int, MICEntry]:
+        """Entries keyed by their packed code (see `encode_mic`)."""
+
+    def get_bytes(self, buf: Union[bytes, bytearray, memoryview], default: Union[_T, None]=None) -> Union[MICEntry, _T, None]:
+        ...
+
+_REGISTRY: MICRegistry
+
+def data_fingerprint() -> str:
+    """Get a hex digest identifying the loaded data: the content digest
+    in the header of the data file, or, if delta files were applied, that
+    digest chained with the content digest of every applied delta.
+
+    """
+
+MIC_BY_PACKED: dict[int, MIC]
+
+def is_mic(code: Union[str, bytes]) -> bool:
+    """Check whether `code` (a `str` or `bytes` object, in any case) is a
+    MIC.
+
+    """
+
+def index_of(code: Union[str, bytes]) -> int:
+    """Get the position of the MIC `code` in the data file (which is also
+    its position in `MIC`).
+
+    """
+
+def get_bytes(buf: Union[bytes, bytearray, memoryview], default: Union[_T, None]=None) -> Union[MIC, _T, None]:
+    """Get the `MIC` member for a MIC code given as a bytes-like object
+    (e.g. a field of a raw FIX or ITCH message), or `default` if it is not
+    a MIC.
+
+    """
+
+def lookup_bytes(buf: Union[bytes, bytearray, memoryview]) -> MIC:
+    """Like `get_bytes`, but raises `KeyError` if `buf` is not a MIC."""
+
+def current_equivalent(code: str) -> MIC:
+    """Get the `MIC` member that `code` was (possibly indirectly) replaced
+    by, or that of `code` itself (see `MICRegistry.current_equivalent`).
+
+    """
+
+def current_equivalents(codes: Iterable[str], default: Union[_T, None]=None) -> list[Union[MIC, _T, None]]:
+    """Like `current_equivalent`, for many codes at once. Unknown codes get
+    `default`.
+
+    """
+
+def as_of(date: datetime.date, history: Union[str, os.PathLike, None]=None) -> MICRegistry:
+    """Get the registry as it was in the latest release on or before
+    `date`, from the history file at `history`, or by default from a
+    `_history` file next to the packaged data. No history is packaged, so
+    without one the packaged data is the only release. Releases are
+    applied on first use, each costing as much as its changes.
+
+    """
+
+def load_data(path: Union[str, os.PathLike, bytes]) -> MICRegistry:
+    """Load a data file (its path or contents) into a registry, without
+    touching the packaged data. Files with a header are checked against
+    their digest, so truncated or corrupted files raise `ValueError`.
+
+    """
+
+def load_csv(path: Union[str, os.PathLike], stream: bool=False) -> MICRegistry:
+    """Parse an ISO 10383 CSV file (as published at
+    https://www.iso20022.org/market-identifier-codes) into a registry,
+    without rebuilding the package. See `Parser.parse` for `stream`.
+
+    """
+
+
+class MIC(enum.Enum):
+    value: MICEntry
+    drsp = ...
+    xcnq = ...
+    pure = ...
+    zodm = ...
+    norx = ...
+    pose = ...
+    pund = ...
+    ucbg = ...
+    xoch = ...
+    bblx = ...
+    spbe = ...
+    otcm = ...
+    frex = ...
+    idxm = ...
+    mbcp = ...
+    ocea = ...
+    osds = ...
+    ossg = ...
+    rr4g = ...
+    truk = ...
+    ugen = ...
+    cnod = ...
+    bglu = ...
+    gfam = ...
+    tmcy = ...
+    ubec = ...
+    eslo = ...
+    iotf = ...
+    seba = ...
+    ubim = ...
+    xubs = ...
+    xump = ...
+    amlg = ...
+    bred = ...
+    dbix = ...
+    rusx = ...
+    ungb = ...
+    xlqc = ...
+    xmos = ...
+    cfic = ...
+    hbfr = ...
+    klsh = ...
+    mudx = ...
+    trax = ...
+    trnl = ...
+    xpet = ...
+    levl = ...
+    ebxv = ...
+    strm = ...
+    abnc = ...
+    bnpc = ...
+    pbgr = ...
+    sidx = ...
+    sifx = ...
+    teur = ...
+    ailt = ...
+    arax = ...
+    cgxs = ...
+    midc = ...
+    rabl = ...
+    rmms = ...
+    rmmx = ...
+    ceca = ...
+    dbdc = ...
+    dbse = ...
+    dbcx = ...
+    dbcr = ...
+    jnsi = ...
+    xswx = ...
+    xdlp = ...
+    xswm = ...
+    xsls = ...
+    xseb = ...
+    xbtr = ...
+    xvtx = ...
+    xqod = ...
+    xqmh = ...
+    bnpx = ...
+    btrl = ...
+    ntuk = ...
+    eqos = ...
+    lmnr = ...
+    eqca = ...
+    equs = ...
+    evol = ...
+    stee = ...
+    bulk = ...
+    rbcc = ...
+    bebg = ...
+    xtxd = ...
+    sswm = ...
+    xosl = ...
+    merk = ...
+    xobd = ...
+    bsab = ...
+    bspl = ...
+    bstx = ...
+    xnom = ...
+    olbb = ...
+    sgmu = ...
+    afex = ...
+    bnpl = ...
+    capl = ...
+    ccmx = ...
+    msbi = ...
+    sgmv = ...
+    sgmw = ...
+    t212 = ...
+    tmex = ...
+    xcbo = ...
+    cone = ...
+    ctwo = ...
+    c2ox = ...
+    xpom = ...
+    clst = ...
+    llat = ...
+    immh = ...
+    aqse = ...
+    enms = ...
+    fast = ...
+    ilcm = ...
+    lele = ...
+    mcxx = ...
+    pepw = ...
+    wflb = ...
+    wfse = ...
+    nbfl = ...
+    nexx = ...
+    nexg = ...
+    nexl = ...
+    nexd = ...
+    maxd = ...
+    btbs = ...
+    axsi = ...
+    skbb = ...
+    bdsk = ...
+    dexe = ...
+    otpr = ...
+    sbij = ...
+    xotp = ...
+    xbvm = ...
+    maqe = ...
+    memx = ...
+    park = ...
+    pipr = ...
+    skyx = ...
+    glom = ...
+    trai = ...
+    cboe = ...
+    cohr = ...
+    stfu = ...
+    stfx = ...
+    xicb = ...
+    xlch = ...
+    clch = ...
+    buyn = ...
+    atdf = ...
+    bghx = ...
+    csas = ...
+    ltse = ...
+    xfex = ...
+    calh = ...
+    omip = ...
+    xlis = ...
+    dauk = ...
+    bslb = ...
+    cfil = ...
+    rbcm = ...
+    thre = ...
+    weed = ...
+    xwee = ...
+    bkkt = ...
+    iuob = ...
+    xpus = ...
+    bmli = ...
+    bmlx = ...
+    itgl = ...
+    xamm = ...
+    amnl = ...
+    vfgb = ...
+    vfuk = ...
+    sebl = ...
+    viuk = ...
+    _24ex = ...
+    bbsx = ...
+    jlsi = ...
+    scot = ...
+    spex = ...
+    ifad = ...
+    jlqd = ...
+    lamp = ...
+    rcma = ...
+    eris = ...
+    mktf = ...
+    xsgb = ...
+    ykna = ...
+    csda = ...
+    dowm = ...
+    gsxc = ...
+    gsxk = ...
+    gsxt = ...
+    vagm = ...
+    bmcm = ...
+    ewsm = ...
+    gxgr = ...
+    gxgm = ...
+    gxgf = ...
+    abfi = ...
+    dash = ...
+    misx = ...
+    bajd = ...
+    neoe = ...
+    neod = ...
+    neon = ...
+    neoc = ...
+    trpx = ...
+    kome = ...
+    trcx = ...
+    erbx = ...
+    iber = ...
+    allt = ...
+    bilu = ...
+    cbsk = ...
+    coda = ...
+    pdqx = ...
+    smbd = ...
+    stfl = ...
+    xalt = ...
+    sage = ...
+    arch = ...
+    expm = ...
+    jpms = ...
+    snuk = ...
+    arkx = ...
+    svxi = ...
+    xals = ...
+    cgmg = ...
+    puma = ...
+    _4axe = ...
+    ebhu = ...
+    euch = ...
+    eurm = ...
+    eusc = ...
+    fnuk = ...
+    uchu = ...
+    cbnl = ...
+    ftus = ...
+    bguk = ...
+    clve = ...
+    cpgx = ...
+    cepl = ...
+    cepu = ...
+    dbab = ...
+    otcn = ...
+    rtsl = ...
+    tral = ...
+    tdgf = ...
+    ubsb = ...
+    ubsd = ...
+    ubsl = ...
+    bfpt = ...
+    conc = ...
+    ifbx = ...
+    scxo = ...
+    scxm = ...
+    syfx = ...
+    ssil = ...
+    manl = ...
+    betx = ...
+    btlx = ...
+    ccex = ...
+    aqeu = ...
+    aqea = ...
+    aqxe = ...
+    bkdm = ...
+    bnld = ...
+    cavd = ...
+    gipb = ...
+    gspx = ...
+    icpm = ...
+    imgi = ...
+    imrd = ...
+    imet = ...
+    imgb = ...
+    immm = ...
+    imfd = ...
+    imce = ...
+    imed = ...
+    jleu = ...
+    smff = ...
+    sptr = ...
+    elxe = ...
+    scag = ...
+    sgas = ...
+    smfe = ...
+    trxe = ...
+    mhbe = ...
+    csgi = ...
+    eucc = ...
+    brea = ...
+    xtxe = ...
+    blue = ...
+    btam = ...
+    cabv = ...
+    rfbk = ...
+    towr = ...
+    bpas = ...
+    flwx = ...
+    blux = ...
+    dblx = ...
+    dhlx = ...
+    khhu = ...
+    mcid = ...
+    ncme = ...
+    ipnl = ...
+    iswp = ...
+    iswn = ...
+    iswt = ...
+    msel = ...
+    ncml = ...
+    xpuk = ...
+    csag = ...
+    gsbe = ...
+    hreu = ...
+    stsi = ...
+    crem = ...
+    dwfi = ...
+    bnpp = ...
+    cibh = ...
+    csmd = ...
+    simd = ...
+    gmes = ...
+    gmeo = ...
+    kbll = ...
+    mhbp = ...
+    mheu = ...
+    ubcz = ...
+    atln = ...
+    lbcw = ...
+    agbp = ...
+    ebsn = ...
+    eceu = ...
+    tpic = ...
+    xtrd = ...
+    mlex = ...
+    mler = ...
+    mles = ...
+    mlib = ...
+    athl = ...
+    bcsc = ...
+    cfif = ...
+    jefe = ...
+    mhbl = ...
+    nowx = ...
+    pkop = ...
+    vusa = ...
+    vfmi = ...
+    aban = ...
+    eqie = ...
+    eqld = ...
+    gpbc = ...
+    rtsx = ...
+    ohvo = ...
+    rbcg = ...
+    rmtf = ...
+    ucba = ...
+    ucde = ...
+    ucit = ...
+    brga = ...
+    xnor = ...
+    bcma = ...
+    csob = ...
+    icur = ...
+    ifxc = ...
+    ifxa = ...
+    ifxr = ...
+    musn = ...
+    spdx = ...
+    nibc = ...
+    uice = ...
+    xndu = ...
+    ecsl = ...
+    msax = ...
+    msnt = ...
+    mseu = ...
+    tpis = ...
+    brde = ...
+    cibc = ...
+    cibp = ...
+    ftfs = ...
+    cabk = ...
+    ccrm = ...
+    ccxe = ...
+    deka = ...
+    icot = ...
+    issi = ...
+    jysi = ...
+    nwnv = ...
+    otpb = ...
+    rbhu = ...
+    renc = ...
+    tpeu = ...
+    wsil = ...
+    ingw = ...
+    makx = ...
+    wsin = ...
+    slhb = ...
+    sibc = ...
+    weln = ...
+    bmlb = ...
+    welx = ...
+    xsat = ...
+    baip = ...
+    baep = ...
+    davy = ...
+    imcm = ...
+    imcd = ...
+    liga = ...
+    mbpl = ...
+    tpfr = ...
+    tepi = ...
+    tpmf = ...
+    tpsy = ...
+    wels = ...
+    cbal = ...
+    scxa = ...
+    siab = ...
+    bksk = ...
+    cmci = ...
+    mhbd = ...
+    csot = ...
+    muse = ...
+    nabe = ...
+    abna = ...
+    bbie = ...
+    erst = ...
+    ikbs = ...
+    tqex = ...
+    tqeb = ...
+    tqem = ...
+    tqea = ...
+    apaw = ...
+    nabl = ...
+    obkl = ...
+    twjp = ...
+    hrtf = ...
+    smbb = ...
+    cgmd = ...
+    hemo = ...
+    imct = ...
+    metz = ...
+    mibl = ...
+    mubl = ...
+    mubm = ...
+    mubp = ...
+    rbiv = ...
+    smbg = ...
+    mube = ...
+    jpeu = ...
+    smbe = ...
+    smbp = ...
+    leue = ...
+    leuf = ...
+    hela = ...
+    nesi = ...
+    bhwa = ...
+    isba = ...
+    isbv = ...
+    kbcb = ...
+    maqi = ...
+    maqu = ...
+    fico = ...
+    lbbw = ...
+    lbwl = ...
+    lbws = ...
+    nuro = ...
+    xnlx = ...
+    nurd = ...
+    tpmg = ...
+    edga = ...
+    edgd = ...
+    edgo = ...
+    edgx = ...
+    bats = ...
+    baty = ...
+    byxd = ...
+    bzxd = ...
+    eddp = ...
+    bato = ...
+    bape = ...
+    base = ...
+    bcee = ...
+    bpko = ...
+    btfe = ...
+    hrsi = ...
+    r5fx = ...
+    sisi = ...
+    beis = ...
+    blbb = ...
+    basx = ...
+    hrtx = ...
+    icas = ...
+    incr = ...
+    iofb = ...
+    ocsi = ...
+    edrf = ...
+    bnsx = ...
+    exse = ...
+    tplf = ...
+    aixk = ...
+    lbcm = ...
+    rlbo = ...
+    sbex = ...
+    vtbc = ...
+    zarx = ...
+    ipsx = ...
+    tpde = ...
+    tsfg = ...
+    tsff = ...
+    comm = ...
+    atlb = ...
+    ccms = ...
+    daiw = ...
+    iinx = ...
+    opco = ...
+    tsbx = ...
+    tmxs = ...
+    belb = ...
+    imtf = ...
+    magm = ...
+    blxa = ...
+    gfks = ...
+    sgoe = ...
+    ubsa = ...
+    ubss = ...
+    ibis = ...
+    pdqd = ...
+    tfsd = ...
+    tras = ...
+    tsig = ...
+    utsl = ...
+    bmfx = ...
+    cszh = ...
+    stal = ...
+    xijp = ...
+    euwa = ...
+    exsy = ...
+    a2xx = ...
+    fxop = ...
+    trde = ...
+    nave = ...
+    akis = ...
+    bpsx = ...
+    igdl = ...
+    jssi = ...
+    sebx = ...
+    twgp = ...
+    gmgd = ...
+    gmgl = ...
+    npex = ...
+    oapa = ...
+    ddtx = ...
+    hpcx = ...
+    sb1m = ...
+    sedr = ...
+    ants = ...
+    ieng = ...
+    sgmx = ...
+    ssbi = ...
+    dbag = ...
+    mkap = ...
+    gsal = ...
+    gsxh = ...
+    sigh = ...
+    swee = ...
+    swlt = ...
+    swlv = ...
+    oddo = ...
+    odoc = ...
+    pulx = ...
+    sant = ...
+    ubin = ...
+    cslb = ...
+    jisi = ...
+    jefs = ...
+    vwdx = ...
+    vtls = ...
+    bamx = ...
+    sebs = ...
+    xabc = ...
+    gfic = ...
+    kelr = ...
+    mlxn = ...
+    mlax = ...
+    xbox = ...
+    nord = ...
+    otxb = ...
+    semx = ...
+    aaca = ...
+    absi = ...
+    binv = ...
+    glmx = ...
+    gtxe = ...
+    jpcb = ...
+    nlbx = ...
+    rosr = ...
+    xrot = ...
+    xllb = ...
+    xvpb = ...
+    hbpl = ...
+    xabg = ...
+    alsi = ...
+    sbsi = ...
+    tdbl = ...
+    bnpa = ...
+    bnpf = ...
+    bnps = ...
+    iceo = ...
+    iofi = ...
+    iofx = ...
+    iogb = ...
+    iocd = ...
+    ioed = ...
+    iogi = ...
+    ioir = ...
+    iomm = ...
+    iswa = ...
+    nwms = ...
+    rbce = ...
+    xsga = ...
+    kblm = ...
+    kotf = ...
+    lasp = ...
+    tdon = ...
+    tsaf = ...
+    ubis = ...
+    xiel = ...
+    xoaa = ...
+    bana = ...
+    boal = ...
+    csec = ...
+    mlix = ...
+    mlrq = ...
+    svex = ...
+    sves = ...
+    aapa = ...
+    cimd = ...
+    curx = ...
+    sksi = ...
+    squa = ...
+    ssbt = ...
+    ssfx = ...
+    afsa = ...
+    afsi = ...
+    aria = ...
+    dvfx = ...
+    etpa = ...
+    loui = ...
+    rabo = ...
+    bbva = ...
+    btnl = ...
+    capi = ...
+    xrcb = ...
+    apex = ...
+    tgat = ...
+    xgrm = ...
+    nysi = ...
+    xmal = ...
+    casi = ...
+    cnsi = ...
+    xosa = ...
+    cceu = ...
+    xtxm = ...
+    gfsm = ...
+    gfso = ...
+    aurb = ...
+    iswr = ...
+    iswc = ...
+    iswb = ...
+    vagl = ...
+    bcsl = ...
+    bcsi = ...
+    gfib = ...
+    gfif = ...
+    gfin = ...
+    gfir = ...
+    ingb = ...
+    sfcl = ...
+    sunb = ...
+    tpsl = ...
+    tsmr = ...
+    vont = ...
+    bkbr = ...
+    bkbf = ...
+    cbka = ...
+    tpes = ...
+    tpso = ...
+    cbkd = ...
+    cbkf = ...
+    cbke = ...
+    cbkg = ...
+    cgml = ...
+    cptx = ...
+    maql = ...
+    dzbk = ...
+    xpos = ...
+    tpel = ...
+    tefd = ...
+    temf = ...
+    temi = ...
+    tird = ...
+    temb = ...
+    temr = ...
+    tpeo = ...
+    tegb = ...
+    tomg = ...
+    tepf = ...
+    twhk = ...
+    twjt = ...
+    twsg = ...
+    wood = ...
+    xrfq = ...
+    xpac = ...
+    loyd = ...
+    scxf = ...
+    bofs = ...
+    sunt = ...
+    swbi = ...
+    wbkp = ...
+    bgsi = ...
+    bplc = ...
+    bbsi = ...
+    lssi = ...
+    biva = ...
+    bkln = ...
+    bklf = ...
+    fisu = ...
+    jbsi = ...
+    napa = ...
+    potc = ...
+    ppex = ...
+    baad = ...
+    inve = ...
+    emch = ...
+    vola = ...
+    xdnb = ...
+    ifls = ...
+    exot = ...
+    hsxe = ...
+    anzl = ...
+    echo = ...
+    fbsi = ...
+    hsbc = ...
+    hsbt = ...
+    natx = ...
+    stan = ...
+    vcmo = ...
+    advt = ...
+    csin = ...
+    cssi = ...
+    dowg = ...
+    ampx = ...
+    fxgb = ...
+    tomx = ...
+    trsi = ...
+    btee = ...
+    ebsm = ...
+    ebss = ...
+    rbcb = ...
+    rbct = ...
+    gsib = ...
+    bisi = ...
+    hudx = ...
+    imcs = ...
+    ubsy = ...
+    xdub = ...
+    xatl = ...
+    bilt = ...
+    mufp = ...
+    vfil = ...
+    vfsi = ...
+    vfxo = ...
+    ccml = ...
+    cftw = ...
+    dapa = ...
+    vlex = ...
+    _3579 = ...
+    mhip = ...
+    wins = ...
+    winx = ...
+    enxl = ...
+    alxl = ...
+    masg = ...
+    tcml = ...
+    frte = ...
+    them = ...
+    ledg = ...
+    muti = ...
+    ndcm = ...
+    ndex = ...
+    spec = ...
+    bcrm = ...
+    bark = ...
+    mtus = ...
+    gotc = ...
+    mfxc = ...
+    mfxr = ...
+    mfxa = ...
+    snsi = ...
+    vert = ...
+    apxl = ...
+    cltd = ...
+    drct = ...
+    mtxx = ...
+    cave = ...
+    otcb = ...
+    pinl = ...
+    pini = ...
+    pinx = ...
+    otcq = ...
+    psgm = ...
+    pinc = ...
+    xeee = ...
+    mtso = ...
+    mtsc = ...
+    eluk = ...
+    elno = ...
+    _else = ...
+    eleu = ...
+    frei = ...
+    nosi = ...
+    xbdv = ...
+    difx = ...
+    autx = ...
+    autp = ...
+    nexs = ...
+    virt = ...
+    balt = ...
+    bltx = ...
+    cgma = ...
+    cgmh = ...
+    cgmi = ...
+    lqfi = ...
+    cgmx = ...
+    citx = ...
+    citd = ...
+    lqed = ...
+    mtxa = ...
+    ptpg = ...
+    ufex = ...
+    tsad = ...
+    xisl = ...
+    xkar = ...
+    xlah = ...
+    xlgt = ...
+    peel = ...
+    xphx = ...
+    caze = ...
+    jpbx = ...
+    jpsi = ...
+    jsef = ...
+    arex = ...
+    csau = ...
+    cfau = ...
+    cseu = ...
+    cscf = ...
+    cshk = ...
+    cfhk = ...
+    csjp = ...
+    cfjp = ...
+    edge = ...
+    ficx = ...
+    gbot = ...
+    grif = ...
+    ibgh = ...
+    iexg = ...
+    lmec = ...
+    nexo = ...
+    nmrj = ...
+    nxjp = ...
+    nxvw = ...
+    parx = ...
+    elix = ...
+    trdx = ...
+    xbel = ...
+    xblb = ...
+    xmun = ...
+    xnxc = ...
+    xves = ...
+    xhon = ...
+    icus = ...
+    itsm = ...
+    jata = ...
+    kmts = ...
+    xsur = ...
+    mtsp = ...
+    xasm = ...
+    xiex = ...
+    xjkt = ...
+    mtax = ...
+    xbmk = ...
+    xbmf = ...
+    iceu = ...
+    xa1x = ...
+    nome = ...
+    xbsp = ...
+    necd = ...
+    fxmt = ...
+    atsa = ...
+    xsic = ...
+    xtlx = ...
+    xlof = ...
+    xmic = ...
+    qmts = ...
+    xeus = ...
+    xnyf = ...
+    bamp = ...
+    xedx = ...
+    xtar = ...
+    urce = ...
+    xfnx = ...
+    csfb = ...
+    xhce = ...
+    xher = ...
+    crdl = ...
+    baik = ...
+    umts = ...
+    xpin = ...
+    xrtr = ...
+    xplu = ...
+    xrov = ...
+    damp = ...
+    xljs = ...
+    xrms = ...
+    _360t = ...
+    aats = ...
+    acex = ...
+    afdl = ...
+    afet = ...
+    afse = ...
+    aixe = ...
+    aqst = ...
+    aqsl = ...
+    aqsn = ...
+    aqsg = ...
+    aqsf = ...
+    aqsd = ...
+    aqua = ...
+    asex = ...
+    xipo = ...
+    euax = ...
+    awbx = ...
+    awex = ...
+    bace = ...
+    baml = ...
+    bapa = ...
+    bapx = ...
+    barx = ...
+    bard = ...
+    bbsf = ...
+    bcfs = ...
+    xmvl = ...
+    bcmm = ...
+    bcse = ...
+    bcxe = ...
+    lisx = ...
+    chix = ...
+    beam = ...
+    beex = ...
+    betp = ...
+    bfex = ...
+    bgcf = ...
+    bgcd = ...
+    fncs = ...
+    bgci = ...
+    bhsf = ...
+    bids = ...
+    blev = ...
+    blpx = ...
+    bpol = ...
+    bltd = ...
+    bmex = ...
+    sbil = ...
+    sbar = ...
+    xval = ...
+    xbar = ...
+    xlat = ...
+    xmef = ...
+    xmpw = ...
+    xmrv = ...
+    bmtf = ...
+    bnyc = ...
+    boat = ...
+    bosc = ...
+    bova = ...
+    bovm = ...
+    brix = ...
+    brnx = ...
+    bsex = ...
+    btec = ...
+    bvca = ...
+    xcar = ...
+    bvmf = ...
+    bvur = ...
+    cand = ...
+    canx = ...
+    cmap = ...
+    cats = ...
+    ccfe = ...
+    ccfx = ...
+    cclx = ...
+    cco2 = ...
+    cded = ...
+    cdel = ...
+    cdsl = ...
+    fxsw = ...
+    ceti = ...
+    cgit = ...
+    cgnd = ...
+    cgeb = ...
+    cgqt = ...
+    cgcm = ...
+    cggd = ...
+    chev = ...
+    blnk = ...
+    chia = ...
+    chic = ...
+    chie = ...
+    chij = ...
+    kaix = ...
+    chis = ...
+    chiv = ...
+    clau = ...
+    clhk = ...
+    cljp = ...
+    clmx = ...
+    clph = ...
+    cmee = ...
+    cmet = ...
+    cmmt = ...
+    cmsf = ...
+    coal = ...
+    comg = ...
+    cotc = ...
+    cred = ...
+    caes = ...
+    cryd = ...
+    cryp = ...
+    cryx = ...
+    cssx = ...
+    dasi = ...
+    dbhk = ...
+    dbox = ...
+    dbsx = ...
+    dcsx = ...
+    deal = ...
+    dgcx = ...
+    dktc = ...
+    dots = ...
+    dsmd = ...
+    dumx = ...
+    ecag = ...
+    ecgs = ...
+    ecal = ...
+    ecxe = ...
+    eeal = ...
+    eese = ...
+    eftp = ...
+    egmt = ...
+    egsi = ...
+    embx = ...
+    emid = ...
+    emir = ...
+    emdr = ...
+    encl = ...
+    eotc = ...
+    epex = ...
+    etsc = ...
+    exeu = ...
+    excp = ...
+    exbo = ...
+    exdc = ...
+    extr = ...
+    fair = ...
+    fgex = ...
+    finr = ...
+    finy = ...
+    ootc = ...
+    fish = ...
+    fltb = ...
+    fmts = ...
+    frrf = ...
+    fsef = ...
+    fshx = ...
+    fxal = ...
+    fxcm = ...
+    g1xx = ...
+    gemx = ...
+    getb = ...
+    gfia = ...
+    xgfi = ...
+    gfim = ...
+    gllc = ...
+    glps = ...
+    glpx = ...
+    gmeg = ...
+    xgsx = ...
+    gmex = ...
+    gmtf = ...
+    govx = ...
+    gree = ...
+    grse = ...
+    gsci = ...
+    gsco = ...
+    gsef = ...
+    gsil = ...
+    gssi = ...
+    gsxl = ...
+    gtco = ...
+    gtsx = ...
+    gtxs = ...
+    gxma = ...
+    hchc = ...
+    hdat = ...
+    hegx = ...
+    hkme = ...
+    hmtf = ...
+    hrfq = ...
+    hppo = ...
+    hsfx = ...
+    hstc = ...
+    xhnx = ...
+    hsxa = ...
+    hupx = ...
+    ibal = ...
+    ibex = ...
+    icap = ...
+    plsx = ...
+    icdx = ...
+    icel = ...
+    icxl = ...
+    ifca = ...
+    ifeu = ...
+    ifut = ...
+    ifsg = ...
+    ifus = ...
+    iepa = ...
+    imcg = ...
+    imir = ...
+    imcr = ...
+    imen = ...
+    ices = ...
+    imag = ...
+    imbd = ...
+    imex = ...
+    isda = ...
+    isex = ...
+    itgi = ...
+    ivzx = ...
+    ixsp = ...
+    jadx = ...
+    jefx = ...
+    jnst = ...
+    jpmi = ...
+    jpmx = ...
+    jses = ...
+    jsjx = ...
+    kabu = ...
+    kccp = ...
+    kdpw = ...
+    kleu = ...
+    knig = ...
+    knem = ...
+    knli = ...
+    kncm = ...
+    kocn = ...
+    krme = ...
+    lasf = ...
+    lava = ...
+    lafd = ...
+    lchc = ...
+    lica = ...
+    liqu = ...
+    liqf = ...
+    lius = ...
+    liuh = ...
+    lifi = ...
+    lmax = ...
+    lotc = ...
+    pldx = ...
+    lppm = ...
+    ltaa = ...
+    lxjp = ...
+    mael = ...
+    mxlm = ...
+    malx = ...
+    mxnl = ...
+    maqh = ...
+    maqj = ...
+    maqx = ...
+    matn = ...
+    matx = ...
+    mbul = ...
+    mcur = ...
+    mdip = ...
+    meau = ...
+    mehk = ...
+    mfgl = ...
+    mibg = ...
+    mihi = ...
+    xmio = ...
+    mizx = ...
+    mlve = ...
+    mleu = ...
+    msal = ...
+    msco = ...
+    mstx = ...
+    mslp = ...
+    msip = ...
+    msms = ...
+    bvus = ...
+    mtsb = ...
+    mtxs = ...
+    mtxc = ...
+    mtxm = ...
+    mytr = ...
+    n2ex = ...
+    namx = ...
+    nasb = ...
+    nasx = ...
+    nblx = ...
+    nbot = ...
+    ncel = ...
+    nfsc = ...
+    ngxc = ...
+    nilx = ...
+    nlpx = ...
+    nmce = ...
+    nmra = ...
+    icsh = ...
+    icsz = ...
+    ickr = ...
+    ichk = ...
+    nxse = ...
+    ictw = ...
+    nncs = ...
+    nodx = ...
+    noff = ...
+    nops = ...
+    nosc = ...
+    notc = ...
+    npga = ...
+    nsxb = ...
+    nxeu = ...
+    nxus = ...
+    nymx = ...
+    nypc = ...
+    ofex = ...
+    ollc = ...
+    omel = ...
+    omga = ...
+    lynx = ...
+    omic = ...
+    opex = ...
+    opra = ...
+    oslc = ...
+    otce = ...
+    otcx = ...
+    pave = ...
+    pdex = ...
+    pfts = ...
+    pftq = ...
+    pieu = ...
+    pipe = ...
+    pirm = ...
+    pmts = ...
+    prse = ...
+    pvmf = ...
+    pxil = ...
+    qmtf = ...
+    qwix = ...
+    rbsx = ...
+    ricx = ...
+    ricd = ...
+    roco = ...
+    rofx = ...
+    rotc = ...
+    rpdx = ...
+    rsex = ...
+    rtsp = ...
+    s3fm = ...
+    secc = ...
+    secd = ...
+    sece = ...
+    secf = ...
+    sedc = ...
+    selc = ...
+    sepe = ...
+    sgex = ...
+    sgma = ...
+    shar = ...
+    shaw = ...
+    shad = ...
+    siga = ...
+    sigj = ...
+    sigx = ...
+    simv = ...
+    slxt = ...
+    smex = ...
+    soho = ...
+    spim = ...
+    sprz = ...
+    spxe = ...
+    ssex = ...
+    sstx = ...
+    stox = ...
+    xscu = ...
+    xstx = ...
+    swap = ...
+    sxsi = ...
+    tera = ...
+    tfex = ...
+    tfsa = ...
+    tfsu = ...
+    tfsv = ...
+    tlab = ...
+    tmid = ...
+    tocp = ...
+    tpie = ...
+    tpim = ...
+    tpse = ...
+    tpsv = ...
+    trck = ...
+    tfss = ...
+    dbvx = ...
+    tfsc = ...
+    oilx = ...
+    tcme = ...
+    tfse = ...
+    treu = ...
+    trqx = ...
+    trqd = ...
+    trux = ...
+    trwb = ...
+    twsf = ...
+    dwsf = ...
+    trfx = ...
+    tsef = ...
+    tweu = ...
+    twem = ...
+    twea = ...
+    tweo = ...
+    ubsp = ...
+    ubsg = ...
+    ubsf = ...
+    ubst = ...
+    ubsx = ...
+    ukex = ...
+    ukpx = ...
+    ultx = ...
+    vega = ...
+    vfcm = ...
+    vmfx = ...
+    wsag = ...
+    xabj = ...
+    xace = ...
+    xads = ...
+    xaex = ...
+    xafr = ...
+    xafx = ...
+    xalb = ...
+    xalg = ...
+    xams = ...
+    xeui = ...
+    tnla = ...
+    xhft = ...
+    xeue = ...
+    xant = ...
+    xaom = ...
+    xapi = ...
+    xaqs = ...
+    xarc = ...
+    xarm = ...
+    xasx = ...
+    asxt = ...
+    asxb = ...
+    asxv = ...
+    asxp = ...
+    xsfe = ...
+    xats = ...
+    xauk = ...
+    xazx = ...
+    xbaa = ...
+    xbab = ...
+    bajm = ...
+    xbah = ...
+    xban = ...
+    xbav = ...
+    xbbf = ...
+    xbbj = ...
+    xbbk = ...
+    xbcc = ...
+    mvcx = ...
+    xbce = ...
+    xbcl = ...
+    xbcm = ...
+    xbcx = ...
+    xbcv = ...
+    xbda = ...
+    xber = ...
+    zobx = ...
+    eqta = ...
+    eqtb = ...
+    eqtc = ...
+    eqtd = ...
+    xeqt = ...
+    xbey = ...
+    xbfo = ...
+    xbkk = ...
+    xbkf = ...
+    xbln = ...
+    xbnv = ...
+    xbog = ...
+    xbol = ...
+    xbom = ...
+    bsme = ...
+    xbot = ...
+    botv = ...
+    xbra = ...
+    xbre = ...
+    xbrm = ...
+    xbrn = ...
+    xbru = ...
+    xbrd = ...
+    xbrv = ...
+    xbse = ...
+    xbsd = ...
+    xbtf = ...
+    xbud = ...
+    xtnd = ...
+    xbue = ...
+    xmev = ...
+    xbul = ...
+    abul = ...
+    xbvc = ...
+    xbvp = ...
+    xbvr = ...
+    xcai = ...
+    xcal = ...
+    xcas = ...
+    xcay = ...
+    cbsx = ...
+    xcbf = ...
+    xcbt = ...
+    fcbt = ...
+    xkbt = ...
+    xcce = ...
+    xccx = ...
+    xcde = ...
+    xcet = ...
+    xcfe = ...
+    xcff = ...
+    xcgs = ...
+    xchg = ...
+    xcie = ...
+    xcme = ...
+    glbx = ...
+    xiom = ...
+    cmes = ...
+    cbts = ...
+    nyms = ...
+    cecs = ...
+    xcnf = ...
+    xcol = ...
+    xcor = ...
+    xcrc = ...
+    xcro = ...
+    xcsc = ...
+    xcse = ...
+    mndk = ...
+    fndk = ...
+    dndk = ...
+    mcse = ...
+    xfnd = ...
+    xcsx = ...
+    xcue = ...
+    xcur = ...
+    xcxd = ...
+    xcys = ...
+    xecm = ...
+    xdar = ...
+    xdce = ...
+    xdes = ...
+    xdfb = ...
+    xdfm = ...
+    xdha = ...
+    xdpa = ...
+    xdse = ...
+    xdsx = ...
+    xdtb = ...
+    xdus = ...
+    xqtx = ...
+    xdwz = ...
+    xebi = ...
+    xecb = ...
+    xecc = ...
+    xecs = ...
+    xelx = ...
+    xemd = ...
+    xems = ...
+    xeti = ...
+    xetc = ...
+    xetr = ...
+    xetb = ...
+    xeta = ...
+    xeup = ...
+    xeur = ...
+    xfcm = ...
+    xffe = ...
+    xfka = ...
+    xfmn = ...
+    xfom = ...
+    xfra = ...
+    xdbv = ...
+    fraa = ...
+    frad = ...
+    frab = ...
+    xdbx = ...
+    xnew = ...
+    xfta = ...
+    xgas = ...
+    xgcl = ...
+    xgha = ...
+    xgme = ...
+    xgmx = ...
+    xgse = ...
+    xgtg = ...
+    xgua = ...
+    xham = ...
+    hamm = ...
+    haml = ...
+    hamn = ...
+    xhan = ...
+    xhel = ...
+    dhel = ...
+    mhel = ...
+    xhir = ...
+    xhkf = ...
+    xhkg = ...
+    shsc = ...
+    szsc = ...
+    xgem = ...
+    xiab = ...
+    xibe = ...
+    xice = ...
+    dnis = ...
+    isec = ...
+    dice = ...
+    mnis = ...
+    xicx = ...
+    xidx = ...
+    xihk = ...
+    xima = ...
+    ximc = ...
+    xime = ...
+    xins = ...
+    icbx = ...
+    mocx = ...
+    xinv = ...
+    xipe = ...
+    xiqs = ...
+    xist = ...
+    xeqy = ...
+    xisx = ...
+    xjam = ...
+    xjnb = ...
+    xjpx = ...
+    xosj = ...
+    xjse = ...
+    altx = ...
+    xsaf = ...
+    xsfa = ...
+    yldx = ...
+    xjwy = ...
+    xkac = ...
+    xkaz = ...
+    xkce = ...
+    xkfb = ...
+    xkgt = ...
+    xkha = ...
+    xkhr = ...
+    xkie = ...
+    xkis = ...
+    xkkt = ...
+    xkls = ...
+    mesq = ...
+    xkor = ...
+    xkrx = ...
+    xkfe = ...
+    xkos = ...
+    xkcm = ...
+    xkem = ...
+    xkse = ...
+    xkst = ...
+    xkuw = ...
+    xkyo = ...
+    xlao = ...
+    xlbm = ...
+    xlce = ...
+    xldn = ...
+    xlif = ...
+    xlfx = ...
+    xlim = ...
+    mfox = ...
+    wqxl = ...
+    xlit = ...
+    xlju = ...
+    xlme = ...
+    xlon = ...
+    xlsm = ...
+    xlto = ...
+    xlus = ...
+    xlux = ...
+    emtf = ...
+    xmab = ...
+    xmac = ...
+    xmae = ...
+    pros = ...
+    xman = ...
+    xmap = ...
+    xmau = ...
+    xmdg = ...
+    xmds = ...
+    xmer = ...
+    xmex = ...
+    xmge = ...
+    xmid = ...
+    xmif = ...
+    xmil = ...
+    mivx = ...
+    xaim = ...
+    xdmi = ...
+    macx = ...
+    mtaa = ...
+    xmlx = ...
+    xmnt = ...
+    xmnx = ...
+    xmoc = ...
+    xmod = ...
+    xmol = ...
+    xmoo = ...
+    xmsw = ...
+    xmtb = ...
+    xmts = ...
+    nmts = ...
+    plus = ...
+    xmus = ...
+    xnaf = ...
+    xnai = ...
+    xnam = ...
+    xnas = ...
+    xndq = ...
+    xngs = ...
+    xncm = ...
+    xnim = ...
+    xbos = ...
+    bosd = ...
+    xbxo = ...
+    xpor = ...
+    xpsx = ...
+    xbrt = ...
+    psxd = ...
+    xpbt = ...
+    xpho = ...
+    xphl = ...
+    xncd = ...
+    xnec = ...
+    xnee = ...
+    xnep = ...
+    xngm = ...
+    nmtf = ...
+    xngo = ...
+    xnii = ...
+    xnks = ...
+    xnql = ...
+    xnsa = ...
+    xnse = ...
+    xnst = ...
+    xnyc = ...
+    xnym = ...
+    xcec = ...
+    xnye = ...
+    xnyl = ...
+    xnys = ...
+    xase = ...
+    xnli = ...
+    nysd = ...
+    amxo = ...
+    arcd = ...
+    arco = ...
+    xnze = ...
+    xode = ...
+    xoff = ...
+    xome = ...
+    burg = ...
+    merd = ...
+    xoam = ...
+    burm = ...
+    xosc = ...
+    xoad = ...
+    xosd = ...
+    nibr = ...
+    xosm = ...
+    xost = ...
+    xotb = ...
+    xotc = ...
+    xpae = ...
+    xpar = ...
+    xmat = ...
+    xmon = ...
+    xphs = ...
+    xpic = ...
+    xpow = ...
+    xpra = ...
+    xprm = ...
+    strt = ...
+    spad = ...
+    xpri = ...
+    xpse = ...
+    xpst = ...
+    xpty = ...
+    xpxe = ...
+    xqui = ...
+    xrbm = ...
+    xrio = ...
+    xris = ...
+    fnlv = ...
+    xrmz = ...
+    xros = ...
+    xrox = ...
+    xtuc = ...
+    xrpm = ...
+    xrus = ...
+    xsam = ...
+    xsap = ...
+    xsau = ...
+    xsco = ...
+    xsef = ...
+    xses = ...
+    xsim = ...
+    xsce = ...
+    xsge = ...
+    xsgo = ...
+    xshe = ...
+    xshg = ...
+    xsib = ...
+    xsme = ...
+    xsom = ...
+    xsop = ...
+    xsps = ...
+    xsrm = ...
+    xsse = ...
+    xstc = ...
+    xste = ...
+    xsto = ...
+    dsto = ...
+    xstu = ...
+    euwx = ...
+    xsva = ...
+    xswa = ...
+    xswb = ...
+    xswo = ...
+    xtad = ...
+    xtae = ...
+    xtaf = ...
+    xtai = ...
+    xtal = ...
+    fnee = ...
+    xteh = ...
+    xtfe = ...
+    xtff = ...
+    xtfn = ...
+    xtir = ...
+    xtka = ...
+    xtko = ...
+    xtkt = ...
+    xtoe = ...
+    xtra = ...
+    xtrn = ...
+    xtrz = ...
+    xtse = ...
+    xtsx = ...
+    xtnx = ...
+    xtun = ...
+    xtup = ...
+    tpsd = ...
+    tpre = ...
+    tpeq = ...
+    xtpe = ...
+    tben = ...
+    xtur = ...
+    xuax = ...
+    xuga = ...
+    xukr = ...
+    xula = ...
+    xuni = ...
+    xuse = ...
+    xvar = ...
+    xvla = ...
+    xvpa = ...
+    xvse = ...
+    xwar = ...
+    plpo = ...
+    plps = ...
+    wblc = ...
+    wbcl = ...
+    wbon = ...
+    wmtf = ...
+    wder = ...
+    wcde = ...
+    poee = ...
+    wgas = ...
+    plpx = ...
+    xwbo = ...
+    wbah = ...
+    wbdm = ...
+    xvie = ...
+    xxsc = ...
+    xxxx = ...
+    xyie = ...
+    xykt = ...
+    xzag = ...
+    xzce = ...
+    xzim = ...
+    zkbx = ...
+    kmux = ...
+    ukca = ...
+    asef = ...
+    memm = ...
+    xebs = ...
+    nspo = ...
+    otci = ...
+    gfox = ...
+    fnft = ...
+    hgsp = ...
+    term = ...
+    patf = ...
+    bbvx = ...
+    odxe = ...
+    hpsx = ...
+    dbdx = ...
+    emce = ...
+    hpso = ...
+    artx = ...
+    sptx = ...
+    tsir = ...
+    stxs = ...
+    eufn = ...
+    tsfx = ...
+    gfau = ...
+    cse2 = ...
+    xigg = ...
+    smbc = ...
+    fnxb = ...
+    bgca = ...
+    aqxd = ...
+    xftx = ...
+    nabp = ...
+    usob = ...
+    btun = ...
+    ecnl = ...
+    rits = ...
+    fxsm = ...
+    fxnm = ...
+    mswp = ...
+    cast = ...
+    xabx = ...
+    trbx = ...
+    cilh = ...
+    uswp = ...
+    cbae = ...
+    trdc = ...
+    usef = ...
+    nssa = ...
+    cmcm = ...
+    eblx = ...
+    erfq = ...
+    entw = ...
+    fusd = ...
+    xete = ...
+    xetx = ...
+    sfox = ...
+    bjse = ...
+    neeq = ...
+    vfex = ...
+    msdm = ...
+    lneq = ...
+    lnfi = ...
+    ibsi = ...
+    raja = ...
+    lpsf = ...
+    gbsi = ...
+    tpid = ...
+    ingu = ...
+    sisu = ...
+    sewb = ...
+    dkwb = ...
+    nowb = ...
+    seob = ...
+    dkob = ...
+    euob = ...
+    gbob = ...
+    noob = ...
+    otxt = ...
+    mxop = ...
+    bocf = ...
+    fpwb = ...
+    spax = ...
+    lebv = ...
+    lesi = ...
+    bgem = ...
+    jleq = ...
+    gmge = ...
+    iexc = ...
+    intl = ...
+    brmf = ...
+    cxab = ...
+    cxai = ...
+    tmuk = ...
+    xcbd = ...
+    u360 = ...
+    bdpl = ...
+    vmex = ...
+    inft = ...
+    edxm = ...
+    ibkr = ...
+    algo = ...
+    xand = ...
+    fnds = ...
+    iffx = ...
+    qunt = ...
+    gslo = ...
+    rtxf = ...
+    arda = ...
+    vuba = ...
+    g360 = ...
+    acxl = ...
+    acxc = ...
+    ximx = ...
+    atad = ...
+    gsxn = ...
+    rule = ...
+    msxb = ...
+    xcvd = ...
+    mslc = ...
+    xanm = ...
+    cfim = ...
+    msxo = ...
+    xatx = ...
+    adrk = ...
+    rfim = ...
+    bnds = ...
+    sphr = ...
+    afts = ...
+    tmeu = ...
+    nxfo = ...
+    tpda = ...
+    tict = ...
+    xbry = ...
+    xmme = ...
+    gsxm = ...
+    ntrl = ...
+    scle = ...
+    nxbx = ...
+    accx = ...
+    potl = ...
+    npms = ...
+    lbul = ...
+    m2ae = ...
+    rrsi = ...
+    octl = ...
+    bxda = ...
+    bgcj = ...
+    lmas = ...
+    gfsg = ...
+    bgsg = ...
+    eesx = ...
+    bnph = ...
+    spdk = ...
+    spno = ...
+    spfi = ...
+    speu = ...
+    d2xg = ...
+    optx = ...
+    phsi = ...
+    _360x = ...
+    etor = ...
+    vwap = ...
+    xwap = ...
+    itsl = ...
+    jpjx = ...
+    jefa = ...
+    odst = ...
+    rvsa = ...
+    dwin = ...
+    rfqu = ...
+    rfqs = ...
+    rfqn = ...
+    dpar = ...
+    dbru = ...
+    dlis = ...
+    dams = ...
+    ddub = ...
+    dosl = ...
+    dmil = ...
+    cbms = ...
+    xggi = ...
+    octc = ...
+    icps = ...
+    mssa = ...
+    vams = ...
+    ibco = ...
+    hwhe = ...
+    xema = ...
+    xemi = ...
+    xemb = ...
+    bbsn = ...
+    sclb = ...
+    sfmp = ...
+    iexa = ...
+    d2xc = ...
+    rbcs = ...
+    lake = ...
+    nzxc = ...
+    nzxm = ...
+    _21xx = ...
+    xans = ...
+    tpsb = ...
+    tdxs = ...
+    dmad = ...
+    wflp = ...
+    xacd = ...
+    hane = ...
+    hand = ...
+    hanc = ...
+    xgai = ...
+    bpag = ...
+    nxte = ...
+    pvbl = ...
+    wbma = ...
+    synk = ...
+    tpsg = ...
+    fmxs = ...
+    xcts = ...
+    stuh = ...
+    ocfx = ...
+    ocxl = ...
+    ocxe = ...
+    pgtp = ...
+    oyld = ...
+    gsbs = ...
+    xmti = ...
+    xnrg = ...
+    alpx = ...
+    bpxx = ...
+    ctdd = ...
+    ctcc = ...
+    ctss = ...
+    fgml = ...
+    xjax = ...
+    nzxd = ...
+    peur = ...
+    phel = ...
+    pcse = ...
+    psto = ...
+    pfse = ...
+    mepx = ...
+    bfsd = ...
+    opmx = ...
+    ivwp = ...
+    onex = ...
+    onep = ...
+    gtsm = ...
+    wmfs = ...
+    gara = ...
+    besa = ...
+    wmsw = ...
+    obge = ...
+    wmus = ...
+    wtrs = ...
+    lakx = ...
+    srpt = ...
+    brae = ...
+    crbx = ...
+    cxae = ...
+    iswq = ...
+    moon = ...
+    opsi = ...
+    crsx = ...
+    liqh = ...
+    em3s = ...
+    otco = ...
+    xmfe = ...
+    _3dxe = ...
+    boss = ...
+    cdna = ...
+    fnfx = ...
+    nzfx = ...
+    bacr = ...
+    stuf = ...
+    xstp = ...
+    stue = ...
+    hcer = ...
+    gmbg = ...
+    xglo = ...
+    wind = ...
+    fnix = ...
+    latg = ...
+    ensl = ...
+    dbmo = ...
+    dbln = ...
+    abxx = ...
+    fxrs = ...
+    fxps = ...
+    xbis = ...
+    tpee = ...
+    eqoc = ...
+    eqod = ...
+    aqed = ...
+    eixe = ...
+    hpcs = ...
+    noco = ...
+    mabx = ...
+    hpco = ...
+    icor = ...
+    tper = ...
+    xsdx = ...
+    cedx = ...
+    cbks = ...
+    xoas = ...
+    sga2 = ...
+    ewrm = ...
+    bbok = ...
+    blfx = ...
+    onec = ...
+    mbsi = ...
+    pepq = ...
+    pepy = ...
+    peph = ...
+    pepm = ...
+    grow = ...
+    eprd = ...
+    gspl = ...
+    tlcm = ...
+    memd = ...
+    ebso = ...
+    vndm = ...
+    wabr = ...
+    xsca = ...
+    tmcc = ...
+    edbt = ...
+    edgl = ...
+    etlx = ...
+    basp = ...
+    bteq = ...
+    eqse = ...
+    vabd = ...
+    imcc = ...
+    next = ...
+    nexn = ...
+    nexf = ...
+    xndx = ...
+    xnmr = ...
+    sbiu = ...
+    xsbi = ...
+    sbiv = ...
+    eqsl = ...
+    jser = ...
+    hesp = ...
+    hede = ...
+    pjcx = ...
+    cima = ...
+    xzam = ...
+    cgee = ...
+    cgec = ...
+    cgme = ...
+    cgmc = ...
+    nexy = ...
+    trqs = ...
+    core = ...
+    cicx = ...
+    malm = ...
+    xpsf = ...
+    xpot = ...
+    cslp = ...
+    cgmu = ...
+    cscl = ...
+    csvw = ...
+    ukre = ...
+    ukor = ...
+    tuob = ...
+    bmls = ...
+    bmsi = ...
+    sgmz = ...
+    pfxd = ...
+    trqc = ...
+    gsbx = ...
+    beta = ...
+    xpol = ...
+    xpal = ...
+    aspi = ...
+    asmt = ...
+    aspn = ...
+    cisd = ...
+    cdsi = ...
+    resf = ...
+    ebsf = ...
+    xdex = ...
+    dowe = ...
+    wopo = ...
+    iebs = ...
+    mkaa = ...
+    cget = ...
+    xeub = ...
+    nsme = ...
+    beup = ...
+    beuf = ...
+    ceud = ...
+    beud = ...
+    ceux = ...
+    ceuo = ...
+    beue = ...
+    xbnd = ...
+    blkx = ...
+    plpd = ...
+    nmsx = ...
+    xlod = ...
+    lafx = ...
+    fltr = ...
+    bate = ...
+    batf = ...
+    batd = ...
+    btqe = ...
+    btqg = ...
+    ebra = ...
+    xcan = ...
+    xrmo = ...
+    xnco = ...
+    knmx = ...
+    tnlk = ...
+    xdrk = ...
+    vdrk = ...
+    gfpo = ...
+    pumx = ...
+    vwda = ...
+    bgfu = ...
+    mczk = ...
+    hung = ...
+    emts = ...
+    mtsa = ...
+    gmts = ...
+    mtsg = ...
+    imts = ...
+    rmts = ...
+    amts = ...
+    port = ...
+    slkk = ...
+    vmts = ...
+    smts = ...
+    ebsi = ...
+    rese = ...
+    ebsd = ...
+    eusp = ...
+    xmfx = ...
+    trfw = ...
+    teeg = ...
+    nlax = ...
+    ubse = ...
+    ubsi = ...
+    wbgf = ...
+    xetv = ...
+    xetw = ...
+    xetu = ...
+    frav = ...
+    fraw = ...
+    frau = ...
+    ipxw = ...
+    zero = ...
+    scxs = ...
+    tpir = ...
+    xchi = ...
+    xcis = ...
+    celp = ...
+    zbul = ...
+    imsb = ...
+    aqxa = ...
+    jbul = ...
+    bleq = ...
+    mcad = ...
+    ebmx = ...
+    enxb = ...
+    xmsm = ...
+    xesm = ...
+    ukgd = ...
+    gbul = ...
+    tnll = ...
+    trqm = ...
+    xblk = ...
+    iswo = ...
+    fxrq = ...
+    fxfm = ...
+    pbul = ...
+    xetf = ...
+    gsei = ...
+    cbkc = ...
+    kblc = ...
+    kbls = ...
+    kblt = ...
+    xets = ...
+    fras = ...
+    ceue = ...
+    valx = ...
+    cesi = ...
+    tpio = ...
+    dsme = ...
+    fsme = ...
+    xnfi = ...
+    espd = ...
+    ssme = ...
+    jesi = ...
+    vcrs = ...
+    brds = ...
+    xnxd = ...
+    icxr = ...
+    mesi = ...
+    gbwb = ...
+    mscx = ...
+    brdl = ...
+    ftfm = ...
+    baru = ...
+    beuo = ...
+    beut = ...
+    capa = ...
+    lisz = ...
+    iats = ...
+    ipxp = ...
+    bgfx = ...
+    bgfi = ...
+    iece = ...
+    temg = ...
+    teof = ...
+    tomf = ...
+    tepg = ...
+    tepx = ...
+    tepr = ...
+    tepm = ...
+    tsuk = ...
+    tsmc = ...
+    tsmg = ...
+    tsmi = ...
+    tsmb = ...
+    icen = ...
+    nabu = ...
+    naba = ...
+    bbis = ...
+    exyy = ...
+    exsf = ...
+    exsp = ...
+    exsd = ...
+    exsb = ...
+    exsh = ...
+    trqb = ...
+    finn = ...
+    xfci = ...
+    xfda = ...
+    mtsm = ...
+    temc = ...
+    zfxm = ...
+    bliq = ...
+    bsfx = ...
+    bdea = ...
+    blbs = ...
+    msrp = ...
+    mssi = ...
+    melo = ...
+    cblc = ...
+    cioi = ...
+    xehq = ...
+    mose = ...
+    dose = ...
+    ibeq = ...
+    emld = ...
+    belf = ...
+    asxc = ...
+    cfbc = ...
+    sbmf = ...
+    bmfm = ...
+    bmfa = ...
+    jasr = ...
+    xmce = ...
+    bond = ...
+    tfsg = ...
+    tcds = ...
+    zapa = ...
+    iswe = ...
+    iswv = ...
+    hpcv = ...
+    sgmy = ...
+    ssbm = ...
+    dbes = ...
+    teco = ...
+    xzap = ...
+    vtps = ...
+    imco = ...
+    ensx = ...
+    inca = ...
+    ssob = ...
+    xapa = ...
+    rest = ...
+    xrep = ...
+    lmao = ...
+    lmae = ...
+    lmaf = ...
+    apcl = ...
+    sedx = ...
+    cmed = ...
+    iecl = ...
+    mdrv = ...
+    iidx = ...
+    iblx = ...
+    rcbx = ...
+    ifsm = ...
+    mtss = ...
+    mtsw = ...
+    anlp = ...
+    macb = ...
+    brfq = ...
+    bntw = ...
+    blox = ...
+    iotc = ...
+    basi = ...
+    mlsi = ...
+    cimv = ...
+    cimb = ...
+    cime = ...
+    inge = ...
+    ingf = ...
+    afso = ...
+    afsx = ...
+    afsl = ...
+    xgat = ...
+    tgsi = ...
+    cgmt = ...
+    trqa = ...
+    auro = ...
+    bgcm = ...
+    exsi = ...
+    sunm = ...
+    tscb = ...
+    bgco = ...
+    gfbm = ...
+    gfbo = ...
+    suno = ...
+    tsre = ...
+    tscd = ...
+    tsgb = ...
+    tsfi = ...
+    tsed = ...
+    tsgi = ...
+    tsmm = ...
+    tere = ...
+    tefx = ...
+    temm = ...
+    tegi = ...
+    teir = ...
+    jseb = ...
+    esto = ...
+    onse = ...
+    xsmp = ...
+    ebsx = ...
+    bmea = ...
+    ebsc = ...
+    aimx = ...
+    xlom = ...
+    sics = ...
+    tomd = ...
+    rbsi = ...
+    rtsi = ...
+    mund = ...
+    munc = ...
+    wipo = ...
+    iexd = ...
+    xeye = ...
+    xhnf = ...
+    xsbt = ...
+    ensy = ...
+    alxb = ...
+    mlxb = ...
+    xmli = ...
+    alxp = ...
+    sgmt = ...
+    mtsd = ...
+    mtsf = ...
+    isdx = ...
+    imeq = ...
+    ndxs = ...
+    alxa = ...
+    etfp = ...
+    bart = ...
+    baro = ...
+    bmts = ...
+    ibul = ...
+    xeer = ...
+    xeeo = ...
+    prme = ...
+    csbx = ...
+    cxot = ...
+    dked = ...
+    dkfi = ...
+    noed = ...
+    seed = ...
+    pned = ...
+    uswb = ...
+    nofi = ...
+    fied = ...
+    ebon = ...
+    euwb = ...
+    trea = ...
+    treo = ...
+    autb = ...
+    cxrt = ...
+    ackf = ...
+    grio = ...
+    xstf = ...
+    stuc = ...
+    stud = ...
+    xceg = ...
+    xrsp = ...
+    hotc = ...
+    xade = ...
+    enax = ...
+    xath = ...
+    blbf = ...
+    xmot = ...
+    motx = ...
+    munb = ...
+    muna = ...
+    xopv = ...
+    xvia = ...
+    xwce = ...
+    nasn = ...
+    xeas = ...
+    ceto = ...
+    expa = ...
+    nbxo = ...
+    thrd = ...
+    xtaa = ...
+    vrxp = ...
+    mlco = ...
+    mlvx = ...
+    bcdx = ...
+    barl = ...
+    chiy = ...
+    chio = ...
+    batp = ...
+    chid = ...
+    botc = ...
+    bgcb = ...
+    send = ...
+    xdrf = ...
+    marf = ...
+    bmcl = ...
+    merf = ...
+    xbil = ...
+    xmad = ...
+    vtex = ...
+    nyfx = ...
+    icsu = ...
+    astr = ...
+    fxcl = ...
+    cgqd = ...
+    cgdb = ...
+    cgtr = ...
+    cxar = ...
+    cxac = ...
+    cxap = ...
+    cxam = ...
+    cxaq = ...
+    cxav = ...
+    cxaf = ...
+    cxan = ...
+    cxaw = ...
+    xcx2 = ...
+    cmec = ...
+    auto = ...
+    emib = ...
+    exor = ...
+    exvp = ...
+    exmp = ...
+    exlp = ...
+    exgm = ...
+    xeda = ...
+    xeid = ...
+    xadf = ...
+    finc = ...
+    fino = ...
+    xgdx = ...
+    xldx = ...
+    xgcx = ...
+    hmod = ...
+    wclk = ...
+    icah = ...
+    icse = ...
+    ictq = ...
+    iflx = ...
+    ifll = ...
+    ifen = ...
+    iflo = ...
+    imfx = ...
+    ifed = ...
+    vkab = ...
+    lafl = ...
+    lcur = ...
+    lmad = ...
+    lmnx = ...
+    mcxr = ...
+    mcxs = ...
+    eprl = ...
+    mprl = ...
+    mspl = ...
+    mstc = ...
+    nfsd = ...
+    xstm = ...
+    nfsa = ...
+    xqlx = ...
+    xstv = ...
+    tru2 = ...
+    tru1 = ...
+    bndd = ...
+    ubsc = ...
+    xeuc = ...
+    bera = ...
+    berb = ...
+    berc = ...
+    xmai = ...
+    bote = ...
+    eqwb = ...
+    vpxb = ...
+    tnlb = ...
+    xras = ...
+    fcme = ...
+    ximm = ...
+    dcse = ...
+    xcyo = ...
+    dusa = ...
+    dusb = ...
+    dusc = ...
+    dusd = ...
+    xetd = ...
+    xert = ...
+    xere = ...
+    xeum = ...
+    xdbc = ...
+    hama = ...
+    hamb = ...
+    hanb = ...
+    hana = ...
+    mnfi = ...
+    fnfi = ...
+    dnfi = ...
+    fnis = ...
+    mice = ...
+    icro = ...
+    xpms = ...
+    xfno = ...
+    xdsm = ...
+    xise = ...
+    gmni = ...
+    xtpz = ...
+    mcry = ...
+    xisa = ...
+    xtk1 = ...
+    xjas = ...
+    xtks = ...
+    xose = ...
+    xtam = ...
+    xtk3 = ...
+    xtk2 = ...
+    xbes = ...
+    xkon = ...
+    fnlt = ...
+    xljm = ...
+    mtah = ...
+    atfx = ...
+    cmts = ...
+    tmts = ...
+    lmts = ...
+    eacm = ...
+    bvuk = ...
+    nasd = ...
+    xnms = ...
+    inse = ...
+    aldp = ...
+    arcx = ...
+    xspm = ...
+    mtch = ...
+    xsc2 = ...
+    xsc3 = ...
+    xsc1 = ...
+    xscl = ...
+    xine = ...
+    xsec = ...
+    xssc = ...
+    dnse = ...
+    fnse = ...
+    csto = ...
+    mnse = ...
+    msto = ...
+    stub = ...
+    stua = ...
+    tpcd = ...
+    tbla = ...
+    tpfd = ...
+    tpsp = ...
+    rpwc = ...
+    tbsp = ...
+    tbsa = ...
+    bosp = ...
+    wetp = ...
+    exaa = ...
+    ieos = ...
+    icat = ...
+    pcds = ...
@@ -0,0 +1,157 @@
+"""Reloadable registries for long-running processes.
+
+:copyright: (c) 2024 Tanner Corcoran
+:license: Apache 2.0, see LICENSE for more details.
+
+"""
+
+__author__ = "Tanner Corcoran"
+__license__ = "Apache 2.0 License"
+__copyright__ = "Copyright (c) 2024 Tanner Corcoran"
+
+
+import os
+import pathlib
+import warnings
+import threading
+import concurrent.futures
+from typing import Union
+from collections.abc import Callable
+from os import PathLike
+
+from ._iso10383 import MICRegistry, load_csv, load_data, _REGISTRY
+
+
+_Source = Union[str, PathLike, bytes]
+
+
+def _load(source: _Source) -> MICRegistry:
+    # CSV files are recognized by their suffix, anything else is data
+    if (
+        not isinstance(source, bytes)
+        and pathlib.Path(source).suffix.lower() == ".csv"
+    ):
+        return load_csv(source)
+    return load_data(source)
+
+
+class ReloadableRegistry:
+    """A handle on a registry that can be replaced while it is in use.
+
+    `current` is an immutable `MICRegistry` snapshot. Readers should take
+    it once per unit of work (e.g. per message) and use it throughout,
+    which needs no locking. Reloads load and index the new data on the
+    calling (or a background) thread, and only then publish it with a
+    single assignment, so readers never see a partially built registry.
+
+    """
+    def __init__(
+        self,
+        registry: Union[MICRegistry, None] = None,
+        on_reload: Union[Callable[[MICRegistry], None], None] = None,
+    ) -> None:
+        self._current = registry if registry is not None else _REGISTRY
+        self._on_reload = on_reload
+        self._lock = threading.Lock()
+        self._executor: Union[concurrent.futures.Executor, None] = None
+        self._watcher: Union[threading.Thread, None] = None
+        self._stop = threading.Event()
+
+    @property
+    def current(self) -> MICRegistry:
+        """The latest published registry."""
+        return self._current
+
+    def publish(self, registry: MICRegistry) -> None:
+        """Build the indexes of `registry` and make it `current`."""
+        registry.build_indexes()
+        with self._lock:
+            self._current = registry
+        if self._on_reload is not None:
+            self._on_reload(registry)
+
+    def reload(self, source: _Source) -> MICRegistry:
+        """Load `source` (the path of a CSV file, or the path or contents
+        of a data file) and publish it, returning the new registry.
+
+        """
+        registry = _load(source)
+        self.publish(registry)
+        return registry
+
+    def reload_async(
+        self, source: _Source
+    ) -> concurrent.futures.Future[MICRegistry]:
+        """Like `reload`, but on a background thread. Reloads are run one
+        at a time (along with those of `watch`), in the order they were
+        requested.
+
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="iso10383-reload"
+                )
+            executor = self._executor
+        return executor.submit(self.reload, source)
+
+    def watch(
+        self, path: Union[str, PathLike], interval: float = 5.0
+    ) -> None:
+        """Poll the modification time (and size) of `path` every
+        `interval` seconds on a daemon thread, reloading from it once it
+        has changed and then stayed the same for a whole interval, so that
+        files still being written are left alone. Reloads are queued behind
+        those of `reload_async`. Failed reloads are reported as warnings,
+        and the current registry is kept.
+
+        Data files are checked against their digest, but CSV files have
+        none, so a CSV file that is rewritten in place and stalls for a
+        whole interval may be reloaded with rows missing. Replace watched
+        files atomically (e.g. write a temporary file, then `os.replace`
+        it) where possible.
+
+        """
+        if self._watcher is not None:
+            raise RuntimeError("already watching a file")
+
+        path = os.fspath(path)
+
+        def stamp() -> Union[tuple[int, int], None]:
+            try:
+                st = os.stat(path)
+            except OSError:
+                return None
+            return (st.st_mtime_ns, st.st_size)
+
+        def poll(last: Union[tuple[int, int], None]) -> None:
+            # `last` is the stamp of the last reload, `seen` that of the
+            # previous poll
+            seen = last
+            while not self._stop.wait(interval):
+                now = stamp()
+                settled = now == seen
+                seen = now
+                if now is None or now == last or not settled:
+                    continue
+                last = now
+                try:
+                    self.reload_async(path).result()
+                except Exception as e:
+                    warnings.warn(f"Failed to reload {path!r}: {e}")
+
+        self._stop.clear()
+        self._watcher = threading.Thread(
+            target=poll, args=(stamp(),), name="iso10383-watch", daemon=True
+        )
+        self._watcher.start()
+
+    def close(self) -> None:
+        """Stop watching and wait for pending reloads to finish."""
+        self._stop.set()
+        if self._watcher is not None:
+            self._watcher.join()
+            self._watcher = None
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
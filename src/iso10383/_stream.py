@@ -0,0 +1,201 @@
+"""Streaming helpers for validating and enriching large record sets.
+
+:copyright: (c) 2024 Tanner Corcoran
+:license: Apache 2.0, see LICENSE for more details.
+
+"""
+
+__author__ = "Tanner Corcoran"
+__license__ = "Apache 2.0 License"
+__copyright__ = "Copyright (c) 2024 Tanner Corcoran"
+
+
+import csv
+import datetime
+import functools
+import dataclasses
+from typing import Any, Union
+from collections.abc import Hashable, Iterable, Iterator, Mapping, Sequence
+from os import PathLike
+
+from ._iso10383 import MIC, MICEntry, _is_expired
+
+
+@functools.lru_cache(maxsize=None)
+def _codes() -> dict[str, MICEntry]:
+    return {member.value.mic: member.value for member in MIC}
+
+
+@functools.lru_cache(maxsize=None)
+def _projections(attrs: tuple[str, ...]) -> dict[Hashable, tuple[Any, ...]]:
+    projections: dict[Hashable, tuple[Any, ...]] = dict()
+    for entry in _codes().values():
+        projection = tuple(
+            (entry.operating_mic or entry).mic if attr == "operating_mic"
+            else getattr(entry, attr)
+            for attr in attrs
+        )
+        for key in (entry.mic, entry.mic.lower()):
+            projections[key] = projection
+            projections[key.encode("ascii")] = projection
+    return projections
+
+
+def _normalize(value: Union[str, bytes, bytearray, memoryview]) -> str:
+    # `value` as an upper case, stripped code
+    if not isinstance(value, str):
+        value = bytes(value).decode("ascii", "replace")
+    return value.strip().upper()
+
+
+@dataclasses.dataclass
+class ValidationReport:
+    """Summary statistics of a MIC column validation.
+
+    `counts` holds the number of rows per known MIC, `unknown` maps codes
+    that are not MICs to the first line they were seen on, and `expired`
+    holds the number of rows per MIC that is no longer active (either by
+    `Status` or by `expiry_date`).
+
+    """
+    rows: int = 0
+    missing: int = 0
+    counts: dict[str, int] = dataclasses.field(default_factory=dict)
+    unknown: dict[str, int] = dataclasses.field(default_factory=dict)
+    expired: dict[str, int] = dataclasses.field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return not (self.missing or self.unknown or self.expired)
+
+
+def _validate(
+    lines: Iterable[tuple[int, Union[str, bytes, None]]],
+    as_of: Union[datetime.date, None],
+) -> ValidationReport:
+    codes = _codes()
+    report = ValidationReport()
+    counts = report.counts
+    unknown = report.unknown
+    rows = missing = 0
+
+    for line, value in lines:
+        rows += 1
+        if not value:
+            missing += 1
+            continue
+        value = _normalize(value)
+        if value in codes:
+            counts[value] = counts.get(value, 0) + 1
+        elif value not in unknown:
+            unknown[value] = line
+
+    report.rows = rows
+    report.missing = missing
+    as_of = as_of or datetime.date.today()
+    report.expired = {
+        code: count for code, count in counts.items()
+        if _is_expired(codes[code], as_of)
+    }
+    return report
+
+
+def validate(
+    values: Iterable[Union[str, bytes, None]],
+    *,
+    as_of: Union[datetime.date, None] = None,
+    start: int = 1,
+) -> ValidationReport:
+    """Validate a stream of MIC codes, consuming it lazily so that memory
+    use stays constant regardless of its length. Line numbers are counted
+    from `start`. MICs that expire on or before `as_of` (defaults to today)
+    are reported as expired.
+
+    """
+    return _validate(enumerate(values, start), as_of)
+
+
+def validate_csv(
+    path: Union[str, PathLike],
+    column: Union[str, int],
+    *,
+    as_of: Union[datetime.date, None] = None,
+    encoding: str = "utf-8",
+    **fmtparams: Any,
+) -> ValidationReport:
+    """Validate the MIC column `column` (a header name or index) of the CSV
+    file at `path`, reading it one row at a time. Line numbers refer to
+    the physical lines of the file. Extra keyword arguments are passed to
+    `csv.reader`.
+
+    """
+    with open(path, "r", encoding=encoding, newline="") as infile:
+        reader = csv.reader(infile, **fmtparams)
+        if isinstance(column, str):
+            column = next(reader).index(column)
+
+        return _validate(
+            (
+                (reader.line_num, row[column] if len(row) > column else None)
+                for row in reader
+            ),
+            as_of,
+        )
+
+
+ENRICH_FIELDS = (
+    "iso_country_code",
+    "market_category_code",
+    "operating_mic",
+    "legal_entity_identifier",
+    "acronym",
+)
+
+
+def enrich(
+    records: Iterable[Union[Mapping[Any, Any], Sequence[Any]]],
+    field: Any,
+    fields: Union[Sequence[str], Mapping[Any, str]] = ENRICH_FIELDS,
+    *,
+    default: Any = None,
+) -> Iterator[Union[dict[Any, Any], tuple[Any, ...]]]:
+    """Lazily append `MICEntry` attributes to each record of `records`,
+    using the MIC stored under `field` (a key for mappings, an index for
+    sequences).
+
+    `fields` is either a sequence of attribute names, or a mapping of
+    output keys to attribute names. Mapping records are yielded as new
+    dicts with the extra keys, sequence records as tuples with the extra
+    values appended. `operating_mic` is projected to the code of the
+    operating MIC (which is the MIC itself for operating MICs), and
+    unknown MICs get `default` for every field. MICs are matched like
+    `validate` matches them: as `str` or bytes-like values, ignoring case
+    and surrounding whitespace.
+
+    """
+    if isinstance(fields, Mapping):
+        names, attrs = tuple(fields), tuple(fields.values())
+    else:
+        names = attrs = tuple(fields)
+
+    get = _projections(attrs).get
+    missing = (default,) * len(attrs)
+
+    for record in records:
+        value = record[field]
+        try:
+            projection = get(value)
+        except TypeError:
+            # unhashable, e.g. bytearray or memoryview
+            projection = None
+        if projection is None:
+            if isinstance(value, (str, bytes, bytearray, memoryview)):
+                projection = get(_normalize(value), missing)
+            else:
+                projection = missing
+        if isinstance(record, Mapping):
+            out = dict(record)
+            out.update(zip(names, projection))
+            yield out
+        else:
+            yield tuple(record) + projection